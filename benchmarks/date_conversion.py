@@ -0,0 +1,72 @@
+"""
+Checks that the array date conversions in get_data.py agree exactly with the scalar versions
+and times both on the loader inputs. The sweeps are only checked. Run from the repository root:
+
+    python benchmarks/date_conversion.py
+"""
+import sys
+import time
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from get_data import (
+    integer_to_datetime,
+    fractional_year_to_datetime,
+    integer_to_datetime_array,
+    fractional_year_to_datetime_array,
+    ICE_SHEET_BACKUP,
+    SEA_LEVEL_BACKUP,
+    OHC_300_PATH,
+    OHC_700_PATH,
+    OHC_2000_PATH,
+    OHC_700_2000_PATH
+)
+
+REPEATS = 3
+
+def check(name, values, scalar, array, timed=True):
+    start = time.perf_counter()
+    expected = pd.Series(values).apply(scalar).to_numpy(dtype='datetime64[ns]')
+    scalar_time = time.perf_counter() - start
+    result = array(values)
+    mismatches = np.count_nonzero(result != expected)
+    line = f'{name:<24} {len(values):>7} values  mismatches: {mismatches}'
+    if timed:
+        # the scalar conversion takes seconds on the larger inputs, a single run is enough to compare
+        array_time = min(timeit.repeat(lambda: array(values), number=1, repeat=REPEATS))
+        line += f'  scalar: {scalar_time * 1000:8.2f} ms  array: {array_time * 1000:6.2f} ms'
+    print(line)
+    return mismatches
+
+def main():
+    fractional_inputs = {
+        'ice sheets': pd.read_csv(ICE_SHEET_BACKUP, skiprows=6)['Year'].to_numpy(),
+        'satellite sea level': pd.read_csv(SEA_LEVEL_BACKUP)['Time (years)'].to_numpy(),
+        # every ~0.9 day from 1850 to 2150, crossing leap years and century years
+        'fractional sweep': np.arange(1850, 2150, 0.00247),
+    }
+    integer_inputs = {
+        'ocean heat content': np.concatenate([pd.read_csv(path).time.to_numpy()
+            for path in [OHC_300_PATH, OHC_700_PATH, OHC_2000_PATH, OHC_700_2000_PATH]]),
+        # every valid day of every month 1900-2100, months are zero based
+        'integer sweep': np.array([year * 10000 + month * 100 + day for year in range(1900, 2101)
+            for month in range(12) for day in range(1, pd.Period(f'{year}-{month + 1}').days_in_month + 1)]),
+    }
+
+    mismatches = 0
+    for name, values in fractional_inputs.items():
+        mismatches += check(name, values, fractional_year_to_datetime, fractional_year_to_datetime_array,
+            timed='sweep' not in name)
+    for name, values in integer_inputs.items():
+        mismatches += check(name, values, integer_to_datetime, integer_to_datetime_array, timed='sweep' not in name)
+
+    if mismatches:
+        sys.exit(f'{mismatches} dates differ from the scalar conversion')
+    print('all array conversions agree exactly with the scalar versions')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Times every get_* loader in get_data.py cold (caches cleared, network requests failing so the bundled backup
+files are read) and warm (a cache hit), with the peak memory of a cold run and the shape of the result.
+Results are printed as a table and written as JSON, tagged with the current commit, so runs on different
+commits can be compared. Run from the repository root:
+
+    python benchmarks/loaders.py [--output results.json] [--repeats 3] [loader ...]
+
+By default the results go to benchmarks/results/loaders-<commit>.json.
+"""
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tracemalloc
+import urllib.request
+from pathlib import Path
+from datetime import datetime, timezone
+
+import requests
+import streamlit as st
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+import get_data
+
+WARM_REPEATS = 20
+
+def offline_get(*args, **kwargs):
+    # every download fails, read_csv_from_url falls back to the backup file
+    raise requests.ConnectionError('network disabled for the benchmark')
+
+def offline_urlopen(*args, **kwargs):
+    # pd.read_csv on a url, used by loaders without a backup file
+    raise urllib.error.URLError('network disabled for the benchmark')
+
+def shape(result):
+    # rows and columns of a frame, recursively for the tuples and dicts some loaders return
+    if hasattr(result, 'shape'):
+        return list(result.shape)
+    if isinstance(result, (tuple, list)):
+        return [shape(item) for item in result]
+    if isinstance(result, dict):
+        # the per-country dicts hold hundreds of small frames, their count and total size are enough
+        shapes = [shape(value) for value in result.values()]
+        return {'entries': len(shapes), 'rows': sum(item[0] for item in shapes if isinstance(item, list) and item),
+            'columns': shapes[0][1] if shapes and isinstance(shapes[0], list) and len(shapes[0]) > 1 else None}
+    return None
+
+def cold_run(loader):
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    start = time.perf_counter()
+    result = loader()
+    return time.perf_counter() - start, result
+
+def benchmark(name, loader, repeats):
+    record = {'loader': name, 'cached': hasattr(loader, 'clear')}
+    try:
+        cold = []
+        for _ in range(repeats):
+            seconds, result = cold_run(loader)
+            cold.append(seconds)
+        record['cold_seconds'] = min(cold)
+        record['shape'] = shape(result)
+
+        warm = []
+        for _ in range(WARM_REPEATS):
+            start = time.perf_counter()
+            loader()
+            warm.append(time.perf_counter() - start)
+        record['warm_seconds'] = min(warm)
+
+        # tracing slows the loader down, so the peak is taken from a separate cold run
+        tracemalloc.start()
+        try:
+            cold_run(loader)
+            record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    except Exception as error:
+        record['error'] = f'{type(error).__name__}: {error}'
+    return record
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True,
+            check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('loaders', nargs='*', help='loader names, all get_* loaders by default')
+    parser.add_argument('--output', type=Path, help='JSON file for the results')
+    parser.add_argument('--repeats', type=int, default=3, help='cold runs per loader, the fastest is reported')
+    args = parser.parse_args()
+
+    loaders = {name: loader for name, loader in vars(get_data).items()
+        if name.startswith('get_') and callable(loader) and getattr(loader, '__module__', None) == 'get_data'}
+    names = args.loaders or list(loaders)
+    unknown = [name for name in names if name not in loaders]
+    if unknown:
+        parser.error(f'unknown loaders: {", ".join(unknown)}')
+
+    get_data.requests.get = offline_get
+    urllib.request.urlopen = offline_urlopen
+    results = []
+    print(f'{"loader":<32} {"cold ms":>9} {"warm ms":>9} {"peak MB":>8}  shape')
+    for name in names:
+        record = benchmark(name, loaders[name], args.repeats)
+        results.append(record)
+        if 'error' in record:
+            print(f'{name:<32} {record["error"][:80]}')
+        else:
+            print(f'{name:<32} {record["cold_seconds"] * 1000:>9.1f} {record["warm_seconds"] * 1000:>9.2f} '
+                f'{record["peak_bytes"] / 1e6:>8.1f}  {record["shape"]}')
+
+    commit = current_commit()
+    output = args.output or ROOT / 'benchmarks' / 'results' / f'loaders-{commit or "unknown"}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'results': results
+    }, indent=2))
+    print(f'written to {output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Renders Home.py and every page headlessly with streamlit's AppTest against the bundled backup files (the
+network is disabled as in benchmarks/loaders.py). Times the first run with empty caches, a warm rerun and the
+rerun after every widget interaction: each option of every selectbox and radio, and each slider narrowed to the
+middle half of its range. AppTest reruns the whole page on an interaction, fragments included. Counts the
+plotly charts and images each run emits. Run from the repository root:
+
+    python benchmarks/page_renders.py [--output results.json] [page ...]
+
+By default the results go to benchmarks/results/pages-<commit>.json.
+"""
+import sys
+import json
+import time
+import argparse
+import urllib.request
+from pathlib import Path
+from datetime import datetime, timezone
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+import get_data
+from loaders import offline_get, offline_urlopen, current_commit
+
+TIMEOUT = 600
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    return {
+        'seconds': time.perf_counter() - start,
+        'plotly': len(at.get('plotly_chart')),
+        'images': len(at.get('imgs')),
+        'exceptions': [exception.value.splitlines()[0] for exception in at.exception]
+    }
+
+def middle_half(slider):
+    # a narrower range (or value) inside the slider bounds, AppTest gives the bounds as floats even for int sliders
+    value = slider.value
+    whole = isinstance(value[0] if isinstance(value, tuple) else value, int)
+    low, high = slider.min, slider.max
+    quarter = (high - low) / 4
+    if whole:
+        low, quarter = int(low), int(quarter)
+    if isinstance(value, tuple):
+        return (low + quarter, low + 3 * quarter)
+    return low + 2 * quarter
+
+def interactions(at):
+    # every option of every selectbox and radio and one narrowed range per slider, widgets are looked up again
+    # after each run because the previous element objects belong to the old run
+    for kind in ['selectbox', 'radio']:
+        for i in range(len(getattr(at, kind))):
+            for option in getattr(at, kind)[i].options:
+                widget = getattr(at, kind)[i]
+                widget.set_value(option)
+                yield f'{kind} {i} {widget.label!r}', option
+    for i in range(len(at.slider)):
+        value = middle_half(at.slider[i])
+        at.slider[i].set_value(value)
+        yield f'slider {i} {at.slider[i].label!r}', value
+
+def benchmark(page):
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    at = AppTest.from_file(str(ROOT / page), default_timeout=TIMEOUT)
+    record = {'page': page, 'first_run': timed_run(at), 'rerun': timed_run(at), 'interactions': []}
+    print(f'{page:<22} first {record["first_run"]["seconds"]:7.2f} s  rerun {record["rerun"]["seconds"]:6.2f} s  '
+        f'plotly {record["rerun"]["plotly"]}  images {record["rerun"]["images"]}  {record["rerun"]["exceptions"]}')
+    for widget, value in interactions(at):
+        result = dict(widget=widget, value=str(value), **timed_run(at))
+        record['interactions'].append(result)
+        print(f'    {widget[:50]:<50} = {str(value)[:30]:<30} {result["seconds"]:6.2f} s  plotly {result["plotly"]}  '
+            f'images {result["images"]}  {result["exceptions"]}')
+    return record
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('pages', nargs='*', help='page scripts relative to the repository root, all pages by default')
+    parser.add_argument('--output', type=Path, help='JSON file for the results')
+    args = parser.parse_args()
+    pages = args.pages or ['Home.py'] + [f'pages/{path.name}' for path in sorted((ROOT / 'pages').glob('*.py'))]
+
+    get_data.requests.get = offline_get
+    urllib.request.urlopen = offline_urlopen
+    results = [benchmark(page) for page in pages]
+
+    commit = current_commit()
+    output = args.output or ROOT / 'benchmarks' / 'results' / f'pages-{commit or "unknown"}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'results': results
+    }, indent=2))
+    print(f'written to {output}')
+
+if __name__ == '__main__':
+    main()
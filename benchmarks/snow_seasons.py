@@ -0,0 +1,84 @@
+"""
+Compares get_snow_data with the previous implementation, which parsed the dates with pd.to_datetime, filled the
+missing months with a 'MS' date_range and assigned the seasons row by row, on the Rutgers snow cover record.
+Run from the repository root:
+
+    python benchmarks/snow_seasons.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import get_data
+
+REPEATS = 20
+
+def get_season(date):
+    # previous implementation, applied to every month
+    year = date.year
+    if date.month in [12,1,2]:
+        season = 'Winter'
+        if date.month in [1,2]:
+            year -= 1
+    elif date.month in [3,4,5]:
+        season = 'Spring'
+    elif date.month in [6,7,8]:
+        season = 'Summer'
+    elif date.month in [9,10,11]:
+        season = 'Autumn'
+    return f'{season} {year}'
+
+def get_snow_data_apply(df):
+    # previous get_snow_data after reading the file
+    df.month = pd.to_numeric(df.month)
+    df['day'] = 1
+    df['date'] = pd.to_datetime(df[['year','month','day']])
+    df = df.set_index('date')
+    min_date = df.index.min()
+    max_date = df.index.max()
+    full_date_range = pd.date_range(start=min_date.to_period('M').start_time,
+                                    end=max_date.to_period('M').end_time,
+                                    freq='MS')
+    df = df.reindex(full_date_range)
+    df = df.reset_index()
+
+    df['season_year'] = df['index'].apply(get_season)
+    df[['season','s_year']] = df['season_year'].str.split(' ', expand=True)
+    df.s_year = pd.to_numeric(df.s_year)
+    df_seasons = df.groupby(['s_year','season'])['value'].mean()
+
+    df_seasons_count = df[~df.value.isna()].groupby(['s_year','season']).size()
+    missing_season_idx = df_seasons_count[df_seasons_count != 3].index
+    df_seasons.loc[missing_season_idx] = float("NaN")
+    df_seasons = df_seasons.reset_index()
+
+    df_years = df.groupby(['year'])['value'].mean()
+
+    df_month_count = df[~df.value.isna()].groupby(['year']).size()
+    missing_month_idx = df_month_count[df_month_count != 12].index
+    df_years.loc[missing_month_idx] = float("NaN")
+    return df_seasons, df_years
+
+def main():
+    raw = pd.read_csv(get_data.SNOW_BACKUP, sep=r'\s+', names=['year','month','value'])
+
+    # time the aggregation only, the record is read from the local copy instead of the network
+    get_data.read_csv_from_url = lambda csv_url, backup, **kwargs: raw.copy()
+    get_snow_data_vectorized = get_data.get_snow_data.__wrapped__
+
+    old_seasons, old_years = get_snow_data_apply(raw.copy())
+    new_seasons, new_years = get_snow_data_vectorized()
+    pd.testing.assert_frame_equal(old_seasons, new_seasons)
+    pd.testing.assert_series_equal(old_years, new_years)
+
+    old_time = min(timeit.repeat(lambda: get_snow_data_apply(raw.copy()), number=1, repeat=REPEATS))
+    new_time = min(timeit.repeat(get_snow_data_vectorized, number=1, repeat=REPEATS))
+    print(f'rows: {len(raw)}, seasons: {len(new_seasons)}, years: {len(new_years)} (results identical)')
+    print(f'apply + str.split: {old_time * 1000:.1f} ms')
+    print(f'vectorized:        {new_time * 1000:.1f} ms ({old_time / new_time:.1f}x faster)')
+
+if __name__ == '__main__':
+    main()
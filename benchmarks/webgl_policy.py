@@ -0,0 +1,78 @@
+"""
+Compares the pages drawing dense lines with WebGL (plotting.line_trace) against the same pages with every line
+drawn as SVG, with the network disabled as in benchmarks/loaders.py. Reports per page the plotly payload, the
+number of WebGL traces, the server render time of a warm run and the charts drawn in a different order than in
+SVG: WebGL traces are always drawn above SVG ones, so an SVG trace (e.g. an uncertainty band) added after a WebGL
+line ends up below it instead of above it. Browser render time needs a real browser and is not measured here.
+Run from the repository root:
+
+    python benchmarks/webgl_policy.py [page ...]
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from streamlit.testing.v1 import AppTest
+import get_data
+import plotting
+from loaders import offline_get, offline_urlopen
+
+REPEATS = 5
+
+def line_trace_pages():
+    # every page drawing lines with plotting.line_trace
+    return [f'pages/{path.name}' for path in sorted((ROOT / 'pages').glob('*.py')) if 'line_trace(' in path.read_text()]
+
+def reordered(spec):
+    # an SVG trace after a WebGL one is drawn below it, unlike the trace order says
+    types = [trace.get('type', 'scatter') == 'scattergl' for trace in spec['data']]
+    return any(not webgl for webgl in types[types.index(True):]) if True in types else False
+
+def measure(page):
+    at = AppTest.from_file(str(ROOT / page), default_timeout=300)
+    # the first run fills the data caches
+    at.run()
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    specs = [json.loads(chart.proto.spec) for chart in at.get('plotly_chart')]
+    return {
+        'charts': len(specs),
+        'payload': sum(len(chart.proto.spec) for chart in at.get('plotly_chart')),
+        'webgl': sum(trace.get('type') == 'scattergl' for spec in specs for trace in spec['data']),
+        'reordered': [spec['layout'].get('title', {}).get('text', '')[:40] for spec in specs if reordered(spec)],
+        'seconds': statistics.median(times),
+        'exceptions': [exception.value.splitlines()[0] for exception in at.exception]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('pages', nargs='*', help='page scripts relative to the repository root, by default every '
+        'page using line_trace')
+    args = parser.parse_args()
+
+    get_data.requests.get = offline_get
+    urllib.request.urlopen = offline_urlopen
+    default_threshold = plotting.WEBGL_MIN_POINTS
+    print(f'{"page":<16} {"lines":<6} {"charts":>6} {"payload":>10} {"webgl traces":>13} {"server ms":>10}  '
+        'reordered charts')
+    for page in args.pages or line_trace_pages():
+        for label, threshold in [('svg', float('inf')), ('webgl', default_threshold)]:
+            plotting.WEBGL_MIN_POINTS = threshold
+            result = measure(page)
+            print(f'{page:<16} {label:<6} {result["charts"]:>6} {result["payload"]:>10,} {result["webgl"]:>13} '
+                f'{result["seconds"] * 1000:>10.1f}  {result["reordered"] or ""}')
+            if result['exceptions']:
+                print(f'    exceptions: {result["exceptions"]}')
+    plotting.WEBGL_MIN_POINTS = default_threshold
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Rebuilds data/coastline/coastline_110m_admin0 from the Natural Earth 110m admin-0 countries layer (public domain):
+the country polygons are dissolved into land masses and the boundary rings of the land are written as lines. This is
+not the official ne_110m_coastline layer, which could not be downloaded when the file was made. The shipped file was
+built from the naturalearth_lowres copy of the layer bundled with geopandas 0.14.4
+(geopandas/datasets/naturalearth_lowres/naturalearth_lowres.shp), ne_110m_admin_0_countries.shp from
+https://www.naturalearthdata.com/downloads/110m-cultural-vectors/ works the same. Uses shapely and pyshp, both
+installed with cartopy. Run from the repository root:
+
+    python data/coastline/make_coastline.py path/to/admin0_countries.shp
+"""
+import shutil
+import argparse
+from pathlib import Path
+
+import shapefile
+from shapely.geometry import shape
+from shapely.ops import unary_union
+
+OUTPUT = Path("data/coastline/coastline_110m_admin0")
+SOURCE = 'Natural Earth 110m admin-0 countries, dissolved land boundary'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('countries', type=Path, help='admin-0 countries shapefile')
+    args = parser.parse_args()
+
+    reader = shapefile.Reader(args.countries)
+    # buffer(0) repairs the few self touching country polygons before they are dissolved
+    land = unary_union([shape(country).buffer(0) for country in reader.shapes()])
+    rings = land.boundary.geoms
+    with shapefile.Writer(OUTPUT, shapeType=shapefile.POLYLINE) as writer:
+        writer.field('source', 'C', 64)
+        for ring in rings:
+            writer.line([[list(map(float, point)) for point in ring.coords]])
+            writer.record(SOURCE)
+    # same coordinate system and encoding as the countries layer
+    for suffix in ['.prj', '.cpg']:
+        shutil.copy(args.countries.with_suffix(suffix), OUTPUT.with_suffix(suffix))
+    print(f'{len(rings)} rings written to {OUTPUT}.shp')
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,8 @@ from pathlib import Path
 import numpy as np
 from datetime import datetime
 import json
+from statistics import NormalDist
+from monitoring import timed_loaders
 
 CFB_PATH = Path("data/cmip56_feedbacks_AR6.json")
 OHC_300_PATH = Path("data/global_ohc300m_2024.csv")
@@ -65,6 +67,10 @@ ELECTRICITY_SOURCE_PATH = Path("data/electricity-production-by-source.csv")
 SECTOR_CONSUMPTION_PATH = Path("data/International Energy Agency - total final consumption in World.csv")
 ENERGY_PER_PERSON_PATH = Path("data/energy_use_by_source_per_person.csv")
 LEVELIZED_COST_PATH = Path("data/Lazard.csv")
+POPULATION_PATH = Path("data/population.csv")
+
+# season names indexed by the season code (month % 12) // 3
+SEASONS = np.array(['Winter', 'Spring', 'Summer', 'Autumn'])
 
 def integer_to_datetime(int_date):
     year, remainder = divmod(int_date, 10000)
@@ -78,28 +84,61 @@ def fractional_year_to_datetime(year_float):
     base_date = pd.to_datetime(f'{year}-01-01')
     return base_date + pd.DateOffset(days=days)
 
-def read_csv_from_url(csv_url, backup, timeout = 3, **kwargs):
+def integer_to_datetime_array(int_dates):
+    # same as integer_to_datetime for a whole array at once, returns datetime64[ns]
+    year, remainder = np.divmod(np.asarray(int_dates, dtype='int64'), 10000)
+    month, day = np.divmod(remainder, 100)
+    months = ((year - 1970) * 12 + month).astype('datetime64[M]')
+    return (months.astype('datetime64[D]') + (day - 1)).astype('datetime64[ns]')
+
+def fractional_year_to_datetime_array(years):
+    # same as fractional_year_to_datetime for a whole array at once, returns datetime64[ns]
+    years = np.asarray(years, dtype='float64')
+    year = np.trunc(years)
+    days = ((years - year) * 365.25).astype('int64')
+    base_date = (year.astype('int64') - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    return (base_date + days).astype('datetime64[ns]')
+
+def interpolate_and_smooth(df, group, columns, window, prefix='ma_'):
+    # interpolate gaps and add a moving average of every column, separately for each group, in one pass
+    # the rows of each group must already be in time order
+    grouped = df.groupby(group, sort=False)[columns]
+    df[columns] = grouped.transform(lambda block: block.interpolate())
+    smoothed = df.groupby(group, sort=False)[columns].rolling(window=window).mean().reset_index(level=0, drop=True)
+    for column in columns:
+        df[prefix + column] = smoothed[column]
+    return df
+
+def insert_gap_breaks(df, column='Year', max_gap=5000, offset=1000):
+    # insert a NaN row after every jump in column larger than max_gap so plotted lines break over sparse stretches
+    # the break row sits offset after the point before the jump, the rows must be sorted and all columns numeric
+    values = df[column].to_numpy(dtype=float)
+    positions = np.flatnonzero(np.diff(values) > max_gap) + 1
+    columns = {name: np.insert(df[name].to_numpy(dtype=float), positions, np.nan) for name in df.columns}
+    columns[column] = np.insert(values, positions, values[positions - 1] + offset)
+    return pd.DataFrame(columns)
+
+def recode(series, rules):
+    # apply regex replacement rules in order to the distinct values only and map the result back to every row
+    values = series.astype('category')
+    recoded = pd.Series(values.cat.categories)
+    for pattern, replacement in rules:
+        recoded = recoded.replace(pattern, replacement, regex=True)
+    return pd.Series(recoded.to_numpy().take(values.cat.codes.to_numpy(), mode='clip'), index=series.index).where(values.notna())
+
+def split_by_entity(df, columns):
+    # one contiguous frame of the given columns per Entity sorted by Year, entities in order of first appearance
+    return {entity: group[columns].sort_values(by='Year').reset_index(drop=True) \
+        for entity, group in df.groupby('Entity', sort=False)}
+
+def read_csv_from_url(csv_url, backup, timeout = 3, backup_kwargs = None, **kwargs):
+    # backup_kwargs replace kwargs for a backup file saved in a different format than the url serves
     try:
         response = requests.get(csv_url, timeout = timeout)
         response.raise_for_status() # Raise an exception for bad status codes
         return pd.read_csv(StringIO(response.text), **kwargs)
     except:
-        return pd.read_csv(backup, **kwargs)
-
-def get_season(date):
-    # returns string with the season and correct year
-    year = date.year
-    if date.month in [12,1,2]:
-        season = 'Winter'
-        if date.month in [1,2]:
-            year -= 1
-    elif date.month in [3,4,5]:
-        season = 'Spring'
-    elif date.month in [6,7,8]:
-        season = 'Summer'
-    elif date.month in [9,10,11]:
-        season = 'Autumn'
-    return f'{season} {year}'
+        return pd.read_csv(backup, **(kwargs if backup_kwargs is None else backup_kwargs))
 
 @st.cache_data()
 def get_energy_per_cap_data():
@@ -108,6 +147,11 @@ def get_energy_per_cap_data():
 
     return df
 
+@st.cache_data()
+def get_energy_per_cap_by_country():
+    df = get_energy_per_cap_data()
+    return split_by_entity(df, [c for c in df.columns if c != 'Entity'])
+
 @st.cache_data()
 def get_levelized_cost_data():
     df = pd.read_csv(LEVELIZED_COST_PATH, decimal='.')
@@ -160,6 +204,50 @@ def get_per_capita_ghg_data():
     df = pd.read_csv(GHG_PER_CAPITA_PATH, names=['Entity','Code','Year','ghg'], skiprows=1)
     return df
 
+@st.cache_data()
+def get_population_data():
+    df = pd.read_csv(POPULATION_PATH, names=['Entity','Code','Year','population'], skiprows=1)
+    return df
+
+@st.cache_data()
+def get_country_ghg_aggregates(year=2023):
+    # country totals for the choropleths, one row per country and one column per map
+    df = get_historic_ghg_data()
+    df = df[(~df.Code.isnull()) & (df.Entity != 'World')]
+    df = df.assign(total=df[['co2','ch4','n2o']].sum(axis=1))
+
+    df_aggregates = pd.DataFrame({
+        'cumulative' : df.groupby(['Entity','Code'])['total'].sum(),
+        'latest' : df[df.Year == year].set_index(['Entity','Code'])['total']
+        })
+    population = get_population_data()
+    population = population[population.Year == year].set_index(['Entity','Code'])['population']
+    population = population.reindex(df_aggregates.index)
+    df_aggregates['latest_per_capita'] = df_aggregates['latest'] / population
+    return df_aggregates.reset_index()
+
+@st.cache_data()
+def get_country_ghg_by_year():
+    # the same columns as get_country_ghg_aggregates for every year, latest being the total of that year
+    df = get_historic_ghg_data()
+    df = df[(~df.Code.isnull()) & (df.Entity != 'World')].sort_values(['Entity','Year'])
+    df = df.assign(latest=df[['co2','ch4','n2o']].sum(axis=1))
+    df['cumulative'] = df.groupby('Entity')['latest'].cumsum()
+    df = df[['Entity','Code','Year','cumulative','latest']].merge(get_population_data(), on=['Entity','Code','Year'],
+        how='left')
+    df['latest_per_capita'] = df['latest'] / df['population']
+    return df.drop(columns=['population'])
+
+@st.cache_data()
+def get_historic_ghg_by_country():
+    df = get_historic_ghg_data()
+    df['total_emissions_co2eq'] = df[['co2','ch4','n2o']].sum(axis=1)
+    return split_by_entity(df, ['Year', 'total_emissions_co2eq'])
+
+@st.cache_data()
+def get_per_capita_ghg_by_country():
+    return split_by_entity(get_per_capita_ghg_data(), ['Year', 'ghg'])
+
 @st.cache_data()
 def get_ghg_sector_data():
     df = pd.read_excel(GHG_BY_SECTOR_PATH, sheet_name='IPCC 2006', skiprows=9)
@@ -189,37 +277,33 @@ def get_ghg_sector_data():
         'USA' : 'North America',
         'Turkey' : 'Europe'
         })
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'1\.A\.1.*', 'Energy systems', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'1\.A\.2.*', 'Industry', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'1\.A\.3.*', 'Transport', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'1\.A\.4.*', 'Buildings', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'1\.A\.5.*', 'Energy systems', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'1\.B.*', 'Transport', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'2.+', 'Industry', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'3.+', 'AFOLU', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'4.+', 'Waste', regex=True)
-    df['ipcc_code_2006_for_standard_report'] = \
-        df['ipcc_code_2006_for_standard_report'].replace(r'5.+', 'Waste', regex=True)
+    # IPCC codes to sectors, the rules are applied in order and later rules see the result of earlier ones
+    df['ipcc_code_2006_for_standard_report'] = recode(df['ipcc_code_2006_for_standard_report'], [
+        (r'1\.A\.1.*', 'Energy systems'),
+        (r'1\.A\.2.*', 'Industry'),
+        (r'1\.A\.3.*', 'Transport'),
+        (r'1\.A\.4.*', 'Buildings'),
+        (r'1\.A\.5.*', 'Energy systems'),
+        (r'1\.B.*', 'Transport'),
+        (r'2.+', 'Industry'),
+        (r'3.+', 'AFOLU'),
+        (r'4.+', 'Waste'),
+        (r'5.+', 'Waste')
+        ])
 
     df = df.drop(columns = ['IPCC_annex','Country_code_A3','Name','ipcc_code_2006_for_standard_report_name','Substance',
-        'fossil_bio'])   
-    df_long = pd.melt(df,
-                  id_vars=['C_group_IM24_sh', 'ipcc_code_2006_for_standard_report'],  # Columns to keep as identifiers
-                  var_name='Year',       # Name for the new column holding the original column names
-                  value_name='Emissions')
-    df_long['Year'] = pd.to_numeric(df_long['Year'].str.replace('Y_', ''))
-    df_long = df_long.rename(columns = {'C_group_IM24_sh' : 'Region', 'ipcc_code_2006_for_standard_report' : 'Sector'})
-    df_long = df_long.groupby(['Region', 'Sector', 'Year'], as_index=False)['Emissions'].sum()
-    df_total = df_long.groupby(['Sector', 'Year'], as_index=False)['Emissions'].sum()
+        'fossil_bio'])
+    df = df.rename(columns = {'C_group_IM24_sh' : 'Region', 'ipcc_code_2006_for_standard_report' : 'Sector'})
+
+    # sum the year columns per region and sector before going from wide to long
+    df_wide = df.groupby(['Region', 'Sector']).sum()
+    df_wide.columns = pd.to_numeric(df_wide.columns.str.replace('Y_', ''))
+    df_long = df_wide.rename_axis(columns='Year').stack().reset_index(name='Emissions')
+    df_total = df_wide.groupby('Sector').sum().rename_axis(columns='Year').stack().reset_index(name='Emissions')
+
+    # ordered by year so the pages can cut out the selected years with a binary search
+    df_long = df_long.sort_values(by='Year', kind='stable', ignore_index=True)
+    df_total = df_total.sort_values(by='Year', kind='stable', ignore_index=True)
 
     return df_long, df_total
 
@@ -227,37 +311,28 @@ def get_ghg_sector_data():
 def get_snow_data():
     df = read_csv_from_url(SNOW_URL, SNOW_BACKUP, sep=r'\s+', names=['year','month','value'])
     df.month = pd.to_numeric(df.month)
-    df['day'] = 1
-    df['date'] = pd.to_datetime(df[['year','month','day']])
+    # months since 1970 as numpy datetime64 months, much faster than pd.to_datetime on the columns or a 'MS' date_range
+    months = ((df.year.to_numpy() - 1970) * 12 + df.month.to_numpy() - 1).astype('datetime64[M]')
+    df['date'] = months.astype('datetime64[ns]')
     df = df.set_index('date')
     # find all missing months and insert nan values
-    min_date = df.index.min()
-    max_date = df.index.max()
-    full_date_range = pd.date_range(start=min_date.to_period('M').start_time,
-                                    end=max_date.to_period('M').end_time,
-                                    freq='MS') # 'MS' for month start
+    full_date_range = pd.DatetimeIndex(np.arange(months.min(), months.max() + 1).astype('datetime64[ns]'))
     df = df.reindex(full_date_range)
     df = df.reset_index()
 
-    # get season and corresponding year
-    df['season_year'] = df['index'].apply(get_season)
-    df[['season','s_year']] = df['season_year'].str.split(' ', expand=True)
-    df.s_year = pd.to_numeric(df.s_year)
-    df_seasons = df.groupby(['s_year','season'])['value'].mean()
+    # get season and corresponding year, January and February belong to the winter starting the year before
+    month = df['index'].dt.month.to_numpy()
+    df['season'] = SEASONS[(month % 12) // 3]
+    df['s_year'] = df['index'].dt.year.to_numpy().astype('int64') - (month < 3)
 
     # do not want values for seasons where there are months missing
-    df_seasons_count = df[~df.value.isna()].groupby(['s_year','season']).size()
-    missing_season_idx = df_seasons_count[df_seasons_count != 3].index
-    df_seasons.loc[missing_season_idx] = float("NaN")
+    df_seasons = df.groupby(['s_year','season'])['value'].agg(['mean', 'count'])
+    df_seasons = df_seasons['mean'].where(df_seasons['count'] == 3).rename('value')
     df_seasons = df_seasons.reset_index()
 
-    # get yearly average
-    df_years = df.groupby(['year'])['value'].mean()
-
-    # do not want values for years with missing months
-    df_month_count = df[~df.value.isna()].groupby(['year']).size()
-    missing_month_idx = df_month_count[df_month_count != 12].index
-    df_years.loc[missing_month_idx] = float("NaN")
+    # get yearly average, but not for years with missing months
+    df_years = df.groupby(['year'])['value'].agg(['mean', 'count'])
+    df_years = df_years['mean'].where(df_years['count'] == 12).rename('value')
     return df_seasons, df_years
 
 @st.cache_data()
@@ -268,7 +343,7 @@ def get_glaciers_data():
 @st.cache_data()
 def get_ice_sheet_data():
     df = read_csv_from_url(ICE_SHEET_URL, ICE_SHEET_BACKUP, skiprows = 6)
-    df['Date'] = df['Year'].apply(fractional_year_to_datetime)
+    df['Date'] = fractional_year_to_datetime_array(df['Year'])
     # Change into long format
     df_long = pd.melt(df,
                   id_vars=['Date', 'Year'],  # Columns to keep as identifiers
@@ -278,7 +353,7 @@ def get_ice_sheet_data():
     df_long = df_long[~df_long.Value.isna()]
     # Add an empty value for Nasa 2018 where there is a gap in the record
     empty_df = pd.DataFrame({ 'Year' : [2018, 2018],
-                              'Date' : [fractional_year_to_datetime(2018), fractional_year_to_datetime(2018)],
+                              'Date' : fractional_year_to_datetime_array([2018, 2018]),
                               'Source' : ['NASA - Antarctica land ice mass', 'NASA - Greenland land ice mass'],
                               'Value' : [float("NaN"), float("NaN")]})
     df_long = pd.concat([df_long, empty_df]).sort_values(by=['Source', 'Date'])
@@ -304,12 +379,7 @@ def get_sea_ice_data():
     # For each hemisphere interpolate missing values, then do 12 month moving average
     df = df.replace(-9999, float("NaN"))
     df = df.sort_values(by=['region', 'date']).reset_index()
-    for region in ['N','S']:
-        df.loc[df['region'] == region, 'extent'] = df.loc[df['region'] == region, 'extent'].interpolate()
-        df.loc[df['region'] == region, 'area'] = df.loc[df['region'] == region, 'area'].interpolate()
-        df.loc[df['region'] == region,'ma_extent'] = df.loc[df['region'] == region,'extent'].rolling(window=12).mean()
-        df.loc[df['region'] == region,'ma_area'] = df.loc[df['region'] == region,'area'].rolling(window=12).mean()
-    return df
+    return interpolate_and_smooth(df, 'region', ['extent', 'area'], window=12)
 
 @st.cache_data()
 def get_cmip6_data():
@@ -449,12 +519,9 @@ def get_n2o_hist_data():
     df['Value'] = pd.to_numeric(df['Value'])
 
     # insert a NaN datapoint to break line in regions where there are sparse datapoints
-    year_diff = df['Year'].diff()
-    index = year_diff[year_diff > 5000].index
-    for i in index:
-        df.loc[len(df)] = [df.loc[i-1,'Year'] + 1000] + [float("NaN")] * (df.shape[1] - 1)
+    df = insert_gap_breaks(df[['Year', 'Value']].sort_values(by='Year'))
     df['Name'] = 'N2O_hist'
-    return df[['Year', 'Name', 'Value']].sort_values(by='Year')
+    return df[['Year', 'Name', 'Value']]
 
 @st.cache_data()
 def get_ch4_hist_data():
@@ -475,12 +542,9 @@ def get_ch4_hist_data():
     df['Value'] = pd.to_numeric(df['Value'])
 
     # insert a NaN datapoint to break line in regions where there are sparse datapoints
-    year_diff = df['Year'].diff()
-    index = year_diff[year_diff > 5000].index
-    for i in index:
-        df.loc[len(df)] = [df.loc[i-1,'Year'] + 1000] + [float("NaN")] * (df.shape[1] - 1)
+    df = insert_gap_breaks(df[['Year', 'Value']].sort_values(by='Year'))
     df['Name'] = 'CH4_hist'
-    return df[['Year', 'Name', 'Value']].sort_values(by='Year')
+    return df[['Year', 'Name', 'Value']]
 
 @st.cache_data()
 def get_co2_hist_data():
@@ -495,12 +559,9 @@ def get_co2_hist_data():
     df['Value'] = pd.to_numeric(df['Value'])
 
     # insert a NaN datapoint to break line in regions where there are sparse datapoints
-    year_diff = df['Year'].diff()
-    index = year_diff[year_diff > 5000].index
-    for i in index:
-        df.loc[len(df)] = [df.loc[i-1,'Year'] + 1000] + [float("NaN")] * (df.shape[1] - 1)
+    df = insert_gap_breaks(df[['Year', 'Value']].sort_values(by='Year'))
     df['Name'] = 'CO2_hist'
-    return df[['Year', 'Name', 'Value']].sort_values(by='Year')
+    return df[['Year', 'Name', 'Value']]
 
 @st.cache_data()
 def get_sea_level_hist_data():
@@ -527,7 +588,7 @@ def get_sea_level_proj_data():
 @st.cache_data()
 def get_sea_level_latest_data():
     df = read_csv_from_url(SEA_LEVEL_URL, SEA_LEVEL_BACKUP)
-    df['Date'] = df['Time (years)'].apply(fractional_year_to_datetime)
+    df['Date'] = fractional_year_to_datetime_array(df['Time (years)'])
     df = df.replace("nan", float("NaN"))
     df["Trendslope"] = np.gradient(df["OLS fit"].to_numpy() * 10, df['Time (years)'].to_numpy())
     return df
@@ -537,7 +598,8 @@ def get_ph_data():
 
     df_global = pd.read_csv(PH_HIST_PATH, header=0, names=['date','value','uncertainty'])
     df_global.date = pd.to_datetime(df_global.date)
-    df_aloha = read_csv_from_url(PH_ALOHA_URL, PH_ALOHA_BACKUP, sep=r'\s+', skiprows = 8)
+    # the backup is the parsed table saved as a plain csv
+    df_aloha = read_csv_from_url(PH_ALOHA_URL, PH_ALOHA_BACKUP, backup_kwargs={}, sep=r'\s+', skiprows = 8)
     df_aloha = df_aloha.replace(-999, float("NaN"))
     df_aloha.date = pd.to_datetime(df_aloha.date)
     return df_global, df_aloha
@@ -550,10 +612,10 @@ def get_ohc_data():
     df_2000 = pd.read_csv(OHC_2000_PATH)
     df_700_2000 = pd.read_csv(OHC_700_2000_PATH)
 
-    df_300.time = df_300.time.apply(integer_to_datetime)
-    df_700.time = df_700.time.apply(integer_to_datetime)
-    df_2000.time = df_2000.time.apply(integer_to_datetime)
-    df_700_2000.time = df_700_2000.time.apply(integer_to_datetime)
+    df_300.time = integer_to_datetime_array(df_300.time)
+    df_700.time = integer_to_datetime_array(df_700.time)
+    df_2000.time = integer_to_datetime_array(df_2000.time)
+    df_700_2000.time = integer_to_datetime_array(df_700_2000.time)
 
     return df_300, df_700, df_2000, df_700_2000
 
@@ -618,35 +680,29 @@ def get_climate_feedback_data():
     ########################## code adopted from https://github.com/mzelinka/AR6_figure/blob/v1.0.0/AR6_fbk_violin_plot.py ###########
 
     # AR6 expert-assessed values provided by Masa on 1/27/21:
-    Masa_names =      ['Net',       'Planck',   'WV+LR','Albedo','Cloud','Other']
-    AR6 =    np.array([-1.16081,    -3.22,      1.30,    0.35,    0.42,  -0.01081]) 
-    AR6p5 =  np.array([-1.81313204, -3.39,      1.13,    0.18,   -0.10,  -0.27159185]) 
-    AR6p95 = np.array([-0.50848796, -3.05,      1.47,    0.52,    0.94,   0.24997185])  
-    AR6p17 = np.array([-1.539513677,-3.32,      1.20,    0.25,    0.12,  -0.16411])  
-    AR6p83 = np.array([-0.782106323,-3.12,      1.40,    0.45,    0.72,   0.14248]) 
-
-    X=np.ma.zeros((10000,6))
-    for i,name in enumerate(Masa_names):
-        mean = AR6[i]
-        p5,p17,p83,p95 = AR6p5[i],AR6p17[i],AR6p83[i],AR6p95[i]
-        CI90 = p95-p5
-        # 90% confidence interval corresponds to +/- 1.64485 times the standard deviation 
-        std = CI90/2/1.64485
-        print('Inferred AR6 '+name+' standard deviation = '+str(np.round(std,2)))
-        this = sorted(np.random.normal(mean, std, 10000))
-        # Clip the tails
-        p2p5,p97p5 = np.percentile(this,[2.5,97.5])
-        X[:,i] = np.ma.masked_outside(this, p2p5,p97p5)
+    AR6_names = ['Net', 'Planck', 'Water Vapour + Lapse Rate', 'Surface Albedo', 'Cloud']
+    AR6 =    np.array([-1.16081,    -3.22,      1.30,    0.35,    0.42])
+    AR6p5 =  np.array([-1.81313204, -3.39,      1.13,    0.18,   -0.10])
+    AR6p95 = np.array([-0.50848796, -3.05,      1.47,    0.52,    0.94])
+
+    # 90% confidence interval corresponds to +/- 1.64485 times the standard deviation
+    std = (AR6p95 - AR6p5)/2/1.64485
     ############################################################################################################################
-    df_ar6 = pd.DataFrame(X, columns=['Net','Planck','Water Vapour + Lapse Rate','Surface Albedo','Cloud','resid_fbk'])
-    df_ar6 = df_ar6.drop(columns = ['resid_fbk'])
-    df_ar6['generation'] = 'ar6'
-    df_ar6 = pd.melt(df_ar6,
-                  id_vars=['generation'],
-                  value_vars=[c for c in df_ar6.columns if c != 'generation'],
-                  var_name='feedback',
-                  value_name='value')
+
+    # Instead of sampling 10000 values and clipping the tails outside the 2.5 and 97.5 percentiles, the box plot statistics
+    # of the clipped normal distribution are calculated directly. The whiskers end at the clipped tails.
+    clipped_quantile = lambda p: AR6 + std * NormalDist().inv_cdf(0.025 + 0.95 * p)
+    df_ar6 = pd.DataFrame({'feedback' : AR6_names,
+                           'generation' : 'ar6',
+                           'lowerfence' : clipped_quantile(0),
+                           'q1' : clipped_quantile(0.25),
+                           'median' : clipped_quantile(0.5),
+                           'q3' : clipped_quantile(0.75),
+                           'upperfence' : clipped_quantile(1)})
     return df_cmip5, df_cmip6, df_ar6
-    
+
+# with CLIMATE_GRAPHS_TIMING=1 every loader call is timed, cache hits included
+timed_loaders(globals())
+
 if __name__ == "__main__":
     get_energy_per_cap_data()
\ No newline at end of file
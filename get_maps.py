@@ -0,0 +1,268 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+from pathlib import Path
+import io
+import cartopy.crs as ccrs
+import cartopy.io.shapereader as shpreader
+from cartopy.mpl.path import shapely_to_path, path_to_shapely
+from cartopy.util import add_cyclic_point
+import contourpy
+import matplotlib
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path as MplPath
+import plotly.graph_objects as go
+
+from monitoring import timed_loaders
+
+# coastlines derived from the Natural Earth 110m admin-0 countries (public domain): the dissolved outline of the
+# country polygons, rebuilt by data/coastline/make_coastline.py. Shipped under its own name and read directly, it is
+# not the official ne_110m_coastline layer
+COASTLINE_PATH = Path("data/coastline/coastline_110m_admin0.shp")
+
+PROJECTIONS = {
+    'Mollweide' : ccrs.Mollweide(central_longitude=0, globe=None),
+    'Robinson' : ccrs.Robinson(central_longitude=0, globe=None)
+}
+
+# upper limit on the number of grid cells sent to the browser for an interactive map (a 1° global grid)
+MAX_INTERACTIVE_CELLS = 180 * 360
+
+# approximate resolutions (degrees) of the coarser grid levels kept for every map layer
+PYRAMID_RESOLUTIONS = [1, 2, 4]
+
+# a grid level is fine enough if none of its cells is wider than this on screen
+MAX_CELL_PIXELS = 4
+
+# hatch outlines are simplified to this fraction of a grid cell, well below what the hatch pattern shows
+HATCH_SIMPLIFY_CELLS = 0.25
+
+def get_coastline_geometries():
+    reader = shpreader.Reader(COASTLINE_PATH)
+    return list(reader.geometries())
+
+@st.cache_resource()
+def get_coastline_paths(projection_name):
+    # load the coastline geometries and project them once per projection, the paths are shared by all maps
+    projection = PROJECTIONS[projection_name]
+    paths = []
+    for geometry in get_coastline_geometries():
+        projected = projection.project_geometry(geometry, ccrs.PlateCarree())
+        if not projected.is_empty:
+            paths.append(shapely_to_path(projected))
+    return paths
+
+@st.cache_data()
+def get_coastline_lonlat():
+    # coastlines as a single lon/lat line with NaN separators for plotly
+    x, y = [], []
+    for geometry in get_coastline_geometries():
+        lines = geometry.geoms if hasattr(geometry, 'geoms') else [geometry]
+        for line in lines:
+            coords = np.asarray(line.coords)
+            x += [coords[:, 0], [np.nan]]
+            y += [coords[:, 1], [np.nan]]
+    return np.round(np.concatenate(x), 2), np.round(np.concatenate(y), 2)
+
+def add_coastlines(ax, projection_name, color='black', linewidth=1):
+    # drop in replacement for ax.coastlines() using the cached pre-projected paths
+    coastlines = PathCollection(get_coastline_paths(projection_name), facecolor='none', edgecolor=color,
+        linewidth=linewidth, transform=ax.transData)
+    ax.add_collection(coastlines, autolim=False)
+    return coastlines
+
+@st.cache_data()
+def get_grid(filePath):
+    # wide csv with one row per latitude and one column per longitude
+    df = pd.read_csv(filePath)
+
+    lats = df.latitude.to_numpy()
+    df = df.drop(columns=['latitude'])
+    lons = pd.to_numeric(df.columns).to_numpy()
+    data = df.to_numpy(dtype=float)
+    return lats, lons, data
+
+@st.cache_data()
+def get_scaled_grid(filePath, scaling=1, clip=None):
+    # scaling and clipping are applied once to the cached grid instead of on every render
+    lats, lons, data = get_grid(filePath)
+    data = data * scaling
+    if clip is not None:
+        data = np.clip(data, *clip)
+    return lats, lons, data
+
+def figure_to_png(fig):
+    # same image st.pyplot would produce, as bytes that can be cached and shown with st.image
+    image = io.BytesIO()
+    fig.savefig(image, format='png', bbox_inches='tight', dpi=200)
+    plt.close(fig)
+    return image.getvalue()
+
+def coarsen_grid(lats, lons, data, factor):
+    # block average factor x factor cells, NaN cells are ignored so land/ocean masks survive
+    if factor == 1:
+        return lats, lons, data
+    ny = data.shape[0] // factor * factor
+    nx = data.shape[1] // factor * factor
+    blocks = data[:ny, :nx].reshape(ny // factor, factor, nx // factor, factor)
+    valid = ~np.isnan(blocks)
+    count = valid.sum(axis=(1, 3))
+    total = np.where(valid, blocks, 0).sum(axis=(1, 3))
+    coarse = np.full(count.shape, np.nan)
+    np.divide(total, count, out=coarse, where=count > 0)
+    return lats[:ny].reshape(-1, factor).mean(axis=1), lons[:nx].reshape(-1, factor).mean(axis=1), coarse
+
+@st.cache_data()
+def get_grid_pyramid(filePath):
+    # the native grid plus block averaged levels at about 1°, 2° and 4°, keyed by resolution from fine to coarse
+    lats, lons, data = get_grid(filePath)
+    native = abs(lons[1] - lons[0])
+    factors = sorted({1} | {max(1, round(resolution / native)) for resolution in PYRAMID_RESOLUTIONS})
+    return {float(round(native * factor, 3)): coarsen_grid(lats, lons, data, factor) for factor in factors}
+
+def select_grid_level(pyramid, pixel_width, max_cells=None):
+    # pick the coarsest level that still resolves the requested map width, optionally capped in size
+    levels = [(resolution, grid) for resolution, grid in pyramid.items() if max_cells is None or grid[2].size <= max_cells]
+    if not levels:
+        levels = list(pyramid.items())[-1:]
+    selected = levels[0]
+    for resolution, grid in levels:
+        if len(grid[1]) * MAX_CELL_PIXELS >= pixel_width:
+            selected = (resolution, grid)
+    return selected
+
+def get_band_polygons(lats, lons, data, lower, upper, lowest_band, tolerance):
+    # the region between two contour levels as lon/lat polygons, following the same rules as contourf
+    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=lons)
+    z = np.ma.masked_invalid(data_cyclic)
+    if lowest_band and z.min() == lower:
+        # contourf includes the minimum value in the lowest band
+        lower -= 1
+    generator = contourpy.contour_generator(lon_cyclic, lats, z, name=matplotlib.rcParams['contour.algorithm'],
+        corner_mask=matplotlib.rcParams['contour.corner_mask'], fill_type='OuterCode')
+    polygons = []
+    for points, codes in zip(*generator.filled(lower, upper)):
+        polygon = path_to_shapely(MplPath(points, codes)).simplify(tolerance)
+        if not polygon.is_empty:
+            polygons.append(polygon)
+    return polygons
+
+@st.cache_data()
+def get_hatch_polygons(filePath, levels, hatches):
+    # hatched bands of every grid level of a layer, extracted once instead of a contourf pass per render
+    hatch_polygons = {}
+    for resolution, (lats, lons, data) in get_grid_pyramid(filePath).items():
+        hatch_polygons[resolution] = [(hatch, get_band_polygons(lats, lons, data, levels[i], levels[i + 1], i == 0,
+            resolution * HATCH_SIMPLIFY_CELLS)) for i, hatch in enumerate(hatches) if hatch is not None]
+    return hatch_polygons
+
+@st.cache_resource()
+def get_hatch_paths(filePath, levels, hatches, projection_name, resolution):
+    projection = PROJECTIONS[projection_name]
+    hatch_paths = []
+    for hatch, polygons in get_hatch_polygons(filePath, levels, hatches)[resolution]:
+        paths = []
+        for polygon in polygons:
+            projected = projection.project_geometry(polygon, ccrs.PlateCarree())
+            if not projected.is_empty:
+                paths.append(shapely_to_path(projected))
+        hatch_paths.append((hatch, paths))
+    return hatch_paths
+
+def add_hatches(ax, filePath, levels, hatches, projection_name, resolution):
+    # drop in replacement for ax.contourf(..., colors='none', hatches=hatches, levels=levels) using cached pre-projected paths
+    for hatch, paths in get_hatch_paths(filePath, levels, hatches, projection_name, resolution):
+        # a transparent face rather than 'none', otherwise matplotlib skips the collection and its hatching
+        ax.add_collection(PathCollection(paths, facecolor=(0, 0, 0, 0), edgecolor='none', linewidth=0, hatch=hatch,
+            transform=ax.transData), autolim=False)
+
+def get_plotly_colorscale(cmap, levels=None, n_samples=11):
+    # translate a matplotlib colormap into a plotly colorscale, with discrete steps if levels are given
+    if isinstance(cmap, str):
+        cmap = matplotlib.colormaps[cmap]
+    if levels is None:
+        return [[x, mcolors.to_hex(cmap(x))] for x in np.linspace(0, 1, n_samples)]
+
+    levels = np.asarray(levels, dtype=float)
+    fractions = (levels - levels[0]) / (levels[-1] - levels[0])
+    colorscale = []
+    for i in range(len(levels) - 1):
+        # same color for every value between two levels as with a BoundaryNorm
+        color = mcolors.to_hex(cmap(i))
+        colorscale += [[fractions[i], color], [fractions[i + 1], color]]
+    return colorscale
+
+def create_interactive_map(lats, lons, data, label, zmin, zmax, colorscale, hatch=None, value_format='.2f'):
+    """
+    Creates a plotly heatmap of a lon/lat grid with coastlines. Zoom, pan and hover run in the browser.
+    The grid is sent as is, pick a suitable level with select_grid_level first.
+
+    Args:
+        lats (array): Latitudes of the grid rows.
+        lons (array): Longitudes of the grid columns, either -180 to 180 or 0 to 360.
+        data (2D array): Values on the grid.
+        label (str): Colorbar title and hover label.
+        zmin (float), zmax (float): Color range.
+        colorscale (list): Plotly colorscale, see get_plotly_colorscale.
+        hatch (2D array of bool, optional): Cells to shade as hatched (e.g. not significant).
+        value_format (str): d3 format of the hover value.
+
+    Returns:
+        go.Figure: The map figure.
+    """
+    # put longitudes in -180 to 180 to match the coastlines
+    lons = (lons + 180) % 360 - 180
+    order = np.argsort(lons)
+    lons = lons[order]
+    data = data[:, order]
+
+    # a few significant digits are plenty for the colors and keep the payload small
+    magnitude = np.nanmax(np.abs(data)) if np.isfinite(data).any() else 1
+    decimals = max(0, 3 - int(np.floor(np.log10(magnitude)))) if magnitude > 0 else 3
+    data = np.round(data, decimals)
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Heatmap(x=np.round(lons, 3),
+            y=np.round(lats, 3),
+            z=data,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            colorbar=dict(title=label, orientation='h', y=-0.15, len=0.6),
+            hovertemplate =
+            f'{label}: %{{z:{value_format}}}'+
+            '<br>Longitude: %{x:.1f}°'+
+            '<br>Latitude: %{y:.1f}°<extra></extra>')
+    )
+    if hatch is not None:
+        fig.add_trace(
+            go.Heatmap(x=np.round(lons, 3),
+                y=np.round(lats, 3),
+                z=np.where(hatch[:, order], 1, np.nan),
+                colorscale=[[0, 'rgba(80,80,80,0.35)'], [1, 'rgba(80,80,80,0.35)']],
+                showscale=False,
+                hoverinfo='skip')
+        )
+
+    coast_x, coast_y = get_coastline_lonlat()
+    fig.add_trace(
+        go.Scatter(x=coast_x,
+            y=coast_y,
+            mode='lines',
+            line=dict(color='black', width=1),
+            hoverinfo='skip',
+            showlegend=False)
+    )
+    fig.update_layout(
+        height=650,
+        xaxis=dict(range=[-180, 180], showgrid=False, zeroline=False, title_text='Longitude'),
+        yaxis=dict(range=[-90, 90], showgrid=False, zeroline=False, scaleanchor='x', title_text='Latitude'),
+        plot_bgcolor='white'
+    )
+    return fig
+
+# with CLIMATE_GRAPHS_TIMING=1 every grid and geometry loader call is timed, cache hits included
+timed_loaders(globals())
@@ -0,0 +1,269 @@
+import io
+import os
+import sys
+import time
+import atexit
+import logging
+import threading
+import functools
+import contextlib
+from collections import deque
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import PIL.Image
+import plotly.io
+import streamlit as st
+
+# set CLIMATE_GRAPHS_TIMING=1 to log the server time of every page section and the p50/p95 times of the sections,
+# data loaders and chart rendering
+TIMING_ENABLED = os.environ.get('CLIMATE_GRAPHS_TIMING') == '1'
+
+# optional Prometheus text file the timings are also written to, e.g. for the node exporter textfile collector
+TIMING_FILE = os.environ.get('CLIMATE_GRAPHS_TIMING_FILE')
+
+# recent samples kept per timer for the percentiles, and how often the percentiles are logged and written
+TIMING_WINDOW = 1000
+TIMING_EXPORT_SECONDS = 15
+
+# set CLIMATE_GRAPHS_PAYLOAD=1 to log the size of every chart sent to the browser and list them in the sidebar
+PAYLOAD_ENABLED = os.environ.get('CLIMATE_GRAPHS_PAYLOAD') == '1'
+
+# trace attributes holding one value per point, the largest of them gives the number of points of a trace
+POINT_ATTRIBUTES = ['x', 'y', 'z', 'lat', 'lon', 'locations', 'values']
+
+logger = logging.getLogger('climate_graphs')
+if (TIMING_ENABLED or PAYLOAD_ENABLED) and not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+# (kind, name) -> recent samples plus the count and sum of all samples, shared by all sessions of the process
+timings = {}
+timings_lock = threading.Lock()
+last_export = time.monotonic()
+
+def record_timing(kind, name, seconds):
+    global last_export
+    with timings_lock:
+        timing = timings.get((kind, name))
+        if timing is None:
+            timing = timings[(kind, name)] = {'samples' : deque(maxlen=TIMING_WINDOW), 'count' : 0, 'sum' : 0.0}
+        timing['samples'].append(seconds)
+        timing['count'] += 1
+        timing['sum'] += seconds
+        export = time.monotonic() - last_export >= TIMING_EXPORT_SECONDS
+        if export:
+            last_export = time.monotonic()
+    if export:
+        export_timings()
+
+def timing_summary():
+    # one row per timer with the count, sum and the 50th and 95th percentiles of the recent samples
+    with timings_lock:
+        rows = [(kind, name, timing['count'], timing['sum'], np.array(timing['samples']))
+            for (kind, name), timing in timings.items()]
+    return [(kind, name, count, total, *np.percentile(samples, [50, 95])) for kind, name, count, total, samples in rows]
+
+def prometheus_text(summary):
+    lines = ['# HELP climate_graphs_duration_seconds Server time of page sections, data loaders and chart rendering.',
+        '# TYPE climate_graphs_duration_seconds summary']
+    for kind, name, count, total, p50, p95 in summary:
+        labels = f'kind="{kind}",name="{name}"'
+        lines += [f'climate_graphs_duration_seconds{{{labels},quantile="0.5"}} {p50:.6f}',
+            f'climate_graphs_duration_seconds{{{labels},quantile="0.95"}} {p95:.6f}',
+            f'climate_graphs_duration_seconds_sum{{{labels}}} {total:.6f}',
+            f'climate_graphs_duration_seconds_count{{{labels}}} {count}']
+    return '\n'.join(lines) + '\n'
+
+def export_timings():
+    summary = timing_summary()
+    for kind, name, count, total, p50, p95 in summary:
+        logger.info('timing kind=%s name=%s count=%d p50=%.3f p95=%.3f', kind, name, count, p50, p95)
+    if TIMING_FILE:
+        # written next to the target and renamed so a scrape never reads a half written file
+        path = Path(TIMING_FILE)
+        temporary = path.with_name(path.name + '.tmp')
+        temporary.write_text(prometheus_text(summary))
+        os.replace(temporary, path)
+
+if TIMING_ENABLED:
+    atexit.register(export_timings)
+
+class timed(contextlib.ContextDecorator):
+    # times a block (with timed(name):) or every call of a function (@timed(name)) into the p50/p95 timings,
+    # without CLIMATE_GRAPHS_TIMING the function is returned as is and the block only checks the flag
+    def __init__(self, name, kind='block'):
+        self.name = name
+        self.kind = kind
+
+    def __call__(self, func):
+        if not TIMING_ENABLED:
+            return func
+        return super().__call__(func)
+
+    def _recreate_cm(self):
+        # a fresh timer per call so calls from several sessions at once do not share a start time
+        return type(self)(self.name, self.kind)
+
+    def __enter__(self):
+        if TIMING_ENABLED:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if TIMING_ENABLED:
+            record_timing(self.kind, self.name, time.perf_counter() - self.start)
+        return False
+
+def timed_loaders(namespace):
+    # times every get_* function defined in a module, call at the end of the module with globals()
+    if not TIMING_ENABLED:
+        return
+    for name, func in list(namespace.items()):
+        if name.startswith('get_') and callable(func) and getattr(func, '__module__', None) == namespace['__name__']:
+            loader = timed(name, kind='loader')(func)
+            if hasattr(func, 'clear'):
+                # cached loaders keep their cache controls
+                loader.clear = func.clear
+            namespace[name] = loader
+
+def section_fragment(func):
+    # a page section rerun on its own when one of its widgets changes, instead of rerunning the whole page
+    if not (TIMING_ENABLED or PAYLOAD_ENABLED):
+        return st.fragment(func)
+    page = Path(func.__globals__.get('__file__', '')).stem
+
+    @functools.wraps(func)
+    def monitored_section(*args, **kwargs):
+        if PAYLOAD_ENABLED:
+            # the charts of the last run of the section are replaced, charts behind a branch not taken are dropped
+            drop_payloads(page, func.__name__)
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        if TIMING_ENABLED:
+            logger.info('section=%s seconds=%.3f', func.__name__, seconds)
+            record_timing('section', func.__name__, seconds)
+        if PAYLOAD_ENABLED:
+            draw_payload_panel(page)
+        return result
+
+    return st.fragment(monitored_section)
+
+def chart_caller(frame):
+    # the page and the section function (the outermost function of the page code) showing the chart
+    page_file = frame.f_globals.get('__file__', '')
+    section = frame
+    while frame is not None and frame.f_globals.get('__file__') == page_file:
+        if frame.f_code.co_name != '<module>':
+            section = frame
+        frame = frame.f_back
+    return Path(page_file).stem, section.f_code.co_name, section.f_lineno
+
+def payload_records():
+    # (page, section, line) -> size of the chart shown there, for the current session
+    return st.session_state.setdefault('chart_payloads', {})
+
+def drop_payloads(page, section=None):
+    records = payload_records()
+    for key in [key for key in records if key[0] == page and section in (None, key[1])]:
+        del records[key]
+
+def record_payload(caller, kind, title, size, traces, points):
+    page, section, line = chart_caller(caller)
+    record = {
+        'page' : page,
+        'section' : section,
+        'chart' : title,
+        'kind' : kind,
+        'bytes' : size,
+        'traces' : traces,
+        'points' : points
+    }
+    payload_records()[(page, section, line)] = record
+    logger.info('payload page=%s section=%s chart=%r kind=%s bytes=%d traces=%d points=%d', page, section, title, kind,
+        size, traces, points)
+
+def trace_points(trace):
+    return max((np.size(np.asarray(trace[key], dtype=object)) for key in POINT_ATTRIBUTES if trace.get(key) is not None),
+        default=0)
+
+def plotly_chart(fig, **kwargs):
+    # st.plotly_chart that records the size of the figure, serialised the same way streamlit does
+    if PAYLOAD_ENABLED:
+        spec = fig.to_dict() if hasattr(fig, 'to_dict') else fig
+        traces = spec.get('data', [])
+        # animation frames are sent with the figure, their points count too
+        frame_traces = [trace for frame in spec.get('frames', []) for trace in frame.get('data', [])]
+        record_payload(sys._getframe(1), 'plotly', spec.get('layout', {}).get('title', {}).get('text') or '',
+            len(plotly.io.to_json(fig, validate=False)), len(traces),
+            sum(trace_points(trace) for trace in traces + frame_traces))
+    if not TIMING_ENABLED:
+        return st.plotly_chart(fig, **kwargs)
+    with timed(chart_caller(sys._getframe(1))[1], kind='render'):
+        return st.plotly_chart(fig, **kwargs)
+
+def pyplot(fig, **kwargs):
+    # st.pyplot that records the size of the png, rendered with the options st.pyplot uses
+    if PAYLOAD_ENABLED:
+        image = io.BytesIO()
+        fig.savefig(image, bbox_inches='tight', dpi=200, format='png')
+        artists = [artist for ax in fig.axes for artist in ax.lines + ax.collections + ax.images]
+        points = sum(len(line.get_xdata()) for ax in fig.axes for line in ax.lines)
+        points += sum(len(path.vertices) for ax in fig.axes for collection in ax.collections
+            for path in collection.get_paths())
+        points += sum(np.size(image_artist.get_array()) for ax in fig.axes for image_artist in ax.images)
+        # maps have no title, their colorbar label names them instead
+        labels = [fig.get_suptitle()] + [label for ax in fig.axes
+            for label in (ax.get_title(), ax.get_xlabel(), ax.get_ylabel())]
+        title = next((label for label in labels if label), '')
+        record_payload(sys._getframe(1), 'pyplot', title, image.getbuffer().nbytes, len(artists), points)
+    if not TIMING_ENABLED:
+        return st.pyplot(fig, **kwargs)
+    with timed(chart_caller(sys._getframe(1))[1], kind='render'):
+        return st.pyplot(fig, **kwargs)
+
+def image(image, **kwargs):
+    # st.image that records the size of the image bytes or file, the points are its pixels (none for svg files)
+    # recorded after st.image so a missing file fails the same way with or without the panel
+    if not TIMING_ENABLED:
+        element = st.image(image, **kwargs)
+    else:
+        with timed(chart_caller(sys._getframe(1))[1], kind='render'):
+            element = st.image(image, **kwargs)
+    if PAYLOAD_ENABLED:
+        is_file = isinstance(image, (str, Path))
+        try:
+            # only the header is read for the size, the with block closes the file
+            with PIL.Image.open(image if is_file else io.BytesIO(image)) as opened:
+                width, height = opened.size
+        except PIL.UnidentifiedImageError:
+            width = height = 0
+        record_payload(sys._getframe(1), 'image', kwargs.get('caption') or (Path(image).name if is_file else ''),
+            os.path.getsize(image) if is_file else len(image), 1, width * height)
+    return element
+
+def draw_payload_panel(page):
+    placeholder = st.session_state.get('chart_payload_panel')
+    records = [record for record in payload_records().values() if record['page'] == page]
+    if placeholder is None or not records:
+        return
+    df = pd.DataFrame(records).drop(columns=['page'])
+    logger.info('payload page=%s charts=%d bytes=%d traces=%d points=%d', page, len(df), df['bytes'].sum(),
+        df['traces'].sum(), df['points'].sum())
+    # replaces the panel drawn before, also from a fragment rerun
+    with placeholder.container():
+        with st.expander('Chart payloads', expanded=True):
+            st.metric('Total sent', f"{df['bytes'].sum() / 1e6:.2f} MB")
+            st.dataframe(df, hide_index=True)
+
+def payload_panel():
+    # sidebar table of the charts of the current page, call at the top of the page, every section updates it
+    if not PAYLOAD_ENABLED:
+        return
+    # a full run of the page shows all its charts again
+    drop_payloads(Path(sys._getframe(1).f_globals.get('__file__', '')).stem)
+    # an empty element directly in the sidebar cannot be written from a fragment, one inside a container can
+    st.session_state['chart_payload_panel'] = st.sidebar.container().empty()
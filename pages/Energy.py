@@ -1,8 +1,6 @@
-import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
-import numpy as np
 from plotly.subplots import make_subplots
 from datetime import date
 from pathlib import Path
@@ -16,8 +14,17 @@ from get_data import (
     get_electricity_data,
     get_energy_sector_data,
     get_energy_per_cap_data,
+    get_energy_per_cap_by_country,
     get_levelized_cost_data
 )
+from get_maps import (
+    PROJECTIONS,
+    add_coastlines,
+    get_scaled_grid,
+    figure_to_png
+)
+from monitoring import section_fragment, plotly_chart, image, payload_panel, timed_loaders
+from plotting import window_rows, cached_figure, animated_choropleth
 
 st.set_page_config(
     page_title='Climate Change in Graphs: Energy',
@@ -26,362 +33,398 @@ st.set_page_config(
     initial_sidebar_state='collapsed'
 )
 
-def plot_map_solar(filePath, label, vmin, vmax, cmap, nlevels = 12, scaling = 1):
-
-    df = pd.read_csv(filePath)
-
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
+@st.cache_data()
+def get_map_image(filePath, label, vmin, vmax, cmap, nlevels = 12, scaling = 1, clip = None):
+    # none of the maps depend on the page widgets, so each is drawn once and shared by all sessions and reruns
+    lats, lons, data = get_scaled_grid(filePath, scaling, clip)
 
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
+    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=lons)
 
     fig = plt.figure(figsize=(16, 12))
-    ax = plt.axes(projection=ccrs.Mollweide(central_longitude=0, globe=None))
+    ax = plt.axes(projection=PROJECTIONS['Mollweide'])
 
-    mappable = ax.contourf(lon_cyclic, lats, data_cyclic * scaling, nlevels, vmin = vmin, vmax = vmax, cmap=cmap,
-                 transform=ccrs.PlateCarree())
+    mappable = ax.contourf(lon_cyclic, lats, data_cyclic, nlevels, vmin = vmin, vmax = vmax, cmap=cmap,
+                 transform=ccrs.PlateCarree(), extend='neither' if clip is None else 'max')
 
-    ax.coastlines()
+    add_coastlines(ax, 'Mollweide')
 
     fig.colorbar(mappable, label=label, orientation='horizontal', pad=0.01, shrink=0.6) # Add a colorbar
 
-    st.pyplot(fig, width='stretch')
-
-def plot_map_wind(filePath, label, vmin, vmax, cmap, nlevels = 12, scaling = 1):
-
-    df = pd.read_csv(filePath)
+    return figure_to_png(fig)
 
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
+# before the sections run, so the page loaders are timed with the get_data ones
+timed_loaders(globals())
 
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
-
-    fig = plt.figure(figsize=(16, 12))
-    ax = plt.axes(projection=ccrs.Mollweide(central_longitude=0, globe=None))
-
-    mappable = ax.contourf(lon_cyclic, lats, np.clip(data_cyclic * scaling,0,1000), nlevels, vmin = vmin, vmax = vmax, cmap=cmap,
-                 transform=ccrs.PlateCarree(), extend='max')
+def plot_map_solar(filePath, label, vmin, vmax, cmap, nlevels = 12, scaling = 1):
 
-    ax.coastlines()
+    image(get_map_image(filePath, label, vmin, vmax, cmap, nlevels, scaling), width='stretch')
 
-    fig.colorbar(mappable, label=label, orientation='horizontal', pad=0.01, shrink=0.6) # Add a colorbar
+def plot_map_wind(filePath, label, vmin, vmax, cmap, nlevels = 12, scaling = 1):
 
-    st.pyplot(fig, width='stretch')
+    image(get_map_image(filePath, label, vmin, vmax, cmap, nlevels, scaling, clip = (0, 1000)), width='stretch')
 
 st.sidebar.header("Energy")
+payload_panel()
 
 st.markdown("# World energy consumption and production")
 ############################################# Historic energy consumption plot ###########################################################
-df_energy = get_energy_consumption_data()
-
-min_value = df_energy['Year'].min()
-max_value = df_energy['Year'].max()
-
-from_year, to_year = st.slider(
-    "Select year range",
-    min_value=min_value,
-    max_value=max_value,
-    format="%0.0f",
-    value=(min_value, max_value),
-    key="historic_energy_cons_slider"
-)
-
-fig1 = make_subplots()
+@section_fragment
+def create_energy_consumption_section():
+    df_energy = get_energy_consumption_data()
+
+    min_value = df_energy['Year'].min()
+    max_value = df_energy['Year'].max()
+
+    from_year, to_year = st.slider(
+        "Select year range",
+        min_value=min_value,
+        max_value=max_value,
+        format="%0.0f",
+        value=(min_value, max_value),
+        key="historic_energy_cons_slider"
+    )
+    df_energy = window_rows(df_energy, from_year, to_year)
 
-for col in ['Traditional biomass','Coal','Oil','Gas','Nuclear','Hydropower','Wind','Solar','Other renewables','Biofuels']:
+    fig1 = make_subplots()
 
-    # Add traces
-    fig1.add_trace(
-        go.Scatter(x=df_energy.Year,
-            y=df_energy[col], 
-            name=col,
-            hovertemplate =
-            'Value: %{y:.2e} TWh'+
-            '<br>Year: %{x:.0f}',
-            stackgroup='one')
-    )
+    for col in ['Traditional biomass','Coal','Oil','Gas','Nuclear','Hydropower','Wind','Solar','Other renewables','Biofuels']:
 
-fig1.update_layout(
-    title_text=f"Graph 1: World energy consumption by year 1800-2024",
-    xaxis=dict(range=[from_year, to_year]),
-    legend=dict(
-            x=0.1,  # x-position (0.1 is near left)
-            y=0.7,  # y-position (0.9 is near top)
-            xref="container",
-            yref="container",
-            orientation = 'h'
+        # Add traces
+        fig1.add_trace(
+            go.Scatter(x=df_energy.Year,
+                y=df_energy[col], 
+                name=col,
+                hovertemplate =
+                'Value: %{y:.2e} TWh'+
+                '<br>Year: %{x:.0f}',
+                stackgroup='one')
         )
-)
-# # Set x-axis title
-fig1.update_xaxes(title_text="Year")
 
-# # Set y-axes titles
-fig1.update_yaxes(title_text="Energy consumption (TWh)")
-st.plotly_chart(fig1, use_container_width=True)
-st.caption("""Graph 1: World energy consumption by year 1800-2024 in terms of direct primary energy. Primary energy is the 
-    energy found in natural resources that has not yet been converted into other forms. In the absence of more recent data, 
-    traditional biomass is assumed constant since 2015. Data 
-    from [Our World in Data](https://ourworldindata.org/grapher/global-primary-energy).""")
+    fig1.update_layout(
+        title_text=f"Graph 1: World energy consumption by year 1800-2024",
+        xaxis=dict(range=[from_year, to_year]),
+        legend=dict(
+                x=0.1,  # x-position (0.1 is near left)
+                y=0.7,  # y-position (0.9 is near top)
+                xref="container",
+                yref="container",
+                orientation = 'h'
+            )
+    )
+    # # Set x-axis title
+    fig1.update_xaxes(title_text="Year")
 
-############################################# Historic electricity by source plot ###########################################################
-df_el = get_electricity_data()
+    # # Set y-axes titles
+    fig1.update_yaxes(title_text="Energy consumption (TWh)")
+    plotly_chart(fig1, use_container_width=True)
+    st.caption("""Graph 1: World energy consumption by year 1800-2024 in terms of direct primary energy. Primary energy is the 
+        energy found in natural resources that has not yet been converted into other forms. In the absence of more recent data, 
+        traditional biomass is assumed constant since 2015. Data 
+        from [Our World in Data](https://ourworldindata.org/grapher/global-primary-energy).""")
 
-df = df_el[(df_el.Year > 1999) & (df_el.Entity == 'World')]
-df = df.sort_values(by='Year')
+create_energy_consumption_section()
 
-min_value = df['Year'].min()
-max_value = df['Year'].max()
+############################################# Historic electricity by source plot ###########################################################
+@section_fragment
+def create_electricity_section():
+    df_el = get_electricity_data()
+
+    df = df_el[(df_el.Year > 1999) & (df_el.Entity == 'World')]
+    df = df.sort_values(by='Year')
+
+    min_value = df['Year'].min()
+    max_value = df['Year'].max()
+
+    from_year, to_year = st.slider(
+        "Select year range",
+        min_value=min_value,
+        max_value=max_value,
+        format="%0.0f",
+        value=(min_value, max_value),
+        key="historic_electr_slider"
+    )
+    df = window_rows(df, from_year, to_year)
 
-from_year, to_year = st.slider(
-    "Select year range",
-    min_value=min_value,
-    max_value=max_value,
-    format="%0.0f",
-    value=(min_value, max_value),
-    key="historic_electr_slider"
-)
+    fig2 = make_subplots()
 
-fig2 = make_subplots()
+    for col in ['Coal','Gas','Oil','Nuclear','Hydro','Solar','Wind','Bioenergy','Other renewables']:
 
-for col in ['Coal','Gas','Oil','Nuclear','Hydro','Solar','Wind','Bioenergy','Other renewables']:
+        # Add traces
+        fig2.add_trace(
+            go.Scatter(x=df.Year,
+                y=df[col], 
+                name=col,
+                hovertemplate =
+                'Value: %{y:.2e} TWh'+
+                '<br>Year: %{x:.0f}',
+                stackgroup='one')
+        )
 
-    # Add traces
-    fig2.add_trace(
-        go.Scatter(x=df.Year,
-            y=df[col], 
-            name=col,
-            hovertemplate =
-            'Value: %{y:.2e} TWh'+
-            '<br>Year: %{x:.0f}',
-            stackgroup='one')
+    fig2.update_layout(
+        title_text=f"Graph 2: World electricity generation by source 2000-2024",
+        xaxis=dict(range=[from_year, to_year]),
+        legend=dict(
+                x=0.1,  # x-position (0.1 is near left)
+                y=0.7,  # y-position (0.9 is near top)
+                xref="container",
+                yref="container",
+                orientation = 'h'
+            )
     )
+    # # Set x-axis title
+    fig2.update_xaxes(title_text="Year")
 
-fig2.update_layout(
-    title_text=f"Graph 2: World electricity generation by source 2000-2024",
-    xaxis=dict(range=[from_year, to_year]),
-    legend=dict(
-            x=0.1,  # x-position (0.1 is near left)
-            y=0.7,  # y-position (0.9 is near top)
-            xref="container",
-            yref="container",
-            orientation = 'h'
-        )
-)
-# # Set x-axis title
-fig2.update_xaxes(title_text="Year")
+    # # Set y-axes titles
+    fig2.update_yaxes(title_text="Electricity generation (TWh)")
+    plotly_chart(fig2, use_container_width=True)
+    st.caption("""Graph 2: World electricity generation by source 2000-2024. Data 
+        from [Our World in Data](https://ourworldindata.org/grapher/electricity-production-by-source).""")
 
-# # Set y-axes titles
-fig2.update_yaxes(title_text="Electricity generation (TWh)")
-st.plotly_chart(fig2, use_container_width=True)
-st.caption("""Graph 2: World electricity generation by source 2000-2024. Data 
-    from [Our World in Data](https://ourworldindata.org/grapher/electricity-production-by-source).""")
+create_electricity_section()
 
 ############################################# Historic energy by sector plot ###########################################################
-df = get_energy_sector_data()
-
-min_value = df['Year'].min()
-max_value = df['Year'].max()
-
-from_year, to_year = st.slider(
-    "Select year range",
-    min_value=min_value,
-    max_value=max_value,
-    format="%0.0f",
-    value=(min_value, max_value),
-    key="historic_energy_by_sector_slider"
-)
-
-fig3 = make_subplots()
-
-for sector in ['Industry','Transport','Non-energy use','Commercial and Public Services','Agriculture and forestry',
-    'Residential','Other non-specified','Fishing']:
-
-    df_sector = df[df['total final consumption in World'] == sector]
-    # Add traces
-    fig3.add_trace(
-        go.Scatter(x=df_sector.Year,
-            y=df_sector.Value/3600, 
-            name=sector,
-            hovertemplate =
-            'Value: %{y:.2e} TWh'+
-            '<br>Year: %{x:.0f}',
-            stackgroup='one')
+@section_fragment
+def create_energy_sector_section():
+    df = get_energy_sector_data()
+
+    min_value = df['Year'].min()
+    max_value = df['Year'].max()
+
+    from_year, to_year = st.slider(
+        "Select year range",
+        min_value=min_value,
+        max_value=max_value,
+        format="%0.0f",
+        value=(min_value, max_value),
+        key="historic_energy_by_sector_slider"
     )
 
-fig3.update_layout(
-    title_text=f"Graph 3: World final energy consumption by sector 2000-2023",
-    xaxis=dict(range=[from_year, to_year]),
-    legend=dict(
-            x=0.1,  # x-position (0.1 is near left)
-            y=0.7,  # y-position (0.9 is near top)
-            xref="container",
-            yref="container",
-            orientation = 'h'
+    fig3 = make_subplots()
+
+    for sector in ['Industry','Transport','Non-energy use','Commercial and Public Services','Agriculture and forestry',
+        'Residential','Other non-specified','Fishing']:
+
+        df_sector = window_rows(df[df['total final consumption in World'] == sector], from_year, to_year)
+        # Add traces
+        fig3.add_trace(
+            go.Scatter(x=df_sector.Year,
+                y=df_sector.Value/3600, 
+                name=sector,
+                hovertemplate =
+                'Value: %{y:.2e} TWh'+
+                '<br>Year: %{x:.0f}',
+                stackgroup='one')
         )
-)
-# # Set x-axis title
-fig3.update_xaxes(title_text="Year")
 
-# # Set y-axes titles
-fig3.update_yaxes(title_text="Electricity generation (TWh)")
-st.plotly_chart(fig3, use_container_width=True)
-st.caption("""Graph 3: World final energy consumption by sector 2000-2023. Data 
-    from [IEA](https://www.iea.org/world/energy-mix).""")
+    fig3.update_layout(
+        title_text=f"Graph 3: World final energy consumption by sector 2000-2023",
+        xaxis=dict(range=[from_year, to_year]),
+        legend=dict(
+                x=0.1,  # x-position (0.1 is near left)
+                y=0.7,  # y-position (0.9 is near top)
+                xref="container",
+                yref="container",
+                orientation = 'h'
+            )
+    )
+    # # Set x-axis title
+    fig3.update_xaxes(title_text="Year")
+
+    # # Set y-axes titles
+    fig3.update_yaxes(title_text="Electricity generation (TWh)")
+    plotly_chart(fig3, use_container_width=True)
+    st.caption("""Graph 3: World final energy consumption by sector 2000-2023. Data 
+        from [IEA](https://www.iea.org/world/energy-mix).""")
+
+create_energy_sector_section()
 
 ############################################# Historic per capita energy by source plot ###########################################################
-df = get_energy_per_cap_data()
-
-min_value = df['Year'].min()
-max_value = df['Year'].max()
-
-from_year, to_year = st.slider(
-    "Select year range",
-    min_value=min_value,
-    max_value=max_value,
-    format="%0.0f",
-    value=(min_value, max_value),
-    key="historic_per_capita_energy_by_source_slider"
-)
+@section_fragment
+def create_energy_per_cap_section():
+    df = get_energy_per_cap_data()
+
+    min_value = df['Year'].min()
+    max_value = df['Year'].max()
+
+    from_year, to_year = st.slider(
+        "Select year range",
+        min_value=min_value,
+        max_value=max_value,
+        format="%0.0f",
+        value=(min_value, max_value),
+        key="historic_per_capita_energy_by_source_slider"
+    )
 
-fig4 = make_subplots()
+    fig4 = make_subplots()
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    selected_source = st.selectbox("Choose an energy source:", ['Hydro','Nuclear','Gas','Oil','Coal','Wind','Total','Solar'])
+    with col1:
+        selected_source = st.selectbox("Choose an energy source:", ['Hydro','Nuclear','Gas','Oil','Coal','Wind','Total','Solar'])
 
-selected_countries = st.multiselect(
-        'Select Countries',
-        df.Entity.unique(),
-        default = ['United States','China','Russia','European Union (27)'],
-        placeholder = "Choose at least one"
-)
-for country in selected_countries:
-    fig4.add_trace(
-        go.Scatter(x=df.loc[df.Entity == country, 'Year'],
-            y=df.loc[df.Entity == country, selected_source], 
-            name=country,
-            hovertemplate =
-            'Value: %{y:.2e} kWh'+
-            '<br>Year: %{x:.0f}')
+    countries = get_energy_per_cap_by_country()
+    selected_countries = st.multiselect(
+            'Select Countries',
+            list(countries),
+            default = ['United States','China','Russia','European Union (27)'],
+            placeholder = "Choose at least one"
     )
-
-fig4.update_layout(
-    title_text=f"Graph 4: Per capita primary energy consumption ({selected_source}) 1965-2024",
-    xaxis=dict(range=[from_year, to_year]),
-    legend=dict(
-            x=0.1,  # x-position (0.1 is near left)
-            y=0.7,  # y-position (0.9 is near top)
-            xref="container",
-            yref="container",
-            orientation = 'h'
+    for country in selected_countries:
+        df_country = window_rows(countries[country], from_year, to_year)
+        fig4.add_trace(
+            go.Scatter(x=df_country['Year'],
+                y=df_country[selected_source], 
+                name=country,
+                hovertemplate =
+                'Value: %{y:.2e} kWh'+
+                '<br>Year: %{x:.0f}')
         )
-)
-# # Set x-axis title
-fig4.update_xaxes(title_text="Year")
 
-# # Set y-axes titles
-fig4.update_yaxes(title_text="Energy consumption (kWh)")
-st.plotly_chart(fig4, use_container_width=True)
-st.caption("""Graph 4: Per capita primary energy consumption by source 1965-2024. Data 
-    from [Our World in Data](https://ourworldindata.org/energy).""")
+    fig4.update_layout(
+        title_text=f"Graph 4: Per capita primary energy consumption ({selected_source}) 1965-2024",
+        xaxis=dict(range=[from_year, to_year]),
+        legend=dict(
+                x=0.1,  # x-position (0.1 is near left)
+                y=0.7,  # y-position (0.9 is near top)
+                xref="container",
+                yref="container",
+                orientation = 'h'
+            )
+    )
+    # # Set x-axis title
+    fig4.update_xaxes(title_text="Year")
+
+    # # Set y-axes titles
+    fig4.update_yaxes(title_text="Energy consumption (kWh)")
+    plotly_chart(fig4, use_container_width=True)
+    st.caption("""Graph 4: Per capita primary energy consumption by source 1965-2024. Data 
+        from [Our World in Data](https://ourworldindata.org/energy).""")
+
+create_energy_per_cap_section()
 
 ############################################# Historic per capita 2023 map ###########################################################
-df = df.merge(df_el.loc[df_el.Year == 2023, ['Entity','Code']], on='Entity', how='left')
-
-col1, col2 = st.columns(2)
-
-with col1:
-    selected_source = st.selectbox("Choose an energy source:", ['Hydro','Nuclear','Gas','Oil','Coal','Wind','Total','Solar'], 
-        key='source')
-
-fig5 = px.choropleth(df[df.Year == 2023], locations="Code",
-                    color=selected_source, 
-                    hover_name="Entity", # column to add to hover information
-                    color_continuous_scale=px.colors.sequential.turbid,
-                    title=f'Graph 5: Per capita primary energy consumption ({selected_source}) 2023')
-
-fig5.update_layout(
-    coloraxis_colorbar=dict(
-        orientation="h",  # Horizontal orientation
-        yanchor="bottom", # Anchor the legend's bottom to the specified y-coordinate
-        y=-0.3,           # Position below the plot area (adjust as needed)
-        xanchor="left",   # Anchor the legend's left to the specified x-coordinate
-        x=0.13,               # Position at the left edge of the plot area
-        title=f'{selected_source} (kWh)'
-    )
-)
-st.plotly_chart(fig5, use_container_width=True)
-st.caption("""Graph 5: Per capita primary energy consumption by source 2023. Data 
-    from [Our World in Data](https://ourworldindata.org/energy).""")
+@cached_figure
+def create_energy_per_cap_animation(selected_source):
+    # built once per source from the yearly data, the year is then changed in the browser
+    df = get_energy_per_cap_data()
+    df_el = get_electricity_data()
+    df = df.merge(df_el.loc[df_el.Year == 2023, ['Entity','Code']], on='Entity', how='left')
+    return animated_choropleth(df, selected_source,
+        f'Graph 5: Per capita primary energy consumption ({selected_source}) {{year}}', f'{selected_source} (kWh)',
+        px.colors.sequential.turbid)
+
+@section_fragment
+def create_energy_per_cap_map_section():
+    col1, col2 = st.columns(2)
+
+    with col1:
+        selected_source = st.selectbox("Choose an energy source:", ['Hydro','Nuclear','Gas','Oil','Coal','Wind','Total','Solar'], 
+            key='source')
+    with col2:
+        selected_mode = st.radio("Show:", ['2023', 'All years (animated)'], horizontal=True, key='energy_map_mode')
+
+    if selected_mode != '2023':
+        plotly_chart(create_energy_per_cap_animation(selected_source), use_container_width=True)
+    else:
+        df = get_energy_per_cap_data()
+        df_el = get_electricity_data()
+        df = df.merge(df_el.loc[df_el.Year == 2023, ['Entity','Code']], on='Entity', how='left')
+
+        fig5 = px.choropleth(df[df.Year == 2023], locations="Code",
+                            color=selected_source, 
+                            hover_name="Entity", # column to add to hover information
+                            color_continuous_scale=px.colors.sequential.turbid,
+                            title=f'Graph 5: Per capita primary energy consumption ({selected_source}) 2023')
+
+        fig5.update_layout(
+            coloraxis_colorbar=dict(
+                orientation="h",  # Horizontal orientation
+                yanchor="bottom", # Anchor the legend's bottom to the specified y-coordinate
+                y=-0.3,           # Position below the plot area (adjust as needed)
+                xanchor="left",   # Anchor the legend's left to the specified x-coordinate
+                x=0.13,               # Position at the left edge of the plot area
+                title=f'{selected_source} (kWh)'
+            )
+        )
+        plotly_chart(fig5, use_container_width=True)
+    st.caption("""Graph 5: Per capita primary energy consumption by source 2023, or for every year 1965-2024 in the animated 
+        map. Data from [Our World in Data](https://ourworldindata.org/energy).""")
 
-############################################# levelized cost of energy plot ###########################################################
-df = get_levelized_cost_data()
-
-fig6 = make_subplots()
-
-for col in [c for c in df.columns if c != 'Year']:
-    fig6.add_trace(
-        go.Scatter(x=df.Year,
-            y=df[col], 
-            name=col,
-            hovertemplate =
-            'Value: %{y:.0f} $/MWh'+
-            '<br>Year: %{x:.0f}')
-    )
+create_energy_per_cap_map_section()
 
-fig6.update_layout(
-    title_text=f"Graph 6: Levelized cost of energy (LCOE) by year 2009-2024",
-    legend=dict(
-            x=0.1,  # x-position (0.1 is near left)
-            y=0.7,  # y-position (0.9 is near top)
-            xref="container",
-            yref="container",
-            orientation = 'h'
+############################################# levelized cost of energy plot ###########################################################
+@section_fragment
+def create_levelized_cost_section():
+    df = get_levelized_cost_data()
+
+    fig6 = make_subplots()
+
+    for col in [c for c in df.columns if c != 'Year']:
+        fig6.add_trace(
+            go.Scatter(x=df.Year,
+                y=df[col], 
+                name=col,
+                hovertemplate =
+                'Value: %{y:.0f} $/MWh'+
+                '<br>Year: %{x:.0f}')
         )
-)
-# # Set x-axis title
-fig6.update_xaxes(title_text="Year")
-
-# # Set y-axes titles
-fig6.update_yaxes(title_text="LCOE ($/MWh)")
-st.plotly_chart(fig6, use_container_width=True)
-st.caption("""Graph 6: Levelized cost of energy (LCOE) by year 2009-2024. LCOE is a metric that measures the average cost to 
-    build and operate a power plant over its lifetime, divided by the total energy it produces. It's used to compare the 
-    economic viability of different electricity generation technologies, such as solar, wind, or natural gas, by providing a 
-    standardized, lifetime-based cost per unit of energy produced (e.g., dollars per megawatt-hour or $/MWh). The LCOE 
-    represents the minimum price at which energy must be sold to break even over the project's lifespan (Lazard, 2024). Data 
-    from Lazard (2024).""")
+
+    fig6.update_layout(
+        title_text=f"Graph 6: Levelized cost of energy (LCOE) by year 2009-2024",
+        legend=dict(
+                x=0.1,  # x-position (0.1 is near left)
+                y=0.7,  # y-position (0.9 is near top)
+                xref="container",
+                yref="container",
+                orientation = 'h'
+            )
+    )
+    # # Set x-axis title
+    fig6.update_xaxes(title_text="Year")
+
+    # # Set y-axes titles
+    fig6.update_yaxes(title_text="LCOE ($/MWh)")
+    plotly_chart(fig6, use_container_width=True)
+    st.caption("""Graph 6: Levelized cost of energy (LCOE) by year 2009-2024. LCOE is a metric that measures the average cost to 
+        build and operate a power plant over its lifetime, divided by the total energy it produces. It's used to compare the 
+        economic viability of different electricity generation technologies, such as solar, wind, or natural gas, by providing a 
+        standardized, lifetime-based cost per unit of energy produced (e.g., dollars per megawatt-hour or $/MWh). The LCOE 
+        represents the minimum price at which energy must be sold to break even over the project's lifespan (Lazard, 2024). Data 
+        from Lazard (2024).""")
+
+create_levelized_cost_section()
 #################################################### solar power map ######################################################
+@section_fragment
+def create_solar_map_section():
+    st.markdown(f"###### Graph 7: Longterm average of daily totals of potential photovoltaic electricity production")
 
-st.markdown(f"###### Graph 7: Longterm average of daily totals of potential photovoltaic electricity production")
+    plot_map_solar(Path("data/df_wide_solar.csv"), 'Potential (kWh/kWp)', 1.6, 6.4, 'YlOrRd')
 
-plot_map_solar(Path("data/df_wide_solar.csv"), 'Potential (kWh/kWp)', 1.6, 6.4, 'YlOrRd')
+    st.caption("""Graph 7: Longterm average of daily totals of potential photovoltaic (PV) electricity production in kWh/kWp 
+        for a free standing PV power plant with c-Si modules mounted at optimum tilt to maximize monthly PV production. The unit 
+        is kWh/kWp where kWp stands for kilowatt-peak, a unit used to measure the maximum power output of a solar photovoltaic 
+        (PV) system. It represents the system's peak power capacity under standardized laboratory conditions (Solargis, 2024). Data obtained 
+        from the “Global Solar Atlas 2.0, a free, web-based application is developed and operated by the company Solargis s.r.o. 
+        on behalf of the World Bank Group, utilizing Solargis data, with funding provided by the Energy Sector Management 
+        Assistance Program (ESMAP). For additional information: https://globalsolaratlas.info.""")
 
-st.caption("""Graph 7: Longterm average of daily totals of potential photovoltaic (PV) electricity production in kWh/kWp 
-    for a free standing PV power plant with c-Si modules mounted at optimum tilt to maximize monthly PV production. The unit 
-    is kWh/kWp where kWp stands for kilowatt-peak, a unit used to measure the maximum power output of a solar photovoltaic 
-    (PV) system. It represents the system's peak power capacity under standardized laboratory conditions (Solargis, 2024). Data obtained 
-    from the “Global Solar Atlas 2.0, a free, web-based application is developed and operated by the company Solargis s.r.o. 
-    on behalf of the World Bank Group, utilizing Solargis data, with funding provided by the Energy Sector Management 
-    Assistance Program (ESMAP). For additional information: https://globalsolaratlas.info.""")
+create_solar_map_section()
 
 #################################################### wind power map ######################################################
+@section_fragment
+def create_wind_map_section():
+    st.markdown(f"###### Graph 8: Mean wind power density")
 
-st.markdown(f"###### Graph 8: Mean wind power density")
+    plot_map_wind(Path("data/df_wide_wind.csv"), 'Density (W m<sup>-2</sup>)', 0, 1000, 'BuPu')
 
-plot_map_wind(Path("data/df_wide_wind.csv"), 'Density (W m<sup>-2</sup>)', 0, 1000, 'BuPu')
+    st.caption("""Graph 8: Wind power density is the average kinetic energy of the wind per unit area, measured in watts per square 
+        meter (W/m²). It's a key metric for evaluating a wind resource because it accounts for both wind speed and air density, and 
+        higher values indicate a better location for wind energy generation (Davis et. al., 2023). Data obtained from the Global Wind Atlas version 4.0, 
+        a free, web-based application developed, owned and operated by the Technical University of Denmark (DTU). The Global Wind 
+        Atlas version 4.0 is released in partnership with the World Bank Group, utilizing data provided by Vortex, using funding 
+        provided by the Energy Sector Management Assistance Program (ESMAP). For additional information: https://globalwindatlas.info.""")
 
-st.caption("""Graph 8: Wind power density is the average kinetic energy of the wind per unit area, measured in watts per square 
-    meter (W/m²). It's a key metric for evaluating a wind resource because it accounts for both wind speed and air density, and 
-    higher values indicate a better location for wind energy generation (Davis et. al., 2023). Data obtained from the Global Wind Atlas version 4.0, 
-    a free, web-based application developed, owned and operated by the Technical University of Denmark (DTU). The Global Wind 
-    Atlas version 4.0 is released in partnership with the World Bank Group, utilizing data provided by Vortex, using funding 
-    provided by the Energy Sector Management Assistance Program (ESMAP). For additional information: https://globalwindatlas.info.""")
+create_wind_map_section()
 
 ###########################################################################################################################
 st.markdown("### References")
@@ -436,4 +479,4 @@ st.markdown(
     Heathfield, Marko Onninen, Ray Drummond; The Global Wind Atlas: A high-resolution dataset of climatologies and associated 
     web-based application; Bulletin of the American Meteorological Society, Volume 104: Issue 8, Pages E1507-E1525, August 2023, 
     DOI: https://doi.org/10.1175/BAMS-D-21-0075.1"""
-)
\ No newline at end of file
+)
@@ -1,13 +1,25 @@
-import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 from pathlib import Path
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 import cartopy.crs as ccrs
 from cartopy.util import add_cyclic_point
 
+from get_maps import (
+    PROJECTIONS,
+    MAX_INTERACTIVE_CELLS,
+    add_coastlines,
+    add_hatches,
+    get_grid_pyramid,
+    select_grid_level,
+    get_plotly_colorscale,
+    create_interactive_map
+)
+from monitoring import section_fragment, plotly_chart, pyplot, image, payload_panel
+
 st.set_page_config(
     page_title='Climate Change in Graphs: Maps',
     page_icon='sun.svg',
@@ -27,6 +39,9 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+# approximate width in pixels of a map for each screen size
+MAP_WIDTHS = {'Phone': 480, 'Tablet': 960, 'Desktop': 1920}
+
 if 'be_1950to1993_temp' not in st.session_state:
     st.session_state.be_1950to1993_temp = None
 if 'be_1994to2024_temp' not in st.session_state:
@@ -66,53 +81,43 @@ if 'historic_son_precip' not in st.session_state:
 
 
 
+def get_map_level(filePath, max_cells=None):
+    # grid level matching the map width selected in the sidebar
+    return select_grid_level(get_grid_pyramid(filePath), MAP_WIDTHS[st.session_state.map_width], max_cells)
+
 def plot_map(filePath, label, vmin, vmax, cmap, session_state_label, nlevels = 60, scaling = 1):
 
-    if st.session_state[session_state_label] is not None:
-        st.pyplot(st.session_state[session_state_label], width='stretch')
+    if st.session_state.map_mode == 'Interactive':
+        resolution, (lats, lons, data) = get_map_level(filePath, MAX_INTERACTIVE_CELLS)
+        fig = create_interactive_map(lats, lons, data * scaling, label, vmin, vmax, get_plotly_colorscale(cmap))
+        plotly_chart(fig, use_container_width=True)
         return
 
-    df = pd.read_csv(filePath)
+    resolution, (lats, lons, data) = get_map_level(filePath)
 
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
+    # figures are kept per grid level so changing the map width redraws them
+    if st.session_state[session_state_label] is not None and st.session_state[session_state_label][0] == resolution:
+        pyplot(st.session_state[session_state_label][1], width='stretch')
+        return
 
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
+    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=lons)
 
     fig = plt.figure(figsize=(16, 12))
-    ax = plt.axes(projection=ccrs.Mollweide(central_longitude=0, globe=None))
+    ax = plt.axes(projection=PROJECTIONS['Mollweide'])
 
     mappable = ax.contourf(lon_cyclic, lats, data_cyclic * scaling, nlevels, vmin = vmin, vmax = vmax, cmap=cmap,
                  transform=ccrs.PlateCarree())
 
-    ax.coastlines()
+    add_coastlines(ax, 'Mollweide')
 
     fig.colorbar(mappable, label=label, orientation='horizontal', pad=0.01, shrink=0.6) # Add a colorbar
 
-    st.pyplot(fig, width='stretch')
+    pyplot(fig, width='stretch')
     
-    st.session_state[session_state_label] = fig
+    st.session_state[session_state_label] = (resolution, fig)
 
 def plot_tws_map(filePath, label, session_state_label):
 
-    if st.session_state[session_state_label] is not None:
-        st.pyplot(st.session_state[session_state_label], width='stretch')
-        return
-
-    df = pd.read_csv(filePath)
-
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
-
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
-
-    fig = plt.figure(figsize=(16, 12))
-    ax = plt.axes(projection=ccrs.Robinson(central_longitude=0, globe=None))
-
     custom_levels = [-300, -200, -100, -50, -10, 10, 50, 100, 200, 300]
 
     # Define a list of colors
@@ -121,6 +126,24 @@ def plot_tws_map(filePath, label, session_state_label):
     # Create a ListedColormap
     custom_cmap = mcolors.ListedColormap(custom_colors)
 
+    if st.session_state.map_mode == 'Interactive':
+        resolution, (lats, lons, data) = get_map_level(filePath, MAX_INTERACTIVE_CELLS)
+        fig = create_interactive_map(lats, lons, data, label, custom_levels[0], custom_levels[-1],
+            get_plotly_colorscale(custom_cmap, custom_levels), value_format='.0f')
+        plotly_chart(fig, use_container_width=True)
+        return
+
+    resolution, (lats, lons, data) = get_map_level(filePath)
+
+    if st.session_state[session_state_label] is not None and st.session_state[session_state_label][0] == resolution:
+        pyplot(st.session_state[session_state_label][1], width='stretch')
+        return
+
+    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=lons)
+
+    fig = plt.figure(figsize=(16, 12))
+    ax = plt.axes(projection=PROJECTIONS['Robinson'])
+
     # Create a BoundaryNorm instance
     # cmap.N should match the number of colors in custom_cmap
     norm = mcolors.BoundaryNorm(custom_levels, custom_cmap.N)
@@ -128,78 +151,55 @@ def plot_tws_map(filePath, label, session_state_label):
     mappable = ax.contourf(lon_cyclic, lats, data_cyclic, 60, extend='both', vmin = -300, vmax = 300, cmap=custom_cmap,
                  transform=ccrs.PlateCarree(), levels=custom_levels, norm=norm)
 
-    ax.coastlines()
+    add_coastlines(ax, 'Robinson')
 
     fig.colorbar(mappable, label=label, orientation='horizontal', pad=0.01, shrink=0.6) # Add a colorbar
 
-    st.pyplot(fig, width='stretch')
+    pyplot(fig, width='stretch')
     
-    st.session_state[session_state_label] = fig
+    st.session_state[session_state_label] = (resolution, fig)
 
 def plot_hatched_map(mainFilePath, hatchFilePath, session_state_label):
 
-    if st.session_state[session_state_label] is not None:
-        st.pyplot(st.session_state[session_state_label], width='stretch')
+    if st.session_state.map_mode == 'Interactive':
+        resolution, (lats, lons, data) = get_map_level(mainFilePath, MAX_INTERACTIVE_CELLS)
+        sign = get_grid_pyramid(hatchFilePath)[resolution][2]
+        # hatched where model agreement is below 80%
+        fig = create_interactive_map(lats, lons, data, r'% change', -50, 50, get_plotly_colorscale('RdBu'),
+            hatch=(sign >= 0) & (sign < 0.8), value_format='.1f')
+        plotly_chart(fig, use_container_width=True)
         return
 
-    df = pd.read_csv(mainFilePath)
+    resolution, (lats, lons, data) = get_map_level(mainFilePath)
 
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
+    if st.session_state[session_state_label] is not None and st.session_state[session_state_label][0] == resolution:
+        pyplot(st.session_state[session_state_label][1], width='stretch')
+        return
 
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
+    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=lons)
 
     fig = plt.figure(figsize=(16, 12))
-    ax = plt.axes(projection=ccrs.Robinson(central_longitude=0, globe=None))
+    ax = plt.axes(projection=PROJECTIONS['Robinson'])
 
     mappable = ax.contourf(lon_cyclic, lats, data_cyclic, 10, extend='both', vmin = -50, vmax = 50, cmap='RdBu',
              transform=ccrs.PlateCarree())
 
-    ax.coastlines()
+    add_coastlines(ax, 'Robinson')
 
     fig.colorbar(mappable, label=r'% change', orientation='horizontal', pad=0.01, shrink=0.6) # Add a colorbar
 
-    df = pd.read_csv(hatchFilePath)
-
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
-
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
-
-    ax.contourf(lon_cyclic, lats, data_cyclic, 2, colors='none',
-                  hatches=['/', None],
-             transform=ccrs.PlateCarree(), levels=[0, 0.8, 1])
+    add_hatches(ax, hatchFilePath, [0, 0.8, 1], ['/', None], 'Robinson', resolution)
 
-    st.pyplot(fig, width='stretch')
+    pyplot(fig, width='stretch')
     
-    st.session_state[session_state_label] = fig
+    st.session_state[session_state_label] = (resolution, fig)
 
 
 def plot_precip_hatched_map(mainFilePath, hatchFilePath, session_state_label):
 
-    if st.session_state[session_state_label] is not None:
-        st.pyplot(st.session_state[session_state_label], width='stretch')
-        return
-
-    df = pd.read_csv(mainFilePath)
-
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values
-
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
-
-    fig = plt.figure(figsize=(16, 12))
-    ax = plt.axes(projection=ccrs.Robinson(central_longitude=0, globe=None))
-
     custom_levels = [-0.64, -0.32, -0.16, -0.08, -0.04, -0.02, -0.01, 0, 0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64]
 
-    cmap = plt.cm.get_cmap('RdBu') # Or: cmap = matplotlib.colormaps['viridis']
+    cmap = matplotlib.colormaps['RdBu']
 
     sample_points = np.linspace(0, 1, len(custom_levels) - 1)
     sampled_colors = cmap(sample_points)
@@ -207,6 +207,26 @@ def plot_precip_hatched_map(mainFilePath, hatchFilePath, session_state_label):
     # Create a ListedColormap
     custom_cmap = mcolors.ListedColormap(sampled_colors)
 
+    if st.session_state.map_mode == 'Interactive':
+        resolution, (lats, lons, data) = get_map_level(mainFilePath, MAX_INTERACTIVE_CELLS)
+        sign = get_grid_pyramid(hatchFilePath)[resolution][2]
+        # hatched where the trend is not significant (p >= 0.1)
+        fig = create_interactive_map(lats, lons, data, 'mm/day per decade', custom_levels[0], custom_levels[-1],
+            get_plotly_colorscale(custom_cmap, custom_levels), hatch=(sign >= 0.1) & (sign <= 1), value_format='.3f')
+        plotly_chart(fig, use_container_width=True)
+        return
+
+    resolution, (lats, lons, data) = get_map_level(mainFilePath)
+
+    if st.session_state[session_state_label] is not None and st.session_state[session_state_label][0] == resolution:
+        pyplot(st.session_state[session_state_label][1], width='stretch')
+        return
+
+    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=lons)
+
+    fig = plt.figure(figsize=(16, 12))
+    ax = plt.axes(projection=PROJECTIONS['Robinson'])
+
     # Create a BoundaryNorm instance
     # cmap.N should match the number of colors in custom_cmap
     norm = mcolors.BoundaryNorm(custom_levels, custom_cmap.N)
@@ -214,208 +234,228 @@ def plot_precip_hatched_map(mainFilePath, hatchFilePath, session_state_label):
     mappable = ax.contourf(lon_cyclic, lats, data_cyclic, extend='both',
         cmap=custom_cmap, transform=ccrs.PlateCarree(), levels=custom_levels, norm=norm)
 
-    ax.coastlines()
+    add_coastlines(ax, 'Robinson')
 
     fig.colorbar(mappable, label='mm/day per decade', orientation='horizontal', pad=0.01, shrink=0.6) # Add a colorbar
 
-    df = pd.read_csv(hatchFilePath)
-
-    lats = df.latitude
-    df = df.drop(columns=['latitude'])
-    lons = df.columns
-    data = df.values * 1.0
-
-    data_cyclic, lon_cyclic = add_cyclic_point(data, coord=pd.to_numeric(lons))
-
-    ax.contourf(lon_cyclic, lats, data_cyclic, 2, colors='none',
-                  hatches=[None, '/'],
-             transform=ccrs.PlateCarree(), levels=[0, 0.1, 1])
+    add_hatches(ax, hatchFilePath, [0, 0.1, 1], [None, '/'], 'Robinson', resolution)
 
-    st.pyplot(fig, width='stretch')
+    pyplot(fig, width='stretch')
     
-    st.session_state[session_state_label] = fig
+    st.session_state[session_state_label] = (resolution, fig)
 
 ################################################################################
 
 st.sidebar.header("Maps")
 
+# coarser grid levels are used for narrow screens, they contour faster and send less data
+st.sidebar.radio("Map width:", list(MAP_WIDTHS), index=len(MAP_WIDTHS) - 1, key='map_width')
+payload_panel()
+
 st.markdown("# Global spatial distributions of various climate indicators and projections")
 
+# static maps are rendered on the server as images, interactive maps are sent to the browser for zoom, pan and hover
+st.radio("Map rendering:", ['Static', 'Interactive'], horizontal=True, key='map_mode')
+
 #################### Change in surface temperature #############################
-st.write("")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    selected_years = st.selectbox("Select year range:", ['1950-1993', '1994-2024', '2025-2049 (projected)', 
-        '2050-2074 (projected)', '2075-2099 (projected)'])
-
-st.markdown(f"##### Graph 1: Change in surface temperature for {selected_years}")
-
-if selected_years == '1950-1993':
-    plot_map(Path("data/df_be_wide_1950to1993_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
-        'be_1950to1993_temp', scaling = 120)
-elif selected_years == '1994-2024':
-    plot_map(Path("data/df_be_wide_1994to2024_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
-        'be_1994to2024_temp', scaling = 120)
-elif selected_years == '2025-2049 (projected)':
-    plot_map(Path("data/df_cmip6_wide_2025to2049_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
-        'cmip6_2025to2049_temp', scaling = 120)
-elif selected_years == '2050-2074 (projected)':
-    plot_map(Path("data/df_cmip6_wide_2050to2074_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
-        'cmip6_2050to2074_temp', scaling = 120)
-else:
-    plot_map(Path("data/df_cmip6_wide_2075to2099_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
-        'cmip6_2075to2099_temp', scaling = 120)
-
-st.caption("""Graph 1: Global temperature trends in °C per decade in the past (instrumental record) and for future projections 
-    based on 23 CMIP6 model outputs. For CMIP6 projections the median trend for all model outputs is shown for 
-    scenario [SSP2-4.5](https://en.wikipedia.org/wiki/Shared_Socioeconomic_Pathways).
-    CMIP6 data from [Copernicus Climate Change Service, Climate Data Store](https://cds.climate.copernicus.eu/datasets/projections-cmip6?tab=overview).
-    Temperature instrumental record from [The Berkeley Earth Land/Ocean Temperature Record](https://doi.org/10.5194/essd-12-3469-2020).""")
+@section_fragment
+def create_temperature_map_section():
+    st.write("")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        selected_years = st.selectbox("Select year range:", ['1950-1993', '1994-2024', '2025-2049 (projected)', 
+            '2050-2074 (projected)', '2075-2099 (projected)'])
+
+    st.markdown(f"##### Graph 1: Change in surface temperature for {selected_years}")
+
+    if selected_years == '1950-1993':
+        plot_map(Path("data/df_be_wide_1950to1993_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
+            'be_1950to1993_temp', scaling = 120)
+    elif selected_years == '1994-2024':
+        plot_map(Path("data/df_be_wide_1994to2024_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
+            'be_1994to2024_temp', scaling = 120)
+    elif selected_years == '2025-2049 (projected)':
+        plot_map(Path("data/df_cmip6_wide_2025to2049_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
+            'cmip6_2025to2049_temp', scaling = 120)
+    elif selected_years == '2050-2074 (projected)':
+        plot_map(Path("data/df_cmip6_wide_2050to2074_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
+            'cmip6_2050to2074_temp', scaling = 120)
+    else:
+        plot_map(Path("data/df_cmip6_wide_2075to2099_temp.csv"), 'Temperature change (°C per decade)', -2, 2, 'RdBu_r', 
+            'cmip6_2075to2099_temp', scaling = 120)
+
+    st.caption("""Graph 1: Global temperature trends in °C per decade in the past (instrumental record) and for future projections 
+        based on 23 CMIP6 model outputs. For CMIP6 projections the median trend for all model outputs is shown for 
+        scenario [SSP2-4.5](https://en.wikipedia.org/wiki/Shared_Socioeconomic_Pathways).
+        CMIP6 data from [Copernicus Climate Change Service, Climate Data Store](https://cds.climate.copernicus.eu/datasets/projections-cmip6?tab=overview).
+        Temperature instrumental record from [The Berkeley Earth Land/Ocean Temperature Record](https://doi.org/10.5194/essd-12-3469-2020).""")
+
+create_temperature_map_section()
 
 #################### Historic change in monthly average precipitation #############################
-st.write("")
-
-selected_indicator = st.selectbox("Select year range:", [
-        'Change in monthly mean precipitation 1983-2024', 
-        'Change in seasonal mean precipitation 1983-2024 (DJF)', 
-        'Change in seasonal mean precipitation 1983-2024 (MAM)',
-        'Change in seasonal mean precipitation 1983-2024 (JJA)',
-        'Change in seasonal mean precipitation 1983-2024 (SON)'])
-
-st.markdown(f"##### Graph 2: {selected_indicator}")
-
-if selected_indicator == 'Change in monthly mean precipitation 1983-2024':
-    plot_precip_hatched_map(Path("data/df_wide_all_seasons_precip.csv"), Path("data/df_wide_all_seasons_precip_sign.csv"), 
-        'historic_precip')
-elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (DJF)':
-    plot_precip_hatched_map(Path("data/df_wide_DJF_precip.csv"), Path("data/df_wide_DJF_precip_sign.csv"), 
-        'historic_djf_precip')
-elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (MAM)':
-    plot_precip_hatched_map(Path("data/df_wide_MAM_precip.csv"), Path("data/df_wide_MAM_precip_sign.csv"), 
-        'historic_mam_precip')
-elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (JJA)':
-    plot_precip_hatched_map(Path("data/df_wide_JJA_precip.csv"), Path("data/df_wide_JJA_precip_sign.csv"), 
-        'historic_jja_precip')
-elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (SON)':
-    plot_precip_hatched_map(Path("data/df_wide_SON_precip.csv"), Path("data/df_wide_SON_precip_sign.csv"), 
-        'historic_son_precip')
-
-
-st.caption("""Graph 2: Trend in 1983-2024 monthly average precipitation and seasonal average precipitation for the indicated 
-        months. Hatched lines indicate statistical non-significance of trend. Monthly average precipitation data derived from satellite measurements (GPCP) 
-        from [Copernicus Climate Change Service, Climate Data Store](https://cds.climate.copernicus.eu/datasets/satellite-precipitation?tab=download). 
-        Model data and plot adoptation from [IPCC Sixth Assessment Report](https://dx.doi.org/10.5285/bbf5ae3b78c44bf28ccb17b487d58a94)""")
+@section_fragment
+def create_historic_precip_section():
+    st.write("")
+
+    selected_indicator = st.selectbox("Select year range:", [
+            'Change in monthly mean precipitation 1983-2024', 
+            'Change in seasonal mean precipitation 1983-2024 (DJF)', 
+            'Change in seasonal mean precipitation 1983-2024 (MAM)',
+            'Change in seasonal mean precipitation 1983-2024 (JJA)',
+            'Change in seasonal mean precipitation 1983-2024 (SON)'])
+
+    st.markdown(f"##### Graph 2: {selected_indicator}")
+
+    if selected_indicator == 'Change in monthly mean precipitation 1983-2024':
+        plot_precip_hatched_map(Path("data/df_wide_all_seasons_precip.csv"), Path("data/df_wide_all_seasons_precip_sign.csv"), 
+            'historic_precip')
+    elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (DJF)':
+        plot_precip_hatched_map(Path("data/df_wide_DJF_precip.csv"), Path("data/df_wide_DJF_precip_sign.csv"), 
+            'historic_djf_precip')
+    elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (MAM)':
+        plot_precip_hatched_map(Path("data/df_wide_MAM_precip.csv"), Path("data/df_wide_MAM_precip_sign.csv"), 
+            'historic_mam_precip')
+    elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (JJA)':
+        plot_precip_hatched_map(Path("data/df_wide_JJA_precip.csv"), Path("data/df_wide_JJA_precip_sign.csv"), 
+            'historic_jja_precip')
+    elif selected_indicator == 'Change in seasonal mean precipitation 1983-2024 (SON)':
+        plot_precip_hatched_map(Path("data/df_wide_SON_precip.csv"), Path("data/df_wide_SON_precip_sign.csv"), 
+            'historic_son_precip')
+
+
+    st.caption("""Graph 2: Trend in 1983-2024 monthly average precipitation and seasonal average precipitation for the indicated 
+            months. Hatched lines indicate statistical non-significance of trend. Monthly average precipitation data derived from satellite measurements (GPCP) 
+            from [Copernicus Climate Change Service, Climate Data Store](https://cds.climate.copernicus.eu/datasets/satellite-precipitation?tab=download). 
+            Model data and plot adoptation from [IPCC Sixth Assessment Report](https://dx.doi.org/10.5285/bbf5ae3b78c44bf28ccb17b487d58a94)""")
+
+create_historic_precip_section()
 
 #################### Projected change in monthly average precipitation #############################
-st.write("")
-
-selected_indicator = st.selectbox("Select year range:", [ 
-        'Projected change in seasonal mean precipitation (DJF)', 
-        'Projected change in seasonal mean precipitation (MAM)',
-        'Projected change in seasonal mean precipitation (JJA)',
-        'Projected change in seasonal mean precipitation (SON)'])
-
-st.markdown(f"##### Graph 3: {selected_indicator}")
-
-if selected_indicator == 'Projected change in seasonal mean precipitation (DJF)':
-    plot_hatched_map(Path("data/df_djf_precip.csv"), Path("data/df_djf_precip_sign.csv"), 'djf_precip')
-elif selected_indicator == 'Projected change in seasonal mean precipitation (MAM)':
-    plot_hatched_map(Path("data/df_mam_precip.csv"), Path("data/df_mam_precip_sign.csv"), 'mam_precip')
-elif selected_indicator == 'Projected change in seasonal mean precipitation (JJA)':
-    plot_hatched_map(Path("data/df_jja_precip.csv"), Path("data/df_jja_precip_sign.csv"), 'jja_precip')
-else:
-    plot_hatched_map(Path("data/df_son_precip.csv"), Path("data/df_son_precip_sign.csv"), 'son_precip')
-
-st.caption("""Graph 3: Projected long-term relative changes in 
-        seasonal mean precipitation for indicated months. Hatched lines indicate low model 
-        agreement (<80%). All changes are estimated for 2081–2100 relative to the 1995–2014 base period. 
-        Data and plot adoptation from [IPCC Sixth Assessment Report](https://dx.doi.org/10.5285/bbf5ae3b78c44bf28ccb17b487d58a94)""")
+@section_fragment
+def create_projected_precip_section():
+    st.write("")
+
+    selected_indicator = st.selectbox("Select year range:", [ 
+            'Projected change in seasonal mean precipitation (DJF)', 
+            'Projected change in seasonal mean precipitation (MAM)',
+            'Projected change in seasonal mean precipitation (JJA)',
+            'Projected change in seasonal mean precipitation (SON)'])
+
+    st.markdown(f"##### Graph 3: {selected_indicator}")
+
+    if selected_indicator == 'Projected change in seasonal mean precipitation (DJF)':
+        plot_hatched_map(Path("data/df_djf_precip.csv"), Path("data/df_djf_precip_sign.csv"), 'djf_precip')
+    elif selected_indicator == 'Projected change in seasonal mean precipitation (MAM)':
+        plot_hatched_map(Path("data/df_mam_precip.csv"), Path("data/df_mam_precip_sign.csv"), 'mam_precip')
+    elif selected_indicator == 'Projected change in seasonal mean precipitation (JJA)':
+        plot_hatched_map(Path("data/df_jja_precip.csv"), Path("data/df_jja_precip_sign.csv"), 'jja_precip')
+    else:
+        plot_hatched_map(Path("data/df_son_precip.csv"), Path("data/df_son_precip_sign.csv"), 'son_precip')
+
+    st.caption("""Graph 3: Projected long-term relative changes in 
+            seasonal mean precipitation for indicated months. Hatched lines indicate low model 
+            agreement (<80%). All changes are estimated for 2081–2100 relative to the 1995–2014 base period. 
+            Data and plot adoptation from [IPCC Sixth Assessment Report](https://dx.doi.org/10.5285/bbf5ae3b78c44bf28ccb17b487d58a94)""")
+
+create_projected_precip_section()
 
 #################### TWS #############################
-st.write("")
+@section_fragment
+def create_tws_section():
+    st.write("")
+
+    col1, col2 = st.columns(2)
 
-col1, col2 = st.columns(2)
+    with col1:
+        selected_indicator = st.selectbox("Select indicator:", ['Projected changes in terrestrial water storage 2030-2059', 
+            'Projected changes in terrestrial water storage 2070-2099'])
 
-with col1:
-    selected_indicator = st.selectbox("Select indicator:", ['Projected changes in terrestrial water storage 2030-2059', 
-        'Projected changes in terrestrial water storage 2070-2099'])
+    st.markdown(f"##### Graph 4: {selected_indicator}")
 
-st.markdown(f"##### Graph 4: {selected_indicator}")
+    if selected_indicator == 'Projected changes in terrestrial water storage 2030-2059':
+        plot_tws_map(Path("data/df_wide_mid_century_tws.csv"), 'TWS (mm)', 'mid_century_tws')
+    elif selected_indicator == 'Projected changes in terrestrial water storage 2070-2099':
+        plot_tws_map(Path("data/df_wide_late_century_tws.csv"), 'TWS (mm)', 'late_century_tws')
 
-if selected_indicator == 'Projected changes in terrestrial water storage 2030-2059':
-    plot_tws_map(Path("data/df_wide_mid_century_tws.csv"), 'TWS (mm)', 'mid_century_tws')
-elif selected_indicator == 'Projected changes in terrestrial water storage 2070-2099':
-    plot_tws_map(Path("data/df_wide_late_century_tws.csv"), 'TWS (mm)', 'late_century_tws')
+    st.caption("""Graph 4:  The projected changes (multi-model weighted mean) in terrestrial water storage (TWS), averaged for the 
+        mid- (2030–2059) and the late (2070–2099) twenty-first century under future 
+        scenario [RCP6.0](https://en.wikipedia.org/wiki/Representative_Concentration_Pathway). The changes are relative to the 
+        average for the historical baseline period (1976–2005). Terrestrial water storage is the sum of continental water 
+        stored in canopies, snow and ice, rivers, lakes and reservoirs, wetlands, soil and groundwater. It plays a key role in
+        determining water resource availability. Changes in TWS are linked to droughts, floods and global sea level change. 
+        Graph adopted from and data from [Nature Climate Change](https://doi.org/10.1038/s41558-020-00972-w).""")
 
-st.caption("""Graph 4:  The projected changes (multi-model weighted mean) in terrestrial water storage (TWS), averaged for the 
-    mid- (2030–2059) and the late (2070–2099) twenty-first century under future 
-    scenario [RCP6.0](https://en.wikipedia.org/wiki/Representative_Concentration_Pathway). The changes are relative to the 
-    average for the historical baseline period (1976–2005). Terrestrial water storage is the sum of continental water 
-    stored in canopies, snow and ice, rivers, lakes and reservoirs, wetlands, soil and groundwater. It plays a key role in
-    determining water resource availability. Changes in TWS are linked to droughts, floods and global sea level change. 
-    Graph adopted from and data from [Nature Climate Change](https://doi.org/10.1038/s41558-020-00972-w).""")
+create_tws_section()
 
 #################### Drought #############################
-st.write("")
+@section_fragment
+def create_drought_section():
+    st.write("")
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    selected_indicator = st.selectbox("Select indicator:", ['Moderate-to-severe droughts 2006-2099 (change)', 
-        'Extreme-to-exceptional droughts 2006-2099 (change)'])
+    with col1:
+        selected_indicator = st.selectbox("Select indicator:", ['Moderate-to-severe droughts 2006-2099 (change)', 
+            'Extreme-to-exceptional droughts 2006-2099 (change)'])
 
-st.markdown(f"##### Graph 5: {selected_indicator}")
+    st.markdown(f"##### Graph 5: {selected_indicator}")
 
-if selected_indicator == 'Moderate-to-severe droughts 2006-2099 (change)':
-    plot_map(Path("data/df_wide_mod_drought.csv"), 'Frequency change (days per year)', -3.3, 3.3, 'RdBu_r', 
-        'mod_drought', nlevels = 13)
-else:
-    plot_map(Path("data/df_wide_ext_drought.csv"), 'Frequency change (days per year)', -3.3, 3.3, 'RdBu_r', 
-        'ext_drought', nlevels = 13)
+    if selected_indicator == 'Moderate-to-severe droughts 2006-2099 (change)':
+        plot_map(Path("data/df_wide_mod_drought.csv"), 'Frequency change (days per year)', -3.3, 3.3, 'RdBu_r', 
+            'mod_drought', nlevels = 13)
+    else:
+        plot_map(Path("data/df_wide_ext_drought.csv"), 'Frequency change (days per year)', -3.3, 3.3, 'RdBu_r', 
+            'ext_drought', nlevels = 13)
 
-st.caption("""Graph 5: Change (days per year) in the frequency of moderate-to-severe and extreme-to-exceptional droughts for the
-        years 2006–2099. Graph adopted from and data from [Nature Climate Change](https://doi.org/10.1038/s41558-020-00972-w).""")
+    st.caption("""Graph 5: Change (days per year) in the frequency of moderate-to-severe and extreme-to-exceptional droughts for the
+            years 2006–2099. Graph adopted from and data from [Nature Climate Change](https://doi.org/10.1038/s41558-020-00972-w).""")
+
+create_drought_section()
 
 #################### Loss in biodiversity #############################
-st.write("")
+@section_fragment
+def create_biodiversity_section():
+    st.write("")
+
+    col1, col2 = st.columns(2)
 
-col1, col2 = st.columns(2)
+    with col1:
+        selected_map = st.selectbox("Select indicator:", ['Magnitude', 'Abruptness', 'Timing'])
 
-with col1:
-    selected_map = st.selectbox("Select indicator:", ['Magnitude', 'Abruptness', 'Timing'])
+    def show_map(title, map_path, colorbar_path):
 
-def show_map(title, map_path, colorbar_path):
+        st.markdown(title)
 
-    st.markdown(title)
+        with st.container(gap = None):
 
-    with st.container(gap = None):
+            image(map_path)
 
-        st.image(map_path)
+            co1, col2, col3 = st.columns([1.5,1,1.5])
 
-        co1, col2, col3 = st.columns([1.5,1,1.5])
+            with col2:
+                image(colorbar_path)
 
-        with col2:
-            st.image(colorbar_path)
+    if selected_map == "Magnitude":
+        show_map("##### Graph 6: Percentage of species exposed to potentially dangerous climate by 2100",
+            Path("data/MagnitudeEckertGGplot.svg"), Path("data/Fig2_ScaleBarMagnitude.svg"))
+    elif selected_map == "Abruptness":
+        show_map("##### Graph 6: Percentage of species exposed to potentially dangerous climate at a time of maximum exposure",
+            Path("data/AbruptnessEckertGGplot.svg"), Path("data/Fig2_ScaleBarAbruptness.svg"))
+    else:
+        show_map("##### Graph 6: Median year of species exposed to potentially dangerous climate",
+            Path("data/TimingEckertGGplot.svg"), Path("data/Fig2_ScaleBarTiming.svg"))
 
-if selected_map == "Magnitude":
-    show_map("##### Graph 6: Percentage of species exposed to potentially dangerous climate by 2100",
-        Path("data/MagnitudeEckertGGplot.svg"), Path("data/Fig2_ScaleBarMagnitude.svg"))
-elif selected_map == "Abruptness":
-    show_map("##### Graph 6: Percentage of species exposed to potentially dangerous climate at a time of maximum exposure",
-        Path("data/AbruptnessEckertGGplot.svg"), Path("data/Fig2_ScaleBarAbruptness.svg"))
-else:
-    show_map("##### Graph 6: Median year of species exposed to potentially dangerous climate",
-        Path("data/TimingEckertGGplot.svg"), Path("data/Fig2_ScaleBarTiming.svg"))
+    st.caption("""Graph 6: Three different indicators quantifying potential loss of biodiversity in the future based on 
+        scenario [SSP2-4.5](https://en.wikipedia.org/wiki/Shared_Socioeconomic_Pathways) and data on over 30,000 marine and 
+        terrestrial species. *Magnitude* indicates what percentage of
+        local species will be subjected to climate conditions threatening to their survival by the year 2100. *Abruptness* indicates 
+        what percentage of local species will be subjected to these conditions at the same time interval (a decade), the interval at 
+        which most of the species in question will be exposed. *Timing* then indicates the median year of exposure for all local species
+        that will be exposed by the year 2100. Data and plots from [Nature](https://doi.org/10.1038/s41586-020-2189-9).""")
 
-st.caption("""Graph 6: Three different indicators quantifying potential loss of biodiversity in the future based on 
-    scenario [SSP2-4.5](https://en.wikipedia.org/wiki/Shared_Socioeconomic_Pathways) and data on over 30,000 marine and 
-    terrestrial species. *Magnitude* indicates what percentage of
-    local species will be subjected to climate conditions threatening to their survival by the year 2100. *Abruptness* indicates 
-    what percentage of local species will be subjected to these conditions at the same time interval (a decade), the interval at 
-    which most of the species in question will be exposed. *Timing* then indicates the median year of exposure for all local species
-    that will be exposed by the year 2100. Data and plots from [Nature](https://doi.org/10.1038/s41586-020-2189-9).""")
+create_biodiversity_section()
 
 #################### References #############################
 st.markdown("### References")
@@ -469,4 +509,4 @@ st.markdown(
     The projected timing of abrupt ecological disruption from climate change. 
     Nature 580, 496–501 (2020). https://doi.org/10.1038/s41586-020-2189-9.
     (Accessed on 2025-10-06)"""
-)
\ No newline at end of file
+)
@@ -1,4 +1,3 @@
-import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
@@ -12,6 +11,8 @@ from get_data import (
     get_ecs_data,
     get_tcr_data
 )
+from monitoring import section_fragment, plotly_chart, payload_panel
+from plotting import cached_figure, band_trace
 
 st.set_page_config(
     page_title='Climate Change in Graphs: Quantities',
@@ -56,476 +57,502 @@ def plot_quantity_with_uncertainty_by_year(fig, years, quantity, quantity_lower,
     )
 
     fig.add_trace(
-        go.Scatter(x=pd.concat([years, years[::-1]]),
-            y=pd.concat([quantity_upper, quantity_lower[::-1]]), 
+        band_trace(x=years,
+            y_lower=quantity_lower,
+            y_upper=quantity_upper,
             name=name + ' uncertainty',
-            fill='toself',
-            fillcolor=f'rgba({color[0]},{color[1]},{color[2]},0.2)',
-            hoverinfo="skip",
-            line=dict(color=f'rgba({color[0]},{color[1]},{color[2]},0.2)', width=0.1),
+            color=f'rgba({color[0]},{color[1]},{color[2]},0.2)',
             showlegend=False)
     )
     return fig
 
 st.sidebar.header("Quantities")
+payload_panel()
 
 st.markdown("# Physical quantities")
 
 #################### Evolution of ERF #############################
+@cached_figure
+def create_erf_figure():
+    df, df_05, df_95 = get_erf_historic_data()
+
+    fig1 = make_subplots()
+
+    names = ['co2', 'ch4', 'n2o', 'other_wmghg', 'o3', 'volcanic', 'solar', 'aerosol','land_use']
+    labels = ['Carbon dioxide (CO<sub>2</sub>)','Methane (CH<sub>4</sub>)','Nitrous oxide (N<sub>2</sub>O)',
+        'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Volcanic','Solar','Aerosol','Land use (albedo)']
+    colors = [(52, 91, 235),(59, 156, 23),(209, 109, 197),(205, 209, 75),(55, 179, 204),(99, 90, 43),(217, 188, 28),
+        (105, 90, 98),(145, 207, 207)]
+
+    for var_name, label, color in zip(names, labels, colors):
+        fig1 = plot_quantity_with_uncertainty_by_year(fig1, df.year, df[var_name], df_05[var_name], df_95[var_name], 
+            label, 'W m<sup>-2</sup>', color)
+
+    fig1.add_trace(
+        go.Scatter(x=df.year,
+            y=df['total'], 
+            name='Total',
+            hovertemplate =
+            'Value: %{y:.3f} W m<sup>-2</sup>' + 
+            '<br>Year: %{x:.0f}',
+            line=dict(color='black', width=0.7))
+    )
 
-df, df_05, df_95 = get_erf_historic_data()
-
-fig1 = make_subplots()
-
-names = ['co2', 'ch4', 'n2o', 'other_wmghg', 'o3', 'volcanic', 'solar', 'aerosol','land_use']
-labels = ['Carbon dioxide (CO<sub>2</sub>)','Methane (CH<sub>4</sub>)','Nitrous oxide (N<sub>2</sub>O)',
-    'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Volcanic','Solar','Aerosol','Land use (albedo)']
-colors = [(52, 91, 235),(59, 156, 23),(209, 109, 197),(205, 209, 75),(55, 179, 204),(99, 90, 43),(217, 188, 28),
-    (105, 90, 98),(145, 207, 207)]
+    fig1.update_layout(
+        title_text=f"Graph 1: Evolution of effective radiative forcing (ERF) by source 1750-2019",
 
-for var_name, label, color in zip(names, labels, colors):
-    fig1 = plot_quantity_with_uncertainty_by_year(fig1, df.year, df[var_name], df_05[var_name], df_95[var_name], 
-        label, 'W m<sup>-2</sup>', color)
+    )
+    # Set x-axis title
+    fig1.update_xaxes(title_text="Year")
 
-fig1.add_trace(
-    go.Scatter(x=df.year,
-        y=df['total'], 
-        name='Total',
-        hovertemplate =
-        'Value: %{y:.3f} W m<sup>-2</sup>' + 
-        '<br>Year: %{x:.0f}',
-        line=dict(color='black', width=0.7))
-)
+    # Set y-axes titles
+    fig1.update_yaxes(title_text="Effective radiative forcing (W m<sup>-2</sup>)")
+    return fig1
 
-fig1.update_layout(
-    title_text=f"Graph 1: Evolution of effective radiative forcing (ERF) by source 1750-2019",
-    
-)
-# Set x-axis title
-fig1.update_xaxes(title_text="Year")
+@section_fragment
+def create_erf_section():
+    plotly_chart(create_erf_figure(), use_container_width=True)
 
-# Set y-axes titles
-fig1.update_yaxes(title_text="Effective radiative forcing (W m<sup>-2</sup>)")
-st.plotly_chart(fig1, use_container_width=True)
+    st.caption(f"""Graph 1: Evolution of effective radiative forcing (ERF) by source 1750-2019. Effective radiative forcing is the energy 
+        gained or lost by the Earth that results from an event or activity, such as the addition of greenhouse gases (GHGs) or aerosols. 
+        It is a fundamental driver of changes in the energy budget of the Earth at the top of the atmosphere (Forster et. al., 2021). 
+        Shaded regions show the "very likely" (5-95%) ranges. 
+        Data from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7506/0).""")
 
-st.caption(f"""Graph 1: Evolution of effective radiative forcing (ERF) by source 1750-2019. Effective radiative forcing is the energy 
-    gained or lost by the Earth that results from an event or activity, such as the addition of greenhouse gases (GHGs) or aerosols. 
-    It is a fundamental driver of changes in the energy budget of the Earth at the top of the atmosphere (Forster et. al., 2021). 
-    Shaded regions show the "very likely" (5-95%) ranges. 
-    Data from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7506/0).""")
+create_erf_section()
 
 #################### Change in ERF #############################
-
-labels = ['Carbon dioxide (CO<sub>2</sub>)', 'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Water vapour (Stratosphere)', 
-    'Albedo', 'Contrails', 'Aerosols', 'Total anthropogenic', 'Solar']
-
-data = [[2.16, 0.25, 0.26, 0, True, 'rgb(201, 14, 55)', 0, 'Carbon dioxide (CO<sub>2</sub>)', False],
-        [0.54, 0.11, 0.11, 0, False, 'rgb(143, 14, 42)', 1, 'Methane (CH<sub>4</sub>)', True],
-        [0.21, 0.03, 0.03, 0.54, False, 'rgb(232, 93, 23)', 1, 'Nitrous oxide (N<sub>2</sub>O)', True],
-        [0.41, 0.08, 0.08, 0.75, False, 'rgb(232, 186, 35)', 1, 'Halogens', True],
-        [0.47, 0.24, 0.23, 0, True, 'rgb(201, 14, 55)', 2, 'Ozone (O<sub>3</sub>)', False],
-        [0.05, 0.05, 0.05, 0, True, 'rgb(201, 14, 55)', 3, 'Water vapour (Stratosphere)', False],
-        [0.08, 0.1, 0.08, 0, True, 'rgb(219, 114, 132)', 4, 'Dark particles on ice', True],
-        [-0.2, 0.1, 0.1, -0.2, False, 'rgb(8, 10, 102)', 4, 'Land use', True],
-        [0.06, 0.04, 0.04, 0, True, 'rgb(201, 14, 55)', 5, 'Contrails', False],
-        [-0.22, 0.26, 0.25, -0.22, False, 'rgb(33, 36, 184)', 6, 'Aerosol-radiation', True],
-        [-0.84, 0.59, 0.61, -1.06, False, 'rgb(108, 110, 186)', 6, 'Aerosol-cloud', True],
-        [2.72, 0.76, 0.76, 0, True, 'rgb(201, 14, 55)', 7, 'Total anthropogenic', False],
-        [-0.02, 0.08, 0.06, -0.02, False, 'rgb(160, 70, 179)', 8, 'Solar', False]]  
-
-fig2 = go.Figure()
-
-for i,row in enumerate(data):
-
-    bar_lenghts = [0] * len(labels)
-    bar_lenghts[row[6]] = np.abs(row[0])
-    pos_errors = [0] * len(labels)
-    pos_errors[row[6]] = row[1]
-    neg_errors = [0] * len(labels)
-    neg_errors[row[6]] = row[2]
-    bases = [99] * len(labels)
-    bases[row[6]] = row[3]
-
-    customdata = np.array([row[0:3]] * len(labels))
-    customdata[:,1] = customdata[:,0] + customdata[:,1]
-    customdata[:,2] = customdata[:,0] - customdata[:,2]
+@section_fragment
+def create_erf_change_section():
+    labels = ['Carbon dioxide (CO<sub>2</sub>)', 'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Water vapour (Stratosphere)', 
+        'Albedo', 'Contrails', 'Aerosols', 'Total anthropogenic', 'Solar']
+
+    data = [[2.16, 0.25, 0.26, 0, True, 'rgb(201, 14, 55)', 0, 'Carbon dioxide (CO<sub>2</sub>)', False],
+            [0.54, 0.11, 0.11, 0, False, 'rgb(143, 14, 42)', 1, 'Methane (CH<sub>4</sub>)', True],
+            [0.21, 0.03, 0.03, 0.54, False, 'rgb(232, 93, 23)', 1, 'Nitrous oxide (N<sub>2</sub>O)', True],
+            [0.41, 0.08, 0.08, 0.75, False, 'rgb(232, 186, 35)', 1, 'Halogens', True],
+            [0.47, 0.24, 0.23, 0, True, 'rgb(201, 14, 55)', 2, 'Ozone (O<sub>3</sub>)', False],
+            [0.05, 0.05, 0.05, 0, True, 'rgb(201, 14, 55)', 3, 'Water vapour (Stratosphere)', False],
+            [0.08, 0.1, 0.08, 0, True, 'rgb(219, 114, 132)', 4, 'Dark particles on ice', True],
+            [-0.2, 0.1, 0.1, -0.2, False, 'rgb(8, 10, 102)', 4, 'Land use', True],
+            [0.06, 0.04, 0.04, 0, True, 'rgb(201, 14, 55)', 5, 'Contrails', False],
+            [-0.22, 0.26, 0.25, -0.22, False, 'rgb(33, 36, 184)', 6, 'Aerosol-radiation', True],
+            [-0.84, 0.59, 0.61, -1.06, False, 'rgb(108, 110, 186)', 6, 'Aerosol-cloud', True],
+            [2.72, 0.76, 0.76, 0, True, 'rgb(201, 14, 55)', 7, 'Total anthropogenic', False],
+            [-0.02, 0.08, 0.06, -0.02, False, 'rgb(160, 70, 179)', 8, 'Solar', False]]  
+
+    fig2 = go.Figure()
+
+    for i,row in enumerate(data):
+
+        bar_lenghts = [0] * len(labels)
+        bar_lenghts[row[6]] = np.abs(row[0])
+        pos_errors = [0] * len(labels)
+        pos_errors[row[6]] = row[1]
+        neg_errors = [0] * len(labels)
+        neg_errors[row[6]] = row[2]
+        bases = [99] * len(labels)
+        bases[row[6]] = row[3]
+
+        customdata = np.array([row[0:3]] * len(labels))
+        customdata[:,1] = customdata[:,0] + customdata[:,1]
+        customdata[:,2] = customdata[:,0] - customdata[:,2]
+
+        fig2.add_trace(go.Bar(
+            name=row[7],
+            x=labels,
+            y=bar_lenghts,
+            hovertemplate =
+                'Value: %{customdata[0]:.2f} W m<sup>-2</sup>'+
+                '<br>Range: [%{customdata[2]:.2f} to %{customdata[1]:.2f}] W m<sup>-2</sup>',
+            customdata = customdata,
+            error_y=dict(
+                    type='data',  # Indicates error values are provided as data
+                    symmetric=False,  # Crucial for non-symmetric error bars
+                    array=pos_errors,  # Positive error values
+                    arrayminus=neg_errors,  # Negative error values
+                    visible=row[4]
+                ),
+            base=bases,
+            showlegend=row[8],
+            marker_color=row[5]
+        ))
 
     fig2.add_trace(go.Bar(
-        name=row[7],
-        x=labels,
-        y=bar_lenghts,
-        hovertemplate =
-            'Value: %{customdata[0]:.2f} W m<sup>-2</sup>'+
-            '<br>Range: [%{customdata[2]:.2f} to %{customdata[1]:.2f}] W m<sup>-2</sup>',
-        customdata = customdata,
-        error_y=dict(
-                type='data',  # Indicates error values are provided as data
-                symmetric=False,  # Crucial for non-symmetric error bars
-                array=pos_errors,  # Positive error values
-                arrayminus=neg_errors,  # Negative error values
-                visible=row[4]
-            ),
-        base=bases,
-        showlegend=row[8],
-        marker_color=row[5]
+            name='Invisible bars',
+            x=labels,
+            y=[0] * len(labels),
+            error_y=dict(
+                    type='data',  # Indicates error values are provided as data
+                    symmetric=False,  # Crucial for non-symmetric error bars
+                    array=[0, 0.22, 0, 0, 0.1, 0, 0.85, 0, 0.08],  # Positive error values
+                    arrayminus=[0, 0.22, 0, 0, 0.1, 0, 0.86, 0, 0.06],  # Negative error values
+                    visible=True
+                ),
+            base=[99, 1.16, 99, 99, -0.2, 99, -1.06, 99, -0.02],
+            showlegend=False
     ))
 
-fig2.add_trace(go.Bar(
-        name='Invisible bars',
-        x=labels,
-        y=[0] * len(labels),
-        error_y=dict(
-                type='data',  # Indicates error values are provided as data
-                symmetric=False,  # Crucial for non-symmetric error bars
-                array=[0, 0.22, 0, 0, 0.1, 0, 0.85, 0, 0.08],  # Positive error values
-                arrayminus=[0, 0.22, 0, 0, 0.1, 0, 0.86, 0, 0.06],  # Negative error values
-                visible=True
-            ),
-        base=[99, 1.16, 99, 99, -0.2, 99, -1.06, 99, -0.02],
-        showlegend=False
-))
-
-fig2.update_layout(
-    barmode='stack', 
-    title='Graph 2: Change in effective radiative forcing (ERF) by source 1750-2019',
-    yaxis=dict(range=[-2, 4]),
-    )
-fig2.update_yaxes(title_text="Effective radiative forcing (W m<sup>-2</sup>)")
+    fig2.update_layout(
+        barmode='stack', 
+        title='Graph 2: Change in effective radiative forcing (ERF) by source 1750-2019',
+        yaxis=dict(range=[-2, 4]),
+        )
+    fig2.update_yaxes(title_text="Effective radiative forcing (W m<sup>-2</sup>)")
 
-st.plotly_chart(fig2, use_container_width=True)
+    plotly_chart(fig2, use_container_width=True)
 
-st.caption("""Graph 2: Change in effective radiative forcing (ERF) by source 1750-2019 by forcing agents. Solid bars represent best 
-    estimates, and "very likely" (5–95%) ranges are given by error bars. Plot adopted from Forster et. al. (2021)""")
+    st.caption("""Graph 2: Change in effective radiative forcing (ERF) by source 1750-2019 by forcing agents. Solid bars represent best 
+        estimates, and "very likely" (5–95%) ranges are given by error bars. Plot adopted from Forster et. al. (2021)""")
 
-#################### Evolution of warming #############################
-
-df = get_warming_historic_data()
+create_erf_change_section()
 
-fig3 = make_subplots()
-
-names = ['CO2', 'CH4', 'N2O', 'otherGHG', 'O3', 'volcanic', 'solar', 'aerosol']
-labels = ['Carbon dioxide (CO<sub>2</sub>)','Methane (CH<sub>4</sub>)','Nitrous oxide (N<sub>2</sub>O)',
-    'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Volcanic','Solar','Aerosol']
-colors = [(52, 91, 235),(59, 156, 23),(209, 109, 197),(205, 209, 75),(55, 179, 204),(99, 90, 43),(217, 188, 28),
-    (105, 90, 98)]
+#################### Evolution of warming #############################
+@section_fragment
+def create_warming_section():
+    df = get_warming_historic_data()
+
+    fig3 = make_subplots()
+
+    names = ['CO2', 'CH4', 'N2O', 'otherGHG', 'O3', 'volcanic', 'solar', 'aerosol']
+    labels = ['Carbon dioxide (CO<sub>2</sub>)','Methane (CH<sub>4</sub>)','Nitrous oxide (N<sub>2</sub>O)',
+        'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Volcanic','Solar','Aerosol']
+    colors = [(52, 91, 235),(59, 156, 23),(209, 109, 197),(205, 209, 75),(55, 179, 204),(99, 90, 43),(217, 188, 28),
+        (105, 90, 98)]
+
+    for var_name, label, color in zip(names, labels, colors):
+        fig3 = plot_quantity_with_uncertainty_by_year(fig3, df.year, df[var_name + '_best'], df[var_name + '_p05'], 
+            df[var_name + '_p95'], label, '°C', color)
+
+    fig3.add_trace(
+        go.Scatter(x=df.year,
+            y=df['total_best'], 
+            name='Total',
+            hovertemplate =
+            'Value: %{y:.3f} °C' + 
+            '<br>Year: %{x:.0f}',
+            line=dict(color='black', width=0.7))
+    )
 
-for var_name, label, color in zip(names, labels, colors):
-    fig3 = plot_quantity_with_uncertainty_by_year(fig3, df.year, df[var_name + '_best'], df[var_name + '_p05'], 
-        df[var_name + '_p95'], label, '°C', color)
+    fig3.update_layout(
+        title_text=f"Graph 3: Evolution of attributed warming due to ERF by source 1750-2019",
 
-fig3.add_trace(
-    go.Scatter(x=df.year,
-        y=df['total_best'], 
-        name='Total',
-        hovertemplate =
-        'Value: %{y:.3f} °C' + 
-        '<br>Year: %{x:.0f}',
-        line=dict(color='black', width=0.7))
-)
+    )
+    # Set x-axis title
+    fig3.update_xaxes(title_text="Year")
 
-fig3.update_layout(
-    title_text=f"Graph 3: Evolution of attributed warming due to ERF by source 1750-2019",
-    
-)
-# Set x-axis title
-fig3.update_xaxes(title_text="Year")
+    # Set y-axes titles
+    fig3.update_yaxes(title_text="Attributed warming (°C)")
+    plotly_chart(fig3, use_container_width=True)
 
-# Set y-axes titles
-fig3.update_yaxes(title_text="Attributed warming (°C)")
-st.plotly_chart(fig3, use_container_width=True)
 
+    st.caption(f"""Graph 3: Evolution of attributed warming due to ERF by source 1750-2019. The degree of warming resulting from ERF is 
+        produced using emulation. The results shown are the medians from a 2237-member ensemble (Forster et. al, 2021). 
+        Shaded regions show the "very likely" (5-95%) ranges. 
+        Data and figure adoption from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7512).""")
 
-st.caption(f"""Graph 3: Evolution of attributed warming due to ERF by source 1750-2019. The degree of warming resulting from ERF is 
-    produced using emulation. The results shown are the medians from a 2237-member ensemble (Forster et. al, 2021). 
-    Shaded regions show the "very likely" (5-95%) ranges. 
-    Data and figure adoption from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7512).""")
+create_warming_section()
 
 #################### Change in Temperature #############################
-
-labels = ['Carbon dioxide (CO<sub>2</sub>)', 'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Water vapour (Stratosphere)', 
-    'Albedo', 'Contrails', 'Aerosols', 'Solar', 'Volcanic', 'Total']
-
-data = [[1.01, 0.40, 0.27, 0, True, 'rgb(201, 14, 55)', 0, 'Carbon dioxide (CO<sub>2</sub>)', False],
-        [0.28, 0.11, 0.09, 0, False, 'rgb(143, 14, 42)', 1, 'Methane (CH<sub>4</sub>)', True],
-        [0.10, 0.04, 0.03, 0.28, False, 'rgb(232, 93, 23)', 1, 'Nitrous oxide (N<sub>2</sub>O)', True],
-        [0.19, 0.08, 0.05, 0.38, False, 'rgb(232, 186, 35)', 1, 'Halogens', True],
-        [0.23, 0.16, 0.12, 0, True, 'rgb(201, 14, 55)', 2, 'Ozone (O<sub>3</sub>)', False],
-        [0.02, 0.04, 0.02, 0, True, 'rgb(201, 14, 55)', 3, 'Water vapour (Stratosphere)', False],
-        [0.04, 0.06, 0.04, 0, True, 'rgb(219, 114, 132)', 4, 'Dark particles on ice', True],
-        [-0.11, 0.06, 0.07, -0.11, False, 'rgb(8, 10, 102)', 4, 'Land use', True],
-        [0.02, 0.03, 0.01, 0, True, 'rgb(201, 14, 55)', 5, 'Contrails', False],
-        [-0.13, 0.12, 0.15, -0.13, False, 'rgb(33, 36, 184)', 6, 'Aerosol-radiation', True],
-        [-0.38, 0.26, 0.39, -0.51, False, 'rgb(108, 110, 186)', 6, 'Aerosol-cloud', True],
-        [-0.01, 0.05, 0.03, -0.01, False, 'rgb(160, 70, 179)', 7, 'Solar', False],
-        [-0.02, 0.01, 0.01, -0.02, False, 'rgb(160, 70, 179)', 8, 'Volcanic', False],  
-        [1.27, 0.37, 0.31, 0, True, 'rgb(201, 14, 55)', 9, 'Total', False]]
-
-fig4 = go.Figure()
-
-for i,row in enumerate(data):
-
-    bar_lenghts = [0] * len(labels)
-    bar_lenghts[row[6]] = np.abs(row[0])
-    pos_errors = [0] * len(labels)
-    pos_errors[row[6]] = row[1]
-    neg_errors = [0] * len(labels)
-    neg_errors[row[6]] = row[2]
-    bases = [99] * len(labels)
-    bases[row[6]] = row[3]
-
-    customdata = np.array([row[0:3]] * len(labels))
-    customdata[:,1] = customdata[:,0] + customdata[:,1]
-    customdata[:,2] = customdata[:,0] - customdata[:,2]
+@section_fragment
+def create_warming_change_section():
+    labels = ['Carbon dioxide (CO<sub>2</sub>)', 'Other well-mixed GHG','Ozone (O<sub>3</sub>)', 'Water vapour (Stratosphere)', 
+        'Albedo', 'Contrails', 'Aerosols', 'Solar', 'Volcanic', 'Total']
+
+    data = [[1.01, 0.40, 0.27, 0, True, 'rgb(201, 14, 55)', 0, 'Carbon dioxide (CO<sub>2</sub>)', False],
+            [0.28, 0.11, 0.09, 0, False, 'rgb(143, 14, 42)', 1, 'Methane (CH<sub>4</sub>)', True],
+            [0.10, 0.04, 0.03, 0.28, False, 'rgb(232, 93, 23)', 1, 'Nitrous oxide (N<sub>2</sub>O)', True],
+            [0.19, 0.08, 0.05, 0.38, False, 'rgb(232, 186, 35)', 1, 'Halogens', True],
+            [0.23, 0.16, 0.12, 0, True, 'rgb(201, 14, 55)', 2, 'Ozone (O<sub>3</sub>)', False],
+            [0.02, 0.04, 0.02, 0, True, 'rgb(201, 14, 55)', 3, 'Water vapour (Stratosphere)', False],
+            [0.04, 0.06, 0.04, 0, True, 'rgb(219, 114, 132)', 4, 'Dark particles on ice', True],
+            [-0.11, 0.06, 0.07, -0.11, False, 'rgb(8, 10, 102)', 4, 'Land use', True],
+            [0.02, 0.03, 0.01, 0, True, 'rgb(201, 14, 55)', 5, 'Contrails', False],
+            [-0.13, 0.12, 0.15, -0.13, False, 'rgb(33, 36, 184)', 6, 'Aerosol-radiation', True],
+            [-0.38, 0.26, 0.39, -0.51, False, 'rgb(108, 110, 186)', 6, 'Aerosol-cloud', True],
+            [-0.01, 0.05, 0.03, -0.01, False, 'rgb(160, 70, 179)', 7, 'Solar', False],
+            [-0.02, 0.01, 0.01, -0.02, False, 'rgb(160, 70, 179)', 8, 'Volcanic', False],  
+            [1.27, 0.37, 0.31, 0, True, 'rgb(201, 14, 55)', 9, 'Total', False]]
+
+    fig4 = go.Figure()
+
+    for i,row in enumerate(data):
+
+        bar_lenghts = [0] * len(labels)
+        bar_lenghts[row[6]] = np.abs(row[0])
+        pos_errors = [0] * len(labels)
+        pos_errors[row[6]] = row[1]
+        neg_errors = [0] * len(labels)
+        neg_errors[row[6]] = row[2]
+        bases = [99] * len(labels)
+        bases[row[6]] = row[3]
+
+        customdata = np.array([row[0:3]] * len(labels))
+        customdata[:,1] = customdata[:,0] + customdata[:,1]
+        customdata[:,2] = customdata[:,0] - customdata[:,2]
+
+        fig4.add_trace(go.Bar(
+            name=row[7],
+            x=labels,
+            y=bar_lenghts,
+            hovertemplate =
+                'Value: %{customdata[0]:.2f} °C'+
+                '<br>Range: [%{customdata[2]:.2f} to %{customdata[1]:.2f}] °C',
+            customdata = customdata,
+            error_y=dict(
+                    type='data',  # Indicates error values are provided as data
+                    symmetric=False,  # Crucial for non-symmetric error bars
+                    array=pos_errors,  # Positive error values
+                    arrayminus=neg_errors,  # Negative error values
+                    visible=row[4]
+                ),
+            base=bases,
+            showlegend=row[8],
+            marker_color=row[5]
+        ))
 
     fig4.add_trace(go.Bar(
-        name=row[7],
-        x=labels,
-        y=bar_lenghts,
-        hovertemplate =
-            'Value: %{customdata[0]:.2f} °C'+
-            '<br>Range: [%{customdata[2]:.2f} to %{customdata[1]:.2f}] °C',
-        customdata = customdata,
-        error_y=dict(
-                type='data',  # Indicates error values are provided as data
-                symmetric=False,  # Crucial for non-symmetric error bars
-                array=pos_errors,  # Positive error values
-                arrayminus=neg_errors,  # Negative error values
-                visible=row[4]
-            ),
-        base=bases,
-        showlegend=row[8],
-        marker_color=row[5]
+            name='Invisible bars',
+            x=labels,
+            y=[0] * len(labels),
+            error_y=dict(
+                    type='data',  # Indicates error values are provided as data
+                    symmetric=False,  # Crucial for non-symmetric error bars
+                    array=[0, 0.23, 0, 0, 0.06, 0, 0.38, 0.05, 0.01, 0],  # Positive error values
+                    arrayminus=[0, 0.17, 0, 0, 0.07, 0, 0.54, 0.03, 0.01, 0],  # Negative error values
+                    visible=True
+                ),
+            base=[99, 0.57, 99, 99, -0.11, 99, -0.51, -0.01, -0.02, 99],
+            showlegend=False
     ))
 
-fig4.add_trace(go.Bar(
-        name='Invisible bars',
-        x=labels,
-        y=[0] * len(labels),
-        error_y=dict(
-                type='data',  # Indicates error values are provided as data
-                symmetric=False,  # Crucial for non-symmetric error bars
-                array=[0, 0.23, 0, 0, 0.06, 0, 0.38, 0.05, 0.01, 0],  # Positive error values
-                arrayminus=[0, 0.17, 0, 0, 0.07, 0, 0.54, 0.03, 0.01, 0],  # Negative error values
-                visible=True
-            ),
-        base=[99, 0.57, 99, 99, -0.11, 99, -0.51, -0.01, -0.02, 99],
-        showlegend=False
-))
-
-fig4.update_layout(
-    barmode='stack', 
-    title='Graph 4: Change in attributed warming due to ERF by source 1750-2019',
-    yaxis=dict(range=[-1.5, 2]),
-    )
-fig4.update_yaxes(title_text="°C")
+    fig4.update_layout(
+        barmode='stack', 
+        title='Graph 4: Change in attributed warming due to ERF by source 1750-2019',
+        yaxis=dict(range=[-1.5, 2]),
+        )
+    fig4.update_yaxes(title_text="°C")
 
-st.plotly_chart(fig4, use_container_width=True)
+    plotly_chart(fig4, use_container_width=True)
 
-st.caption("""Graph 4: Change in attributed warming due to ERF by source 1750-2019 by forcing agents. The contribution of forcing 
-    agents to 2019 temperature change relative to 1750 was produced using emulation (Forster et. al., 2021). The results 
-    are from a 2237-member ensemble. Solid bars represent best estimates, and "very likely" (5–95%) ranges are given by error 
-    bars. The error bars show the combined effects of forcing and climate response uncertainty using estimation 
-    of [ECS](https://en.wikipedia.org/wiki/Climate_sensitivity) and [TCR](https://en.wikipedia.org/wiki/Climate_sensitivity), 
-    and the distribution of calibrated model parameters from 44 CMIP6 models. Plot adopted from Forster et. al. (2021)""")
+    st.caption("""Graph 4: Change in attributed warming due to ERF by source 1750-2019 by forcing agents. The contribution of forcing 
+        agents to 2019 temperature change relative to 1750 was produced using emulation (Forster et. al., 2021). The results 
+        are from a 2237-member ensemble. Solid bars represent best estimates, and "very likely" (5–95%) ranges are given by error 
+        bars. The error bars show the combined effects of forcing and climate response uncertainty using estimation 
+        of [ECS](https://en.wikipedia.org/wiki/Climate_sensitivity) and [TCR](https://en.wikipedia.org/wiki/Climate_sensitivity), 
+        and the distribution of calibrated model parameters from 44 CMIP6 models. Plot adopted from Forster et. al. (2021)""")
 
-########################################### climate feedback ##############################################################
+create_warming_change_section()
 
-df_cmip5, df_cmip6, df_ar6 = get_climate_feedback_data()
-
-fig5 = go.Figure()
-
-fig5.add_trace(go.Box(x=df_cmip5['feedback'],
-                        y=df_cmip5['value'],
-                        name='CMIP5',
-                        marker_color='mediumturquoise',
-                        boxpoints=False)
-             )
-fig5.add_trace(go.Box(x=df_cmip6['feedback'],
-                        y=df_cmip6['value'],
-                        name='CMIP6',
-                        marker_color='orange',
-                        boxpoints=False)
-             )
-fig5.add_trace(go.Box(x=df_ar6['feedback'],
-                        y=df_ar6['value'],
-                        name='AR6',
-                        marker_color='red',
-                        boxpoints=False)
-             )
-fig5.add_hline(y=0, line_color='black', line_width=0.5)
-
-# Define the desired order
-desired_order = ['Net','Planck','Water Vapour + Lapse Rate','Surface Albedo','Cloud']
-
-#fig5.update_traces(box_visible=True, meanline_visible=True)
-fig5.update_layout(boxmode='group', 
-                    title='Graph 5: Global mean climate feedbacks estimation',
-                    xaxis={'categoryorder': 'array', 'categoryarray': desired_order})
-
-fig5.update_yaxes(title_text="Climate feedback (W m<sup>-2</sup> °C<sup>-1</sup>)")
-
-st.plotly_chart(fig5, use_container_width=True)
-
-st.caption("""Graph 5: Global mean climate feedbacks estimated in "abrupt 4xCO2" simulations. Estimations from simulation of 
-    29 CMIP5 models (light blue) and 49 CMIP6 models (orange), compared with those assessed in 
-    the [IPCC Sixth Assessment Report](https://www.ipcc.ch/report/ar6/wg1/chapter/chapter-7/) (red). The box lower and upper 
-    edges show the location of the lower and upper quartiles of each data distribution while the line in the middle shows the 
-    location of the median. The whiskers show the location of maxima and minima excluding any 
-    outliers. [Climate feedback](https://en.wikipedia.org/wiki/Climate_change_feedbacks) is 
-    a process that can either amplify or dampen the effects of a climate forcing, such as global warming (Forster et. al., 2021). 
-    A positive feedback accelerates the initial change while a negative feedback diminishes the initial change. On the x-axis 
-    there are four separate responses shown as well as the net response which is negative. The "Planck" response (negative feedback) 
-    is the increase in thermal radiation of the earth due to warming of the planet. "Water Vapour + Lapse Rate" is the sum of
-    the effects of increase of water vapour (which is a greenhouse gas) in the warmer atmosphere (positive feedback) and the effects of 
-    changing profile of temperature as a function of altitude (positive feedback). The "Surface Albedo" (positive feedback)
-    is the effect of changing reflectivity mostly due to changes in ice and snow cover extent. Lastly "Cloud" is the change in
-    cloud cover composition which has a net positive effect. Data from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7516/0).""")
+########################################### climate feedback ##############################################################
+@section_fragment
+def create_climate_feedback_section():
+    df_cmip5, df_cmip6, df_ar6 = get_climate_feedback_data()
+
+    fig5 = go.Figure()
+
+    fig5.add_trace(go.Box(x=df_cmip5['feedback'],
+                            y=df_cmip5['value'],
+                            name='CMIP5',
+                            marker_color='mediumturquoise',
+                            boxpoints=False)
+                 )
+    fig5.add_trace(go.Box(x=df_cmip6['feedback'],
+                            y=df_cmip6['value'],
+                            name='CMIP6',
+                            marker_color='orange',
+                            boxpoints=False)
+                 )
+    # the AR6 distributions come as precomputed box statistics instead of samples
+    fig5.add_trace(go.Box(x=df_ar6['feedback'],
+                            lowerfence=df_ar6['lowerfence'],
+                            q1=df_ar6['q1'],
+                            median=df_ar6['median'],
+                            q3=df_ar6['q3'],
+                            upperfence=df_ar6['upperfence'],
+                            name='AR6',
+                            marker_color='red',
+                            boxpoints=False)
+                 )
+    fig5.add_hline(y=0, line_color='black', line_width=0.5)
+
+    # Define the desired order
+    desired_order = ['Net','Planck','Water Vapour + Lapse Rate','Surface Albedo','Cloud']
+
+    #fig5.update_traces(box_visible=True, meanline_visible=True)
+    fig5.update_layout(boxmode='group', 
+                        title='Graph 5: Global mean climate feedbacks estimation',
+                        xaxis={'categoryorder': 'array', 'categoryarray': desired_order})
+
+    fig5.update_yaxes(title_text="Climate feedback (W m<sup>-2</sup> °C<sup>-1</sup>)")
+
+    plotly_chart(fig5, use_container_width=True)
+
+    st.caption("""Graph 5: Global mean climate feedbacks estimated in "abrupt 4xCO2" simulations. Estimations from simulation of 
+        29 CMIP5 models (light blue) and 49 CMIP6 models (orange), compared with those assessed in 
+        the [IPCC Sixth Assessment Report](https://www.ipcc.ch/report/ar6/wg1/chapter/chapter-7/) (red). The box lower and upper 
+        edges show the location of the lower and upper quartiles of each data distribution while the line in the middle shows the 
+        location of the median. The whiskers show the location of maxima and minima excluding any 
+        outliers. [Climate feedback](https://en.wikipedia.org/wiki/Climate_change_feedbacks) is 
+        a process that can either amplify or dampen the effects of a climate forcing, such as global warming (Forster et. al., 2021). 
+        A positive feedback accelerates the initial change while a negative feedback diminishes the initial change. On the x-axis 
+        there are four separate responses shown as well as the net response which is negative. The "Planck" response (negative feedback) 
+        is the increase in thermal radiation of the earth due to warming of the planet. "Water Vapour + Lapse Rate" is the sum of
+        the effects of increase of water vapour (which is a greenhouse gas) in the warmer atmosphere (positive feedback) and the effects of 
+        changing profile of temperature as a function of altitude (positive feedback). The "Surface Albedo" (positive feedback)
+        is the effect of changing reflectivity mostly due to changes in ice and snow cover extent. Lastly "Cloud" is the change in
+        cloud cover composition which has a net positive effect. Data from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7516/0).""")
+
+create_climate_feedback_section()
 
 #################### ECS/TCS Estimation #############################
-
-labels = ['Process understanding', 'Instrumental record','Paleoclimates', 'Emergent constraints', 
-    'Combined assessment', 'CMIP6 ESMs']
-
-
-col1, col2 = st.columns(2)
-
-with col1:
-    selected_assessment = st.selectbox("Select assessment:", ['Equilibrium climate sensitivity','Transient climate response'])
-
-if selected_assessment == 'Equilibrium climate sensitivity':
-    df = get_ecs_data()
-
-    fig6 = go.Figure()
-
-    fig6.add_trace(go.Bar(
-            name='Extremely likely range',
-            x=labels,
-            y=[0, 0.2, 6.5, 0, 0, 0],
-            hovertemplate =
-                'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
-            customdata = np.array([[0,0],[1.6,3.5],[1.5,8],[0,0],[0,0],[0,0]]),
-            base=[0, 1.6, 1.5, 0, 0, 0],
-            showlegend=True,
-            marker_color='rgba(70, 51, 245, 0.3)',
-            width=0.2
-    ))
-    fig6.add_trace(go.Bar(
-            name='Very likely range',
-            x=labels,
-            y=[5.6, 0.4, 1.8, 3.5, 3, 0],
-            hovertemplate =
-                'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
-            customdata = np.array([[2.1,7.7],[1.8,3.5],[1.5,3.4],[1.5,5],[2,5],[0,0]]),
-            base=[2.1, 1.8, 1.5, 1.5, 2, 0],
-            showlegend=True,
-            marker_color='rgba(56, 41, 196, 0.5)',
-            width=0.2
-    ))
-    fig6.add_trace(go.Bar(
-            name='Likely range',
-            x=labels,
-            y=[2.6, 0.3, 1.2, 0, 1.5, 0],
-            hovertemplate =
-                'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
-            customdata = np.array([[2.5,5.1],[2.2,3.5],[3.3,4.5],[0,0],[2.5,4],[0,0]]),
-            base=[2.5, 2.2, 3.3, 0, 2.5, 0],
-            showlegend=True,
-            marker_color='rgba(42, 31, 148, 0.7)',
-            width=0.2
-    ))
-    fig6.add_trace(go.Bar(
-            name='Central value range',
-            x=labels,
-            y=[0, 1, 0.1, 0.9, 0, 0],
-            hovertemplate =
-                'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
-            customdata = np.array([[0,0],[2.5,3.5],[3.3,3.4],[2.4,3.3],[0,0],[0,0]]),
-            base=[0, 2.5, 3.3, 2.4, 0, 0],
-            showlegend=True,
-            marker_color='rgba(30, 22, 105, 0.9)',
-            width=0.2
-    ))
-    fig6.add_trace(go.Scatter(
-            name='Central value',
-            x=['Process understanding','Combined assessment'],
-            y=[3.4,3],
-            hovertemplate =
-                'Value: %{y:.1f} °C',
-            showlegend=True,
-            mode='markers',
-            marker_color='black',
-            marker_symbol='cross',
-            marker_size=15
-    ))
-    fig6.add_trace(go.Box(
-            name='CMIP6 emulation values',
-            x=['CMIP6 ESMs'] * len(df),
-            y=df['ECS'],
-            showlegend=True,
-            marker_color='blue'
-    ))
-else:
-    df = get_tcr_data()
-
-    fig6 = go.Figure()
-
-    fig6.add_trace(go.Bar(
-            name='Very likely range',
-            x=labels,
-            y=[1.8, 1.4, 0, 1.2, 1.2, 0],
-            hovertemplate =
-                'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
-            customdata = np.array([[1.3,3.1],[1.3,2.7],[0,0],[1.1,2.3],[1.2,2.4],[0,0]]),
-            base=[1.3, 1.3, 0, 1.1, 1.2, 0],
-            showlegend=True,
-            marker_color='rgba(56, 41, 196, 0.5)',
-            width=0.2
-    ))
-    fig6.add_trace(go.Bar(
-            name='Likely range',
-            x=labels,
-            y=[1.1, 0.8, 0, 0, 0.8, 0],
-            hovertemplate =
-                'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
-            customdata = np.array([[1.6,2.7],[1.5,2.3],[0,0],[0,0],[1.4,2.2],[0,0]]),
-            base=[1.6, 1.5, 0, 0, 1.4, 0],
-            showlegend=True,
-            marker_color='rgba(42, 31, 148, 0.7)',
-            width=0.2
-    ))
-    fig6.add_trace(go.Scatter(
-            name='Central value',
-            x=['Process understanding', 'Instrumental record', 'Emergent constraints', 'Combined assessment'],
-            y=[2,1.9,1.7,1.8],
-            hovertemplate =
-                'Value: %{y:.1f} °C',
-            showlegend=True,
-            mode='markers',
-            marker_color='black',
-            marker_symbol='cross',
-            marker_size=15
-    ))
-    fig6.add_trace(go.Box(
-            name='CMIP6 emulation values',
-            x=['CMIP6 ESMs'] * len(df),
-            y=df['TCR'],
-            showlegend=True,
-            marker_color='blue'
-    ))
-fig6.update_layout(
-    barmode='overlay', 
-    title=f'Graph 6: Summary of the {selected_assessment.lower()} assessments using different lines of evidence'
-    )
-fig6.update_yaxes(title_text=f"{selected_assessment} estimates (°C)")
-
-st.plotly_chart(fig6, use_container_width=True)
-
-st.caption("""Graph 6: Summary of the Equilibrium climate sensitivity (TCS) and Transient climate response (TCR) using different
-    lines of evidence. TCS is the long-term warming from a doubling of atmospheric CO₂ once the climate system 
-    reaches a new equilibrium state (Forster et. al., 2021). This process can take centuries or even millennia as it includes slow feedbacks like deep 
-    ocean heating, which is why ECS is higher than the TCR which represents the "transient" or temporary warming experienced 
-    while the climate system is still adjusting to a new state. Plot adopted from Forster et. al. (2021). Data 
-    from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7507/0).""")
+@section_fragment
+def create_climate_sensitivity_section():
+    labels = ['Process understanding', 'Instrumental record','Paleoclimates', 'Emergent constraints', 
+        'Combined assessment', 'CMIP6 ESMs']
+
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        selected_assessment = st.selectbox("Select assessment:", ['Equilibrium climate sensitivity','Transient climate response'])
+
+    if selected_assessment == 'Equilibrium climate sensitivity':
+        df = get_ecs_data()
+
+        fig6 = go.Figure()
+
+        fig6.add_trace(go.Bar(
+                name='Extremely likely range',
+                x=labels,
+                y=[0, 0.2, 6.5, 0, 0, 0],
+                hovertemplate =
+                    'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
+                customdata = np.array([[0,0],[1.6,3.5],[1.5,8],[0,0],[0,0],[0,0]]),
+                base=[0, 1.6, 1.5, 0, 0, 0],
+                showlegend=True,
+                marker_color='rgba(70, 51, 245, 0.3)',
+                width=0.2
+        ))
+        fig6.add_trace(go.Bar(
+                name='Very likely range',
+                x=labels,
+                y=[5.6, 0.4, 1.8, 3.5, 3, 0],
+                hovertemplate =
+                    'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
+                customdata = np.array([[2.1,7.7],[1.8,3.5],[1.5,3.4],[1.5,5],[2,5],[0,0]]),
+                base=[2.1, 1.8, 1.5, 1.5, 2, 0],
+                showlegend=True,
+                marker_color='rgba(56, 41, 196, 0.5)',
+                width=0.2
+        ))
+        fig6.add_trace(go.Bar(
+                name='Likely range',
+                x=labels,
+                y=[2.6, 0.3, 1.2, 0, 1.5, 0],
+                hovertemplate =
+                    'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
+                customdata = np.array([[2.5,5.1],[2.2,3.5],[3.3,4.5],[0,0],[2.5,4],[0,0]]),
+                base=[2.5, 2.2, 3.3, 0, 2.5, 0],
+                showlegend=True,
+                marker_color='rgba(42, 31, 148, 0.7)',
+                width=0.2
+        ))
+        fig6.add_trace(go.Bar(
+                name='Central value range',
+                x=labels,
+                y=[0, 1, 0.1, 0.9, 0, 0],
+                hovertemplate =
+                    'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
+                customdata = np.array([[0,0],[2.5,3.5],[3.3,3.4],[2.4,3.3],[0,0],[0,0]]),
+                base=[0, 2.5, 3.3, 2.4, 0, 0],
+                showlegend=True,
+                marker_color='rgba(30, 22, 105, 0.9)',
+                width=0.2
+        ))
+        fig6.add_trace(go.Scatter(
+                name='Central value',
+                x=['Process understanding','Combined assessment'],
+                y=[3.4,3],
+                hovertemplate =
+                    'Value: %{y:.1f} °C',
+                showlegend=True,
+                mode='markers',
+                marker_color='black',
+                marker_symbol='cross',
+                marker_size=15
+        ))
+        fig6.add_trace(go.Box(
+                name='CMIP6 emulation values',
+                x=['CMIP6 ESMs'] * len(df),
+                y=df['ECS'],
+                showlegend=True,
+                marker_color='blue'
+        ))
+    else:
+        df = get_tcr_data()
+
+        fig6 = go.Figure()
+
+        fig6.add_trace(go.Bar(
+                name='Very likely range',
+                x=labels,
+                y=[1.8, 1.4, 0, 1.2, 1.2, 0],
+                hovertemplate =
+                    'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
+                customdata = np.array([[1.3,3.1],[1.3,2.7],[0,0],[1.1,2.3],[1.2,2.4],[0,0]]),
+                base=[1.3, 1.3, 0, 1.1, 1.2, 0],
+                showlegend=True,
+                marker_color='rgba(56, 41, 196, 0.5)',
+                width=0.2
+        ))
+        fig6.add_trace(go.Bar(
+                name='Likely range',
+                x=labels,
+                y=[1.1, 0.8, 0, 0, 0.8, 0],
+                hovertemplate =
+                    'Range: [%{customdata[0]:.1f} to %{customdata[1]:.1f}] °C',
+                customdata = np.array([[1.6,2.7],[1.5,2.3],[0,0],[0,0],[1.4,2.2],[0,0]]),
+                base=[1.6, 1.5, 0, 0, 1.4, 0],
+                showlegend=True,
+                marker_color='rgba(42, 31, 148, 0.7)',
+                width=0.2
+        ))
+        fig6.add_trace(go.Scatter(
+                name='Central value',
+                x=['Process understanding', 'Instrumental record', 'Emergent constraints', 'Combined assessment'],
+                y=[2,1.9,1.7,1.8],
+                hovertemplate =
+                    'Value: %{y:.1f} °C',
+                showlegend=True,
+                mode='markers',
+                marker_color='black',
+                marker_symbol='cross',
+                marker_size=15
+        ))
+        fig6.add_trace(go.Box(
+                name='CMIP6 emulation values',
+                x=['CMIP6 ESMs'] * len(df),
+                y=df['TCR'],
+                showlegend=True,
+                marker_color='blue'
+        ))
+    fig6.update_layout(
+        barmode='overlay', 
+        title=f'Graph 6: Summary of the {selected_assessment.lower()} assessments using different lines of evidence'
+        )
+    fig6.update_yaxes(title_text=f"{selected_assessment} estimates (°C)")
+
+    plotly_chart(fig6, use_container_width=True)
+
+    st.caption("""Graph 6: Summary of the Equilibrium climate sensitivity (TCS) and Transient climate response (TCR) using different
+        lines of evidence. TCS is the long-term warming from a doubling of atmospheric CO₂ once the climate system 
+        reaches a new equilibrium state (Forster et. al., 2021). This process can take centuries or even millennia as it includes slow feedbacks like deep 
+        ocean heating, which is why ECS is higher than the TCR which represents the "transient" or temporary warming experienced 
+        while the climate system is still adjusting to a new state. Plot adopted from Forster et. al. (2021). Data 
+        from [IPCC](https://ipcc-browser.ipcc-data.org/browser/dataset/7507/0).""")
+
+create_climate_sensitivity_section()
 ###########################################################################################################################
 st.markdown("### References")
 
@@ -556,4 +583,4 @@ st.markdown(
     IPCC Sixth Assessment Report - Input data for Figure 7.18 (v20220721). NERC EDS Centre for Environmental Data Analysis, 
     10 July 2023. doi:10.5285/399a75d2538a471cb529d1f0fa01410e. https://dx.doi.org/10.5285/399a75d2538a471cb529d1f0fa01410e 
     Date Accessed 2025-10-10."""
-)
\ No newline at end of file
+)
@@ -20,6 +20,8 @@ from get_data import (
     get_n2o_hist_data,
     get_noaa_global_data
 )
+from monitoring import section_fragment, plotly_chart, payload_panel, timed_loaders
+from plotting import downsample_window, window_rows, band_trace, cached_figure
 
 def range_slider_with_inputs(title, label, min_bound, max_bound, default_range):
     """
@@ -93,15 +95,39 @@ def range_slider_with_inputs(title, label, min_bound, max_bound, default_range):
     return selected_range
 
 
+@st.cache_data()
 def get_and_combine_ghg_data():
+    # one frame per series name, so every trace gets its data directly instead of masking a combined table
     df = pd.concat([get_co2_hist_data(), get_ch4_hist_data(), get_n2o_hist_data(), \
         get_co2_latest_data(), get_ch4_latest_data(), get_n2o_latest_data(), get_parrenin_data()])
-    return df
+    return {name: group[['Year', 'Value']].sort_values(by='Year').reset_index(drop=True) \
+        for name, group in df.groupby('Name', sort=False)}
 
+# every window picked with the sliders and inputs is a new entry, the oldest ones are dropped past this many
+WINDOW_CACHE_ENTRIES = 128
+
+@st.cache_data(max_entries=WINDOW_CACHE_ENTRIES)
+def get_ghg_window(name, from_year, to_year):
+    # only the part of a series inside the selected years is sent to the browser, downsampled to the chart width
+    return downsample_window(get_and_combine_ghg_data()[name], from_year, to_year)
+
+@st.cache_data()
 def get_and_combine_temp_data():
     df = pd.concat([get_osman_data(), get_be_global_data(), get_co2_hist_data(), get_co2_latest_data()])
-    return df
 
+    # only show the period covered by the temperature reconstruction
+    df = df[df['Year'] >= df.loc[df['Name'] == 'Temp_hist', 'Year'].min()]
+    return {name: group[['Year', 'Value']].sort_values(by='Year').reset_index(drop=True) \
+        for name, group in df.groupby('Name', sort=False)}
+
+@st.cache_data(max_entries=WINDOW_CACHE_ENTRIES)
+def get_temp_window(name, from_year, to_year):
+    return downsample_window(get_and_combine_temp_data()[name], from_year, to_year)
+
+# before the sections run, so the page loaders are timed with the get_data ones
+timed_loaders(globals())
+
+@section_fragment
 def create_instrumental_temperature_section():
     df = get_be_global_data2()
 
@@ -110,6 +136,7 @@ def create_instrumental_temperature_section():
 
     from_year, to_year = range_slider_with_inputs("What timescale are you interested in?", \
         'instrumental', min_value*1.0, max_value*1.0, (min_value*1.0, max_value*1.0))
+    df = window_rows(df, from_year, to_year)
 
 
     # Instrumental temperature plot
@@ -133,21 +160,11 @@ def create_instrumental_temperature_section():
         y_max = df['Five-year Anomaly'] + df['Five-year Unc.'] + 14.102
         y_min = df['Five-year Anomaly'] - df['Five-year Unc.'] + 14.102
         fig0.add_trace(
-            go.Scatter(x=df['Year'], \
-                y=y_max, 
-                name="Five-year uncertainty",
-                hoverinfo = 'skip',
-                line=dict(color='blue', width=0.1),
-                showlegend=False)
-        )
-        fig0.add_trace(
-            go.Scatter(x=df['Year'], \
-                y=y_min, 
+            band_trace(x=df['Year'],
+                y_lower=y_min,
+                y_upper=y_max,
                 name="Five-year uncertainty",
-                hoverinfo = 'skip',
-                line=dict(color='blue', width=0.1),
-                fill='tonexty',
-                fillcolor = 'rgba(0, 0, 255, 0.2)')
+                color='rgba(0, 0, 255, 0.2)')
         )
         fig0.add_trace(
             go.Scatter(x=df['Year'], \
@@ -159,9 +176,9 @@ def create_instrumental_temperature_section():
                 line=dict(color='magenta', width=1))
         )
     else:
-        df_gistemp = get_gistemp_global_data()
-        df_hadcrut = get_hadcrut_global_data()
-        df_noaa = get_noaa_global_data()
+        df_gistemp = window_rows(get_gistemp_global_data(), from_year, to_year)
+        df_hadcrut = window_rows(get_hadcrut_global_data(), from_year, to_year, x='Time')
+        df_noaa = window_rows(get_noaa_global_data(), from_year, to_year)
 
         # Add traces
         fig0.add_trace(
@@ -216,22 +233,24 @@ def create_instrumental_temperature_section():
 
     # Set y-axes titles
     fig0.update_yaxes(title_text="Global mean temperature (°C)")
-    st.plotly_chart(fig0, use_container_width=True)
+    plotly_chart(fig0, use_container_width=True)
     st.caption("""Graph 1: Global mean surface temperature with uncertainty and global mean temperature anomaly for four different 
         datasets, 1850 to present. On the former graph a 5-year moving average is shown as well as annual average and 
         uncertainty for the 5-year average. On the latter graph 5-year moving averages are shown for each dataset.
         See references for data access.""")
 
+@section_fragment
 def create_ghg_section():
     st.write("")
 
-    df = get_and_combine_ghg_data()
+    series = get_and_combine_ghg_data()
 
-    min_value = df['Year'].min()
-    max_value = df['Year'].max()
+    min_value = min(df['Year'].min() for df in series.values())
+    max_value = max(df['Year'].max() for df in series.values())
 
     from_year, to_year = range_slider_with_inputs("What timescale are you interested in? (Negative values are years BCE)", \
         'ghg', min_value, max_value, (min_value, max_value))
+    windows = {name: get_ghg_window(name, from_year, to_year) for name in series}
 
     # GREENHOUSE GAS PLOT
     # Create figure with secondary y-axis
@@ -239,8 +258,8 @@ def create_ghg_section():
 
     # Add traces
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CO2_hist', 'Year'], \
-            y=df.loc[df['Name'] == 'CO2_hist', 'Value'], name="CO<sub>2</sub> icecore",
+        go.Scatter(x=windows['CO2_hist']['Year'], \
+            y=windows['CO2_hist']['Value'], name="CO<sub>2</sub> icecore",
             hovertemplate =
             'Value: %{y:.1f} ppm'+
             '<br>Year: %{x:.0f}',
@@ -249,8 +268,8 @@ def create_ghg_section():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CO2_latest', 'Year'], \
-            y=df.loc[df['Name'] == 'CO2_latest', 'Value'], name="CO<sub>2</sub> measurements",
+        go.Scatter(x=windows['CO2_latest']['Year'], \
+            y=windows['CO2_latest']['Value'], name="CO<sub>2</sub> measurements",
             line=dict(color='lightblue'),
             hovertemplate =
             'Value: %{y:.1f} ppm'+
@@ -259,8 +278,8 @@ def create_ghg_section():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CH4_hist', 'Year'], \
-            y=df.loc[df['Name'] == 'CH4_hist', 'Value'], name="Methane (CH<sub>4</sub>) icecore",
+        go.Scatter(x=windows['CH4_hist']['Year'], \
+            y=windows['CH4_hist']['Value'], name="Methane (CH<sub>4</sub>) icecore",
             hovertemplate =
             'Value: %{y:.1f} ppb'+
             '<br>Year: %{x:.0f}',
@@ -269,8 +288,8 @@ def create_ghg_section():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CH4_latest', 'Year'], \
-            y=df.loc[df['Name'] == 'CH4_latest', 'Value'], name="Methane (CH<sub>4</sub>) measurements", 
+        go.Scatter(x=windows['CH4_latest']['Year'], \
+            y=windows['CH4_latest']['Value'], name="Methane (CH<sub>4</sub>) measurements", 
             line=dict(color='pink'),
             hovertemplate =
             'Value: %{y:.1f} ppb'+
@@ -279,8 +298,8 @@ def create_ghg_section():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'N2O_hist', 'Year'], \
-            y=df.loc[df['Name'] == 'N2O_hist', 'Value'], name="N<sub>2</sub>O icecore",
+        go.Scatter(x=windows['N2O_hist']['Year'], \
+            y=windows['N2O_hist']['Value'], name="N<sub>2</sub>O icecore",
             hovertemplate =
             'Value: %{y:.1f} ppb'+
             '<br>Year: %{x:.0f}',
@@ -289,8 +308,8 @@ def create_ghg_section():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'N2O_latest', 'Year'], \
-            y=df.loc[df['Name'] == 'N2O_latest', 'Value'], name="N<sub>2</sub>O measurements",
+        go.Scatter(x=windows['N2O_latest']['Year'], \
+            y=windows['N2O_latest']['Value'], name="N<sub>2</sub>O measurements",
             line=dict(color='lightgray'),
             hovertemplate =
             'Value: %{y:.1f} ppb'+
@@ -316,7 +335,7 @@ def create_ghg_section():
     # Set y-axes titles
     fig1.update_yaxes(title_text="CO<sub>2</sub> (ppm)", secondary_y=False)
     fig1.update_yaxes(title_text="CH<sub>4</sub> (ppb) / N<sub>2</sub>O (ppb)", secondary_y=True)
-    st.plotly_chart(fig1, use_container_width=True)
+    plotly_chart(fig1, use_container_width=True)
     st.caption("""Graph 2: Estimated global atmospheric concentration levels of three greenhouse gases for the past ~800,000 years.
         Based on Antarctic icecore data. Also shown are modern measured annual average levels (instrumental record).
         See references for data access.""")
@@ -327,8 +346,8 @@ def create_ghg_section():
 
     # Add traces
     fig2.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CO2_hist', 'Year'], \
-            y=df.loc[df['Name'] == 'CO2_hist', 'Value'], name="CO<sub>2</sub> icecore",
+        go.Scatter(x=windows['CO2_hist']['Year'], \
+            y=windows['CO2_hist']['Value'], name="CO<sub>2</sub> icecore",
             hovertemplate =
             'Value: %{y:.1f} ppm'+
             '<br>Year: %{x:.0f}',
@@ -337,8 +356,8 @@ def create_ghg_section():
     )
 
     fig2.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'Temp_parrenin', 'Year'], \
-            y=df.loc[df['Name'] == 'Temp_parrenin', 'Value'], name="Temperature change icecore",
+        go.Scatter(x=windows['Temp_parrenin']['Year'], \
+            y=windows['Temp_parrenin']['Value'], name="Temperature change icecore",
             hovertemplate =
             'Value: %{y:.1f} °C'+
             '<br>Year: %{x:.0f}',
@@ -364,31 +383,31 @@ def create_ghg_section():
     # Set y-axes titles
     fig2.update_yaxes(title_text="CO<sub>2</sub> (ppm)", secondary_y=False)
     fig2.update_yaxes(title_text="Temperature change (°C)", secondary_y=True)
-    st.plotly_chart(fig2, use_container_width=True)
+    plotly_chart(fig2, use_container_width=True)
     st.caption("""Graph 3: Recostruction of Antarctic air temperature change for the past ~800,000 years, based on Antarctic 
         icecore data from five different sites, and estimation of past carbon dioxide levels based on Antarctic icecore data. Temperature data from
         [PANGAEA](https://doi.org/10.1594/PANGAEA.810188).""")
     st.write("")
     st.write("")
 
+@section_fragment
 def create_ghg_section2():
-    df = get_and_combine_temp_data()
+    series = get_and_combine_temp_data()
 
-    min_value = df.loc[df['Name'] == 'Temp_hist', 'Year'].min()
-    max_value = df['Year'].max()
-
-    df = df[df['Year'] >= min_value]
+    min_value = series['Temp_hist']['Year'].min()
+    max_value = max(df['Year'].max() for df in series.values())
 
     from_year, to_year = range_slider_with_inputs("What timescale are you interested in? (Negative values are years BCE)", \
         'temp', min_value, max_value, (min_value, max_value))
+    windows = {name: get_temp_window(name, from_year, to_year) for name in series}
 
     # Create figure with secondary y-axis
     fig1 = make_subplots(specs=[[{"secondary_y": True}]])
 
     # Add traces
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CO2_hist', 'Year'], \
-            y=df.loc[df['Name'] == 'CO2_hist', 'Value'], name="CO<sub>2</sub> icecore",
+        go.Scatter(x=windows['CO2_hist']['Year'], \
+            y=windows['CO2_hist']['Value'], name="CO<sub>2</sub> icecore",
             hovertemplate =
             'Value: %{y:.1f} ppm'+
             '<br>Year: %{x:.0f}',
@@ -397,8 +416,8 @@ def create_ghg_section2():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'CO2_latest', 'Year'], \
-            y=df.loc[df['Name'] == 'CO2_latest', 'Value'], name="CO<sub>2</sub> measurements",
+        go.Scatter(x=windows['CO2_latest']['Year'], \
+            y=windows['CO2_latest']['Value'], name="CO<sub>2</sub> measurements",
             line=dict(color='lightblue'),
             hovertemplate =
             'Value: %{y:.1f} ppm'+
@@ -407,8 +426,8 @@ def create_ghg_section2():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'Temp_hist', 'Year'], \
-            y=df.loc[df['Name'] == 'Temp_hist', 'Value'], name="Reconstructed temperature",
+        go.Scatter(x=windows['Temp_hist']['Year'], \
+            y=windows['Temp_hist']['Value'], name="Reconstructed temperature",
             hovertemplate =
             'Value: %{y:.1f} °C'+
             '<br>Year: %{x:.0f}',
@@ -417,8 +436,8 @@ def create_ghg_section2():
     )
 
     fig1.add_trace(
-        go.Scatter(x=df.loc[df['Name'] == 'Temp_latest', 'Year'], \
-            y=df.loc[df['Name'] == 'Temp_latest', 'Value'], name="Temperature measurements", 
+        go.Scatter(x=windows['Temp_latest']['Year'], \
+            y=windows['Temp_latest']['Value'], name="Temperature measurements", 
             line=dict(color='lightgreen'),
             hovertemplate =
             'Value: %{y:.1f} °C'+
@@ -444,13 +463,14 @@ def create_ghg_section2():
     # Set y-axes titles
     fig1.update_yaxes(title_text="CO<sub>2</sub> (ppm)", secondary_y=False)
     fig1.update_yaxes(title_text="Temperature (°C)", secondary_y=True)
-    st.plotly_chart(fig1, use_container_width=True)
+    plotly_chart(fig1, use_container_width=True)
     st.caption("""Graph 4: Recostruction of annual global mean temperature for the past ~24,000 years based on climate modeling and geochemical proxy data,
          estimation of past carbon dioxide levels based on Antarctic icecore data and modern measured temperature and 
          carbon dioxide levels (instrumental record). Temperature reconstruction data from [NOAA](https://doi.org/10.25921/njxd-hg08).
          Temperature instrumental record from [The Berkeley Earth Land/Ocean Temperature Record](https://doi.org/10.5194/essd-12-3469-2020).""")
 
-def create_cmip6_section():
+@cached_figure
+def create_cmip6_figure():
     df = get_cmip6_data()
     df_instrumental = get_be_global_data()
     df_historical = df[df['experiment'] == 'historical']
@@ -471,23 +491,14 @@ def create_cmip6_section():
             line=dict(color='black'))
     )
     fig1.add_trace(
-        go.Scatter(x=df_historical.loc[df_historical['quantile'] == 0.9, 'year'], \
-            y=df_historical.loc[df_historical['quantile'] == 0.9, 'tas'], name="historical 10th/90th quantiles",
+        band_trace(x=df_historical.loc[df_historical['quantile'] == 0.1, 'year'],
+            y_lower=df_historical.loc[df_historical['quantile'] == 0.1, 'tas'],
+            y_upper=df_historical.loc[df_historical['quantile'] == 0.9, 'tas'],
+            name="historical 10th/90th quantiles",
+            color='rgba(0, 0, 0, 0.2)',
             hovertemplate =
             'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='black', width=0.1),
-            showlegend=False)
-    )
-    fig1.add_trace(
-        go.Scatter(x=df_historical.loc[df_historical['quantile'] == 0.1, 'year'], \
-            y=df_historical.loc[df_historical['quantile'] == 0.1, 'tas'], name="historical 10th/90th quantiles",
-            hovertemplate =
-            'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='black', width=0.1),
-            fill='tonexty',
-            fillcolor = 'rgba(0, 0, 0, 0.2)')
+            '<br>Year: %{x:.0f}')
     )
     fig1.add_trace(
         go.Scatter(x=df_ssp126.loc[df_ssp126['quantile'] == 0.5, 'year'], \
@@ -498,23 +509,14 @@ def create_cmip6_section():
             line=dict(color='blue'))
     )
     fig1.add_trace(
-        go.Scatter(x=df_ssp126.loc[df_ssp126['quantile'] == 0.9, 'year'], \
-            y=df_ssp126.loc[df_ssp126['quantile'] == 0.9, 'tas'], name="SSP1-2.6 10th/90th quantiles",
+        band_trace(x=df_ssp126.loc[df_ssp126['quantile'] == 0.1, 'year'],
+            y_lower=df_ssp126.loc[df_ssp126['quantile'] == 0.1, 'tas'],
+            y_upper=df_ssp126.loc[df_ssp126['quantile'] == 0.9, 'tas'],
+            name="SSP1-2.6 10th/90th quantiles",
+            color='rgba(0, 0, 255, 0.2)',
             hovertemplate =
             'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='blue', width=0.1),
-            showlegend=False)
-    )
-    fig1.add_trace(
-        go.Scatter(x=df_ssp126.loc[df_ssp126['quantile'] == 0.1, 'year'], \
-            y=df_ssp126.loc[df_ssp126['quantile'] == 0.1, 'tas'], name="SSP1-2.6 10th/90th quantiles",
-            hovertemplate =
-            'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='blue', width=0.1),
-            fill='tonexty',
-            fillcolor = 'rgba(0, 0, 255, 0.2)')
+            '<br>Year: %{x:.0f}')
     )
     fig1.add_trace(
         go.Scatter(x=df_ssp245.loc[df_ssp245['quantile'] == 0.5, 'year'], \
@@ -525,23 +527,14 @@ def create_cmip6_section():
             line=dict(color='green'))
     )
     fig1.add_trace(
-        go.Scatter(x=df_ssp245.loc[df_ssp245['quantile'] == 0.9, 'year'], \
-            y=df_ssp245.loc[df_ssp245['quantile'] == 0.9, 'tas'], name="SSP2-4.5 10th/90th quantiles",
+        band_trace(x=df_ssp245.loc[df_ssp245['quantile'] == 0.1, 'year'],
+            y_lower=df_ssp245.loc[df_ssp245['quantile'] == 0.1, 'tas'],
+            y_upper=df_ssp245.loc[df_ssp245['quantile'] == 0.9, 'tas'],
+            name="SSP2-4.5 10th/90th quantiles",
+            color='rgba(0, 255, 0, 0.2)',
             hovertemplate =
             'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='green', width=0.1),
-            showlegend=False)
-    )
-    fig1.add_trace(
-        go.Scatter(x=df_ssp245.loc[df_ssp245['quantile'] == 0.1, 'year'], \
-            y=df_ssp245.loc[df_ssp245['quantile'] == 0.1, 'tas'], name="SSP2-4.5 10th/90th quantiles",
-            hovertemplate =
-            'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='green', width=0.1),
-            fill='tonexty',
-            fillcolor = 'rgba(0, 255, 0, 0.2)')
+            '<br>Year: %{x:.0f}')
     )
     fig1.add_trace(
         go.Scatter(x=df_ssp585.loc[df_ssp585['quantile'] == 0.5, 'year'], \
@@ -552,23 +545,14 @@ def create_cmip6_section():
             line=dict(color='red'))
     )
     fig1.add_trace(
-        go.Scatter(x=df_ssp585.loc[df_ssp585['quantile'] == 0.9, 'year'], \
-            y=df_ssp585.loc[df_ssp585['quantile'] == 0.9, 'tas'], name="SSP5-8.5 10th/90th quantiles",
-            hovertemplate =
-            'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='red', width=0.1),
-            showlegend=False)
-    )
-    fig1.add_trace(
-        go.Scatter(x=df_ssp585.loc[df_ssp585['quantile'] == 0.1, 'year'], \
-            y=df_ssp585.loc[df_ssp585['quantile'] == 0.1, 'tas'], name="SSP5-8.5 10th/90th quantiles",
+        band_trace(x=df_ssp585.loc[df_ssp585['quantile'] == 0.1, 'year'],
+            y_lower=df_ssp585.loc[df_ssp585['quantile'] == 0.1, 'tas'],
+            y_upper=df_ssp585.loc[df_ssp585['quantile'] == 0.9, 'tas'],
+            name="SSP5-8.5 10th/90th quantiles",
+            color='rgba(255, 0, 0, 0.2)',
             hovertemplate =
             'Value: %{y:.1f} °C'+
-            '<br>Year: %{x:.0f}',
-            line=dict(color='red', width=0.1),
-            fill='tonexty',
-            fillcolor = 'rgba(255, 0, 0, 0.2)')
+            '<br>Year: %{x:.0f}')
     )
     fig1.add_trace(
         go.Scatter(x=df_instrumental['Year'], \
@@ -593,7 +577,11 @@ def create_cmip6_section():
 
     # Set y-axes titles
     fig1.update_yaxes(title_text="Temperature (°C)")
-    st.plotly_chart(fig1, use_container_width=True)
+    return fig1
+
+@section_fragment
+def create_cmip6_section():
+    plotly_chart(create_cmip6_figure(), use_container_width=True)
     st.caption("""Graph 5: Climate model ensemble annual global mean temperature quantiles for four different scenarios 
         from year 1850 to year 2100. Shown are quantiles for the output of 37 models.
         For each of the three scenarios [SSP1-2.6](https://en.wikipedia.org/wiki/Shared_Socioeconomic_Pathways), 
@@ -613,6 +601,7 @@ st.set_page_config(
 )
 
 st.sidebar.header("Temperature")
+payload_panel()
 
 st.markdown("# Global Mean Temperature and Greenhouse Gas Concentration")
 
@@ -700,7 +689,3 @@ st.markdown(
     https://ecmwf-projects.github.io/copernicus-training-c3s/projections-cmip6.html
     (Accessed on 2025-09-24)."""
 )
-
-
-
-
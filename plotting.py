@@ -0,0 +1,257 @@
+import os
+import json
+import functools
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import streamlit as st
+import plotly.graph_objects as go
+
+DATA_DIR = Path("data")
+
+# the newest shipped data file, cached figures built from an older version of the data are never reused
+DATA_VERSION = max((path.stat().st_mtime_ns for path in DATA_DIR.rglob('*') if path.is_file()), default=0)
+
+# figures kept by cached_figure for all pages together, every widget value shown is a new entry, the least
+# recently used ones are dropped past this many
+FIGURE_CACHE_ENTRIES = 256
+
+# about one point per pixel of a wide chart, more than that only adds to the payload
+MAX_LINE_POINTS = 2000
+
+# lines with at least this many points are drawn with WebGL, set CLIMATE_GRAPHS_WEBGL_POINTS to change it
+WEBGL_MIN_POINTS = int(os.environ.get('CLIMATE_GRAPHS_WEBGL_POINTS', 300))
+
+# upper limit on the size of the per-year values sent with an animated map
+ANIMATION_MAX_BYTES = 500_000
+
+def slice_window(x, from_x, to_x):
+    # the rows of a sorted x inside [from_x, to_x] plus the x value just outside on each side so lines run to the
+    # axis edges, all rows sharing an x value are kept together for frames holding several series
+    start = np.searchsorted(x, from_x, side='left')
+    if start > 0:
+        start = np.searchsorted(x, x[start - 1], side='left')
+    stop = np.searchsorted(x, to_x, side='right')
+    if stop < len(x):
+        stop = np.searchsorted(x, x[stop], side='right')
+    return slice(start, stop)
+
+def window_rows(df, from_x, to_x, x='Year'):
+    # cut a frame sorted by x to the selected range so only the visible part is serialised
+    return df.iloc[slice_window(df[x].to_numpy(), from_x, to_x)]
+
+def line_trace(x, y, **kwargs):
+    # go.Scattergl for dense lines, which the browser redraws much faster on pan and zoom, go.Scatter otherwise
+    # uncertainty bands stay go.Scatter so their fill looks the same whatever the line is drawn with, WebGL traces
+    # are drawn above all SVG ones whatever the trace order, so bands are added before the lines they go with
+    trace = go.Scattergl if len(x) >= WEBGL_MIN_POINTS else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+def band_polygon(x, y_lower, y_upper):
+    # closed outline of the band, along the upper bound and back along the lower one, as two NumPy arrays
+    # Series from cached frames are read without copying, each outline array is a single allocation
+    x = np.asarray(x)
+    y_lower = np.asarray(y_lower, dtype=float)
+    y_upper = np.asarray(y_upper, dtype=float)
+    # rows missing x or a bound are left out, plotly closes each NaN separated piece of the outline on its own
+    keep = ~pd.isna(x) & np.isfinite(y_lower) & np.isfinite(y_upper)
+    if not keep.all():
+        x, y_lower, y_upper = x[keep], y_lower[keep], y_upper[keep]
+    band_x = np.concatenate((x, x[::-1]))
+    if band_x.dtype.kind == 'M':
+        # wrapped without copying so plotly writes dates as it does for a Series, not with nanosecond digits
+        band_x = pd.DatetimeIndex(band_x)
+    return band_x, np.concatenate((y_upper, y_lower[::-1]))
+
+def band_trace(x, y_lower, y_upper, name, color, **kwargs):
+    # shaded uncertainty band between y_lower and y_upper, color is an rgba string used for the fill and outline
+    # the band has no hover unless a hovertemplate is given, which is then shown on the points of both bounds
+    band_x, band_y = band_polygon(x, y_lower, y_upper)
+    if 'hovertemplate' not in kwargs:
+        kwargs['hoverinfo'] = 'skip'
+    return go.Scatter(x=band_x,
+        y=band_y,
+        name=name,
+        fill='toself',
+        fillcolor=color,
+        line=dict(color=color, width=0.1),
+        **kwargs)
+
+def split_budget(sizes, budget):
+    # shares of budget proportional to sizes and at most the sizes, rounded down with the rest given to the largest
+    shares = np.minimum(sizes, budget * sizes // max(sizes.sum(), 1))
+    for i in np.argsort(-sizes, kind='stable'):
+        shares[i] += min(sizes[i] - shares[i], budget - shares.sum())
+    return shares
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling (Steinarsson, 2013). Keeps the first and last point and from each
+    bucket in between the point forming the largest triangle with the point kept before it and the average of the
+    next bucket, which keeps the peaks and troughs of the line.
+
+    Args:
+        x (array): Sorted x values.
+        y (array): y values, NaN rows are line breaks, one is kept between any two runs of points that are kept.
+        n_out (int): Number of points to keep at most, line breaks included.
+
+    Returns:
+        array: Indices of the kept points.
+    """
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+
+    breaks = np.flatnonzero(np.isnan(y))
+    if len(breaks):
+        # a NaN would make the areas of its bucket and the average of the bucket before it NaN, so each run of
+        # points between line breaks is downsampled on its own with a share of n_out matching its length
+        starts = np.concatenate(([0], breaks + 1))
+        stops = np.concatenate((breaks, [n]))
+        starts, stops = starts[stops > starts], stops[stops > starts]
+        # room for a break between every two runs, or with too many runs for that half of n_out for the points,
+        # each run given points then needs at most one break before it
+        budget = max(n_out - (len(starts) - 1), n_out // 2)
+        kept = []
+        for start, stop, share in zip(starts, stops, split_budget(stops - starts, budget)):
+            if share == 0:
+                continue
+            if kept:
+                kept.append([start - 1])
+            kept.append(start + lttb(x[start:stop], y[start:stop], share))
+        return np.concatenate(kept) if kept else np.arange(0)
+
+    if n_out < 3:
+        # too few points for buckets, evenly spaced ones
+        return np.linspace(0, n - 1, n_out).round().astype(int)
+
+    # bucket edges for the n - 2 inner points, the averages of all buckets are computed at once
+    edges = (np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(int) + 1
+    edges[-1] = n - 1
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # the last inner bucket looks ahead to the last point
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    kept = np.empty(n_out, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i]) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (avg_y[i] - y[a]))
+        a = start + np.argmax(area)
+        kept[i + 1] = a
+    return kept
+
+def downsample_window(df, from_x, to_x, x='Year', y='Value', n_out=MAX_LINE_POINTS):
+    # the rows of a frame sorted by x that are visible in [from_x, to_x], downsampled to at most n_out points
+    df = window_rows(df, from_x, to_x, x)
+    if len(df) <= n_out:
+        return df
+    rows = lttb(df[x].to_numpy(dtype=float), df[y].to_numpy(dtype=float), n_out)
+    assert len(rows) <= n_out, f'{len(rows)} points kept for a limit of {n_out}'
+    return df.iloc[rows]
+
+def quantise(values, digits):
+    # round to significant digits, the results are the doubles closest to short decimals so they serialise compactly
+    values = np.asarray(values, dtype=float)
+    nonzero = np.isfinite(values) & (values != 0)
+    exponent = np.zeros(values.shape, dtype=int)
+    exponent[nonzero] = digits - 1 - np.floor(np.log10(np.abs(values[nonzero]))).astype(int)
+    # multiplying and dividing by exact powers of ten avoids results like 0.30000000000000004
+    scale = 10.0 ** np.abs(exponent)
+    return np.where(exponent >= 0, np.round(values * scale) / scale, np.round(values / scale) * scale)
+
+def json_size(values):
+    # bytes of the values written as a JSON array, NaN is sent as null
+    return len(json.dumps(np.where(np.isnan(values), None, values).tolist()))
+
+def animated_choropleth(df, value, title, label, colorscale, max_bytes=ANIMATION_MAX_BYTES):
+    """
+    Creates a country choropleth with one frame per year, played or scrubbed with a slider in the browser without
+    rerunning the page. Frames only carry the values of their year, the countries and hover names are sent once.
+    Values are rounded to 3 significant digits, or 2 and then every n-th year (always keeping the latest) if the
+    frames would otherwise be larger than max_bytes.
+
+    Args:
+        df (DataFrame): One row per country and year with Entity, Code, Year and the value column.
+        value (str): Column to color the countries by.
+        title (str): Figure title, {year} is replaced by the year shown.
+        label (str): Colorbar title and hover label.
+        colorscale (list): Plotly colorscale.
+        max_bytes (int): Upper limit on the size of the frame values.
+
+    Returns:
+        go.Figure: The animated map, showing the latest year at first.
+    """
+    df = df.dropna(subset=['Code'])
+    table = df.pivot_table(index='Year', columns='Code', values=value, aggfunc='first').sort_index()
+    names = df.drop_duplicates('Code').set_index('Code')['Entity'].reindex(table.columns)
+
+    for digits in (3, 2):
+        z = quantise(table.to_numpy(), digits)
+        size = json_size(z)
+        if size <= max_bytes:
+            break
+    step = max(1, int(np.ceil(size / max_bytes)))
+    rows = np.arange(len(table) - 1, -1, -step)[::-1]
+    years, z = table.index[rows], z[rows]
+
+    fig = go.Figure(
+        go.Choropleth(locations=table.columns,
+            z=z[-1],
+            text=names,
+            coloraxis='coloraxis',
+            hovertemplate='<b>%{text}</b><br>' + label + ': %{z}<extra></extra>')
+    )
+    fig.frames = [go.Frame(name=str(year), data=[go.Choropleth(z=values)], layout=dict(title_text=title.format(year=year)))
+        for year, values in zip(years, z)]
+
+    # a frame is drawn at once when the slider is moved, the play button steps through the years
+    animate = dict(mode='immediate', frame=dict(duration=0, redraw=True), transition=dict(duration=0))
+    fig.update_layout(
+        title_text=title.format(year=years[-1]),
+        coloraxis=dict(colorscale=colorscale, cmin=np.nanmin(z), cmax=np.nanmax(z), colorbar=dict(title=label)),
+        sliders=[dict(active=len(years) - 1,
+            currentvalue=dict(prefix='Year: '),
+            pad=dict(t=30),
+            steps=[dict(method='animate', label=str(year), args=[[str(year)], animate]) for year in years])],
+        updatemenus=[dict(type='buttons',
+            direction='left',
+            x=0,
+            y=0,
+            xanchor='right',
+            yanchor='top',
+            pad=dict(t=40, r=10),
+            buttons=[dict(label='Play', method='animate',
+                    args=[None, dict(animate, frame=dict(duration=200, redraw=True), fromcurrent=True)]),
+                dict(label='Pause', method='animate', args=[[None], animate])])]
+    )
+    return fig
+
+def cached_figure(build):
+    """
+    Caches the figure returned by build, shared by all sessions and keyed by the figure, the arguments passed to
+    build (the widget values the figure depends on) and the data version. Repeat renders skip building the traces.
+    The returned figure is shared and must not be modified, st.plotly_chart only reads it.
+
+    Args:
+        build (function): Builds a plotly figure from hashable widget values.
+
+    Returns:
+        function: build with its figures cached.
+    """
+    # pages all run as __main__, their file tells figures with the same name on two pages apart
+    figure_id = f'{build.__code__.co_filename}:{build.__module__}.{build.__qualname__}'
+
+    @st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+    def get_figure(figure_id, data_version, *args, **kwargs):
+        return build(*args, **kwargs)
+
+    @functools.wraps(build)
+    def cached_build(*args, **kwargs):
+        return get_figure(figure_id, DATA_VERSION, *args, **kwargs)
+
+    return cached_build